@@ -11,6 +11,27 @@
 #include "Components/StaticMeshComponent.h"
 #include "EditorSubsystem.h"
 #include "Subsystems/EditorActorSubsystem.h"
+#include "Algo/BinarySearch.h"
+
+namespace
+{
+    // Tag prefix the MCP server uses to record when a temporary actor expires,
+    // followed by the expiry time in Unix seconds
+    const FString ExpiresTagPrefix = TEXT("mcp_expires_at:");
+
+    bool HasExpired(const AActor* Actor, double ExpiredBefore)
+    {
+        for (const FName& Tag : Actor->Tags)
+        {
+            const FString TagString = Tag.ToString();
+            if (TagString.StartsWith(ExpiresTagPrefix))
+            {
+                return FCString::Atod(*TagString.RightChop(ExpiresTagPrefix.Len())) <= ExpiredBefore;
+            }
+        }
+        return false;
+    }
+}
 
 FUnrealMCPActorCommands::FUnrealMCPActorCommands()
 {
@@ -34,10 +55,18 @@ TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleCommand(const FString& Co
     {
         return HandleDeleteActor(Params);
     }
+    else if (CommandType == TEXT("delete_actors"))
+    {
+        return HandleDeleteActors(Params);
+    }
     else if (CommandType == TEXT("set_actor_transform"))
     {
         return HandleSetActorTransform(Params);
     }
+    else if (CommandType == TEXT("set_actor_transforms"))
+    {
+        return HandleSetActorTransforms(Params);
+    }
     else if (CommandType == TEXT("get_actor_properties"))
     {
         return HandleGetActorProperties(Params);
@@ -48,20 +77,105 @@ TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleCommand(const FString& Co
 
 TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleGetActorsInLevel(const TSharedPtr<FJsonObject>& Params)
 {
+    // Every parameter is optional; with none, every actor is listed in full
+    FString ClassFilter;
+    FString NamePattern;
+    FString Cursor;
+    int32 Limit = 0;
+    TArray<FString> Fields;
+    if (Params.IsValid())
+    {
+        Params->TryGetStringField(TEXT("class"), ClassFilter);
+        Params->TryGetStringField(TEXT("name_pattern"), NamePattern);
+        Params->TryGetStringField(TEXT("cursor"), Cursor);
+        Params->TryGetNumberField(TEXT("limit"), Limit);
+
+        const TArray<TSharedPtr<FJsonValue>>* FieldValues;
+        if (Params->TryGetArrayField(TEXT("fields"), FieldValues))
+        {
+            static const TArray<FString> KnownFields = {
+                TEXT("name"), TEXT("class"), TEXT("location"), TEXT("rotation"), TEXT("scale")
+            };
+            for (const TSharedPtr<FJsonValue>& FieldValue : *FieldValues)
+            {
+                FString Field = FieldValue->AsString();
+                if (!KnownFields.Contains(Field))
+                {
+                    return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unknown actor field: %s"), *Field));
+                }
+                Fields.Add(Field);
+            }
+        }
+    }
+    if (Limit < 0)
+    {
+        return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("'limit' must not be negative"));
+    }
+
     TArray<AActor*> AllActors;
     UGameplayStatics::GetAllActorsOfClass(GWorld, AActor::StaticClass(), AllActors);
     
-    TArray<TSharedPtr<FJsonValue>> ActorArray;
+    // Filter before serializing anything, keeping each name for sorting
+    TArray<TPair<FString, AActor*>> MatchingActors;
+    MatchingActors.Reserve(AllActors.Num());
     for (AActor* Actor : AllActors)
     {
-        if (Actor)
+        if (!Actor)
         {
-            ActorArray.Add(FUnrealMCPCommonUtils::ActorToJson(Actor));
+            continue;
+        }
+        if (!ClassFilter.IsEmpty() && !Actor->GetClass()->GetName().Equals(ClassFilter, ESearchCase::IgnoreCase))
+        {
+            continue;
+        }
+        FString ActorName = Actor->GetName();
+        if (!NamePattern.IsEmpty() && !ActorName.Contains(NamePattern))
+        {
+            continue;
+        }
+        MatchingActors.Emplace(MoveTemp(ActorName), Actor);
+    }
+
+    // Pages are in (case-insensitive) name order and the cursor is the last name
+    // returned, so actors added or removed between pages don't shift the others
+    int32 Start = 0;
+    int32 End = MatchingActors.Num();
+    if (Limit > 0 || !Cursor.IsEmpty())
+    {
+        MatchingActors.Sort([](const TPair<FString, AActor*>& A, const TPair<FString, AActor*>& B)
+        {
+            return A.Key < B.Key;
+        });
+        if (!Cursor.IsEmpty())
+        {
+            Start = Algo::UpperBoundBy(MatchingActors, Cursor, [](const TPair<FString, AActor*>& Entry)
+            {
+                return Entry.Key;
+            });
+        }
+        if (Limit > 0)
+        {
+            End = FMath::Min(Start + Limit, End);
         }
     }
     
+    TArray<TSharedPtr<FJsonValue>> ActorArray;
+    ActorArray.Reserve(End - Start);
+    for (int32 Index = Start; Index < End; ++Index)
+    {
+        AActor* Actor = MatchingActors[Index].Value;
+        ActorArray.Add(Fields.Num() > 0
+            ? FUnrealMCPCommonUtils::ActorToJson(Actor, Fields)
+            : FUnrealMCPCommonUtils::ActorToJson(Actor));
+    }
+    
     TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
     ResultObj->SetArrayField(TEXT("actors"), ActorArray);
+    ResultObj->SetNumberField(TEXT("total"), MatchingActors.Num());
+    if (End < MatchingActors.Num())
+    {
+        ResultObj->SetStringField(TEXT("next_cursor"), MatchingActors[End - 1].Key);
+    }
     
     return ResultObj;
 }
@@ -135,12 +249,14 @@ TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleCreateActor(const TShared
         return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
     }
 
-    // Check if an actor with this name already exists
-    TArray<AActor*> AllActors;
-    UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
-    for (AActor* Actor : AllActors)
-    {
-        if (Actor && Actor->GetName() == ActorName)
+    // Check if an actor with this name already exists in any loaded level, as
+    // actors are found by name across the world. A hashed name lookup per level
+    // rather than a scan of every actor, so populating a level stays linear in
+    // the number of actors created
+    const FName NewName(*ActorName);
+    for (ULevel* Level : World->GetLevels())
+    {
+        if (Level && FindObjectFast<AActor>(Level, NewName))
         {
             return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
         }
@@ -180,6 +296,7 @@ TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleCreateActor(const TShared
         FTransform Transform = NewActor->GetTransform();
         Transform.SetScale3D(Scale);
         NewActor->SetActorTransform(Transform);
+        FUnrealMCPCommonUtils::AddActorTagsFromJson(NewActor, Params);
 
         // Return the created actor's details
         return FUnrealMCPCommonUtils::ActorToJsonObject(NewActor, true);
@@ -218,6 +335,74 @@ TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleDeleteActor(const TShared
     return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor not found: %s"), *ActorName));
 }
 
+TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleDeleteActors(const TSharedPtr<FJsonObject>& Params)
+{
+    // Actors are deleted if they match every filter given: a list of names, a
+    // name substring (case-insensitive, like find_actors_by_name) and an actor
+    // tag. With expired_before, only actors whose expiry tag holds a time at
+    // or before it match.
+    TSet<FString> Names;
+    const TArray<TSharedPtr<FJsonValue>>* NameValues = nullptr;
+    if (Params->TryGetArrayField(TEXT("names"), NameValues))
+    {
+        for (const TSharedPtr<FJsonValue>& NameValue : *NameValues)
+        {
+            Names.Add(NameValue->AsString());
+        }
+    }
+    FString Pattern;
+    Params->TryGetStringField(TEXT("pattern"), Pattern);
+    FString Tag;
+    Params->TryGetStringField(TEXT("tag"), Tag);
+    double ExpiredBefore = 0.0;
+    const bool bOnlyExpired = Params->TryGetNumberField(TEXT("expired_before"), ExpiredBefore);
+    int32 Limit = 0;
+    Params->TryGetNumberField(TEXT("limit"), Limit);
+
+    if (!NameValues && Pattern.IsEmpty() && Tag.IsEmpty())
+    {
+        return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Give 'names', 'pattern' or 'tag' to choose the actors to delete"));
+    }
+    if (Limit < 0)
+    {
+        return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("'limit' must not be negative"));
+    }
+
+    const FName TagName(*Tag);
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(GWorld, AActor::StaticClass(), AllActors);
+
+    TArray<AActor*> MatchingActors;
+    for (AActor* Actor : AllActors)
+    {
+        if (!Actor
+            || (NameValues && !Names.Contains(Actor->GetName()))
+            || (!Pattern.IsEmpty() && !Actor->GetName().Contains(Pattern))
+            || (!Tag.IsEmpty() && !Actor->ActorHasTag(TagName))
+            || (bOnlyExpired && !HasExpired(Actor, ExpiredBefore)))
+        {
+            continue;
+        }
+        MatchingActors.Add(Actor);
+    }
+
+    // A limit caps how long one call holds the game thread; the rest are
+    // reported as remaining for a later call
+    const int32 DeleteCount = Limit > 0 ? FMath::Min(Limit, MatchingActors.Num()) : MatchingActors.Num();
+    TArray<TSharedPtr<FJsonValue>> DeletedNames;
+    DeletedNames.Reserve(DeleteCount);
+    for (int32 Index = 0; Index < DeleteCount; ++Index)
+    {
+        DeletedNames.Add(MakeShared<FJsonValueString>(MatchingActors[Index]->GetName()));
+        MatchingActors[Index]->Destroy();
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetArrayField(TEXT("deleted"), DeletedNames);
+    ResultObj->SetNumberField(TEXT("remaining"), MatchingActors.Num() - DeleteCount);
+    return ResultObj;
+}
+
 TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleSetActorTransform(const TSharedPtr<FJsonObject>& Params)
 {
     // Get actor name
@@ -269,6 +454,93 @@ TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleSetActorTransform(const T
     return FUnrealMCPCommonUtils::ActorToJsonObject(TargetActor, true);
 }
 
+TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleSetActorTransforms(const TSharedPtr<FJsonObject>& Params)
+{
+    // Names, plus optional packed [x, y, z, x, y, z, ...] arrays holding one
+    // vector per name for each component being set
+    const TArray<TSharedPtr<FJsonValue>>* NameValues;
+    if (!Params->TryGetArrayField(TEXT("names"), NameValues))
+    {
+        return FUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'names' parameter"));
+    }
+    const int32 Count = NameValues->Num();
+
+    const TCHAR* PackedFields[] = { TEXT("locations"), TEXT("rotations"), TEXT("scales") };
+    const TArray<TSharedPtr<FJsonValue>>* PackedValues[] = { nullptr, nullptr, nullptr };
+    for (int32 Component = 0; Component < 3; ++Component)
+    {
+        if (Params->TryGetArrayField(PackedFields[Component], PackedValues[Component]) && PackedValues[Component]->Num() != Count * 3)
+        {
+            return FUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(
+                TEXT("'%s' must hold 3 values per name (%d), not %d"), PackedFields[Component], Count * 3, PackedValues[Component]->Num()));
+        }
+    }
+    const TArray<TSharedPtr<FJsonValue>>* Locations = PackedValues[0];
+    const TArray<TSharedPtr<FJsonValue>>* Rotations = PackedValues[1];
+    const TArray<TSharedPtr<FJsonValue>>* Scales = PackedValues[2];
+
+    // Look every actor up in one pass over the level rather than one pass per name
+    TSet<FString> Wanted;
+    for (const TSharedPtr<FJsonValue>& NameValue : *NameValues)
+    {
+        Wanted.Add(NameValue->AsString());
+    }
+    TMap<FString, AActor*> ActorsByName;
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(GWorld, AActor::StaticClass(), AllActors);
+    for (AActor* Actor : AllActors)
+    {
+        if (Actor && Wanted.Contains(Actor->GetName()))
+        {
+            ActorsByName.Add(Actor->GetName(), Actor);
+        }
+    }
+
+    auto PackedVector = [](const TArray<TSharedPtr<FJsonValue>>& Values, int32 Index)
+    {
+        return FVector(Values[Index * 3]->AsNumber(), Values[Index * 3 + 1]->AsNumber(), Values[Index * 3 + 2]->AsNumber());
+    };
+
+    // One entry per name, in order: the actor's new state, or its name and an error
+    TArray<TSharedPtr<FJsonValue>> Results;
+    Results.Reserve(Count);
+    for (int32 Index = 0; Index < Count; ++Index)
+    {
+        FString ActorName = (*NameValues)[Index]->AsString();
+        AActor** Found = ActorsByName.Find(ActorName);
+        if (!Found)
+        {
+            TSharedPtr<FJsonObject> ErrorObj = MakeShared<FJsonObject>();
+            ErrorObj->SetStringField(TEXT("name"), ActorName);
+            ErrorObj->SetStringField(TEXT("error"), FString::Printf(TEXT("Actor not found: %s"), *ActorName));
+            Results.Add(MakeShared<FJsonValueObject>(ErrorObj));
+            continue;
+        }
+
+        AActor* TargetActor = *Found;
+        FTransform NewTransform = TargetActor->GetTransform();
+        if (Locations)
+        {
+            NewTransform.SetLocation(PackedVector(*Locations, Index));
+        }
+        if (Rotations)
+        {
+            FVector Rotation = PackedVector(*Rotations, Index);
+            NewTransform.SetRotation(FQuat(FRotator(Rotation.X, Rotation.Y, Rotation.Z)));
+        }
+        if (Scales)
+        {
+            NewTransform.SetScale3D(PackedVector(*Scales, Index));
+        }
+        TargetActor->SetActorTransform(NewTransform);
+        Results.Add(FUnrealMCPCommonUtils::ActorToJson(TargetActor));
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetArrayField(TEXT("results"), Results);
+    return ResultObj;
+}
+
 TSharedPtr<FJsonObject> FUnrealMCPActorCommands::HandleGetActorProperties(const TSharedPtr<FJsonObject>& Params)
 {
     // Get actor name
@@ -513,6 +513,7 @@ TSharedPtr<FJsonObject> FUnrealMCPBlueprintCommands::HandleSpawnBlueprintActor(c
     AActor* NewActor = World->SpawnActor<AActor>(Blueprint->GeneratedClass, SpawnTransform);
     if (NewActor)
     {
+        FUnrealMCPCommonUtils::AddActorTagsFromJson(NewActor, Params);
         return FUnrealMCPCommonUtils::ActorToJsonObject(NewActor, true);
     }
 
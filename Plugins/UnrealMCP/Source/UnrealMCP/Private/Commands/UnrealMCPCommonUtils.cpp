@@ -456,6 +456,57 @@ TSharedPtr<FJsonValue> FUnrealMCPCommonUtils::ActorToJson(AActor* Actor)
     return MakeShared<FJsonValueObject>(ActorObject);
 }
 
+TSharedPtr<FJsonValue> FUnrealMCPCommonUtils::ActorToJson(AActor* Actor, const TArray<FString>& Fields)
+{
+    if (!Actor)
+    {
+        return MakeShared<FJsonValueNull>();
+    }
+    
+    // Only the requested fields, in the same format as the full listing
+    TSharedPtr<FJsonObject> ActorObject = MakeShared<FJsonObject>();
+    for (const FString& Field : Fields)
+    {
+        if (Field == TEXT("name"))
+        {
+            ActorObject->SetStringField(TEXT("name"), Actor->GetName());
+        }
+        else if (Field == TEXT("class"))
+        {
+            ActorObject->SetStringField(TEXT("class"), Actor->GetClass()->GetName());
+        }
+        else if (Field == TEXT("location"))
+        {
+            FVector Location = Actor->GetActorLocation();
+            TArray<TSharedPtr<FJsonValue>> LocationArray;
+            LocationArray.Add(MakeShared<FJsonValueNumber>(Location.X));
+            LocationArray.Add(MakeShared<FJsonValueNumber>(Location.Y));
+            LocationArray.Add(MakeShared<FJsonValueNumber>(Location.Z));
+            ActorObject->SetArrayField(TEXT("location"), LocationArray);
+        }
+        else if (Field == TEXT("rotation"))
+        {
+            FRotator Rotation = Actor->GetActorRotation();
+            TArray<TSharedPtr<FJsonValue>> RotationArray;
+            RotationArray.Add(MakeShared<FJsonValueNumber>(Rotation.Pitch));
+            RotationArray.Add(MakeShared<FJsonValueNumber>(Rotation.Yaw));
+            RotationArray.Add(MakeShared<FJsonValueNumber>(Rotation.Roll));
+            ActorObject->SetArrayField(TEXT("rotation"), RotationArray);
+        }
+        else if (Field == TEXT("scale"))
+        {
+            FVector Scale = Actor->GetActorScale3D();
+            TArray<TSharedPtr<FJsonValue>> ScaleArray;
+            ScaleArray.Add(MakeShared<FJsonValueNumber>(Scale.X));
+            ScaleArray.Add(MakeShared<FJsonValueNumber>(Scale.Y));
+            ScaleArray.Add(MakeShared<FJsonValueNumber>(Scale.Z));
+            ActorObject->SetArrayField(TEXT("scale"), ScaleArray);
+        }
+    }
+    
+    return MakeShared<FJsonValueObject>(ActorObject);
+}
+
 TSharedPtr<FJsonObject> FUnrealMCPCommonUtils::ActorToJsonObject(AActor* Actor, bool bDetailed)
 {
     if (!Actor)
@@ -491,6 +542,21 @@ TSharedPtr<FJsonObject> FUnrealMCPCommonUtils::ActorToJsonObject(AActor* Actor,
     return ActorObject;
 }
 
+void FUnrealMCPCommonUtils::AddActorTagsFromJson(AActor* Actor, const TSharedPtr<FJsonObject>& JsonObject)
+{
+    // Optional "tags" array of strings, added to the actor's Tags
+    const TArray<TSharedPtr<FJsonValue>>* TagValues;
+    if (!Actor || !JsonObject->TryGetArrayField(TEXT("tags"), TagValues))
+    {
+        return;
+    }
+
+    for (const TSharedPtr<FJsonValue>& TagValue : *TagValues)
+    {
+        Actor->Tags.AddUnique(FName(*TagValue->AsString()));
+    }
+}
+
 UK2Node_Event* FUnrealMCPCommonUtils::FindExistingEventNode(UEdGraph* Graph, const FString& EventName)
 {
     if (!Graph)
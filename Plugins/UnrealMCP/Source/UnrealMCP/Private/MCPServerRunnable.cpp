@@ -7,6 +7,7 @@
 #include "Dom/JsonValue.h"
 #include "Serialization/JsonSerializer.h"
 #include "Serialization/JsonReader.h"
+#include "Serialization/JsonWriter.h"
 #include "JsonObjectConverter.h"
 #include "Misc/ScopeLock.h"
 #include "HAL/PlatformTime.h"
@@ -17,6 +18,12 @@ DEFINE_LOG_CATEGORY_STATIC(LogMCP, Log, All);
 // Buffer size for receiving data
 const int32 BufferSize = 8192;
 
+// Length prefix used once a client negotiates framed messages
+const int32 MCPFrameHeaderSize = 4;
+
+// Largest command payload accepted; a longer length means a corrupt or hostile header
+const uint32 MCPMaxFrameSize = 64 * 1024 * 1024;
+
 FMCPServerRunnable::FMCPServerRunnable(UUnrealMCPBridge* InBridge, TSharedPtr<FSocket> InListenerSocket)
     : Bridge(InBridge)
     , ListenerSocket(InListenerSocket)
@@ -41,118 +48,33 @@ uint32 FMCPServerRunnable::Run()
     
     while (bRunning)
     {
-        // UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Waiting for client connection..."));
-        
-        bool bPending = false;
-        if (ListenerSocket->HasPendingConnection(bPending) && bPending)
+        AcceptPendingClients();
+
+        // Serve every connected client. Clients keep their socket open across
+        // commands, so a connection is only dropped when the client closes it.
+        bool bDidWork = false;
+        for (int32 Index = Clients.Num() - 1; Index >= 0; --Index)
         {
-            UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client connection pending, accepting..."));
-            
-            ClientSocket = MakeShareable(ListenerSocket->Accept(TEXT("MCPClient")));
-            if (ClientSocket.IsValid())
-            {
-                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client connection accepted"));
-                
-                // Set socket options to improve connection stability
-                ClientSocket->SetNoDelay(true);
-                int32 SocketBufferSize = 65536;  // 64KB buffer
-                ClientSocket->SetSendBufferSize(SocketBufferSize, SocketBufferSize);
-                ClientSocket->SetReceiveBufferSize(SocketBufferSize, SocketBufferSize);
-                
-                uint8 Buffer[8192];
-                while (bRunning)
-                {
-                    int32 BytesRead = 0;
-                    if (ClientSocket->Recv(Buffer, sizeof(Buffer), BytesRead))
-                    {
-                        if (BytesRead == 0)
-                        {
-                            UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client disconnected (zero bytes)"));
-                            break;
-                        }
-
-                        // Convert received data to string
-                        Buffer[BytesRead] = '\0';
-                        FString ReceivedText = UTF8_TO_TCHAR(Buffer);
-                        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
-
-                        // Parse JSON
-                        TSharedPtr<FJsonObject> JsonObject;
-                        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
-                        
-                        if (FJsonSerializer::Deserialize(Reader, JsonObject))
-                        {
-                            // Get command type
-                            FString CommandType;
-                            if (JsonObject->TryGetStringField(TEXT("type"), CommandType))
-                            {
-                                // Execute command
-                                FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
-                                
-                                // Log response for debugging
-                                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
-                                
-                                // Send response
-                                int32 BytesSent = 0;
-                                if (!ClientSocket->Send((uint8*)TCHAR_TO_UTF8(*Response), Response.Len(), BytesSent))
-                                {
-                                    UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to send response"));
-                                }
-                                else {
-                                    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), BytesSent);
-                                }
-                            }
-                            else
-                            {
-                                UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
-                            }
-                        }
-                        else
-                        {
-                            UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *ReceivedText);
-                        }
-                    }
-                    else
-                    {
-                        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                        // Don't break the connection for WouldBlock error, which is normal for non-blocking sockets
-                        bool bShouldBreak = true;
-                        
-                        // Check for "would block" error which isn't a real error for non-blocking sockets
-                        if (LastError == SE_EWOULDBLOCK) 
-                        {
-                            UE_LOG(LogMCP, Verbose, TEXT("MCPServerRunnable: Socket would block, continuing..."));
-                            bShouldBreak = false;
-                            // Small sleep to prevent tight loop when no data
-                            FPlatformProcess::Sleep(0.01f);
-                        }
-                        // Check for other transient errors we might want to tolerate
-                        else if (LastError == SE_EINTR) // Interrupted system call
-                        {
-                            UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Socket read interrupted, continuing..."));
-                            bShouldBreak = false;
-                        }
-                        else 
-                        {
-                            UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
-                        }
-                        
-                        if (bShouldBreak)
-                        {
-                            break;
-                        }
-                    }
-                }
-            }
-            else
+            if (!HandleClientConnection(*Clients[Index], bDidWork))
             {
-                UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to accept client connection"));
+                Clients[Index]->Socket->Close();
+                Clients.RemoveAt(Index);
+                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client removed, %d remaining"), Clients.Num());
             }
         }
         
         // Small sleep to prevent tight loop
-        FPlatformProcess::Sleep(0.1f);
+        if (!bDidWork)
+        {
+            FPlatformProcess::Sleep(Clients.Num() > 0 ? 0.001f : 0.1f);
+        }
     }
+
+    for (const TSharedPtr<FMCPClientConnection>& Client : Clients)
+    {
+        Client->Socket->Close();
+    }
+    Clients.Empty();
     
     UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Server thread stopping"));
     return 0;
@@ -167,114 +89,199 @@ void FMCPServerRunnable::Exit()
 {
 }
 
-void FMCPServerRunnable::HandleClientConnection(TSharedPtr<FSocket> InClientSocket)
+void FMCPServerRunnable::AcceptPendingClients()
 {
-    if (!InClientSocket.IsValid())
+    bool bPending = false;
+    while (ListenerSocket->HasPendingConnection(bPending) && bPending)
     {
-        UE_LOG(LogMCP, Error, TEXT("MCPServerRunnable: Invalid client socket passed to HandleClientConnection"));
-        return;
+        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client connection pending, accepting..."));
+        
+        TSharedPtr<FSocket> ClientSocket = MakeShareable(ListenerSocket->Accept(TEXT("MCPClient")));
+        if (!ClientSocket.IsValid())
+        {
+            UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to accept client connection"));
+            return;
+        }
+
+        // Set socket options to improve connection stability
+        ClientSocket->SetNonBlocking(true);
+        ClientSocket->SetNoDelay(true);
+        int32 SocketBufferSize = 65536;  // 64KB buffer
+        ClientSocket->SetSendBufferSize(SocketBufferSize, SocketBufferSize);
+        ClientSocket->SetReceiveBufferSize(SocketBufferSize, SocketBufferSize);
+
+        Clients.Add(MakeShared<FMCPClientConnection>(ClientSocket));
+        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client connection accepted, %d connected"), Clients.Num());
     }
+}
 
-    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Starting to handle client connection"));
-    
-    // Set socket options for better connection stability
-    InClientSocket->SetNonBlocking(false);
-    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Set socket to blocking mode"));
-    
-    // Properly read full message with timeout
-    const int32 MaxBufferSize = 4096;
-    uint8 Buffer[MaxBufferSize];
-    FString MessageBuffer;
-    
-    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Starting message receive loop"));
-    
-    while (bRunning && InClientSocket.IsValid())
+bool FMCPServerRunnable::HandleClientConnection(FMCPClientConnection& Client, bool& bOutDidWork)
+{
+    uint8 Buffer[BufferSize];
+    uint32 PendingDataSize = 0;
+
+    // Readable with nothing pending means the client closed the connection
+    if (!Client.Socket->HasPendingData(PendingDataSize) &&
+        Client.Socket->Wait(ESocketWaitConditions::WaitForRead, FTimespan::Zero()))
+    {
+        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client disconnected"));
+        return false;
+    }
+
+    while (bRunning && Client.Socket->HasPendingData(PendingDataSize))
     {
-        // Log socket state
-        bool bIsConnected = InClientSocket->GetConnectionState() == SCS_Connected;
-        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Socket state - Connected: %s"), 
-               bIsConnected ? TEXT("true") : TEXT("false"));
-        
-        // Log pending data status before receive
-        uint32 PendingDataSize = 0;
-        bool HasPendingData = InClientSocket->HasPendingData(PendingDataSize);
-        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Before Recv - HasPendingData=%s, Size=%d"), 
-               HasPendingData ? TEXT("true") : TEXT("false"), PendingDataSize);
-        
-        // Try to receive data with timeout
         int32 BytesRead = 0;
-        bool bReadSuccess = false;
-        
-        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Attempting to receive data..."));
-        bReadSuccess = InClientSocket->Recv(Buffer, MaxBufferSize, BytesRead, ESocketReceiveFlags::None);
-        
-        UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Recv attempt complete - Success=%s, BytesRead=%d"), 
-               bReadSuccess ? TEXT("true") : TEXT("false"), BytesRead);
-        
-        if (BytesRead > 0)
+        if (!Client.Socket->Recv(Buffer, BufferSize, BytesRead))
+        {
+            int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+            // Would block and interrupted reads are normal for non-blocking sockets
+            if (LastError == SE_EWOULDBLOCK || LastError == SE_EINTR)
+            {
+                break;
+            }
+            UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
+            return false;
+        }
+        if (BytesRead == 0)
+        {
+            break;
+        }
+
+        Client.ReceiveBuffer.Append(Buffer, BytesRead);
+        bOutDidWork = true;
+    }
+
+    // Queue every complete message. Cancellations take effect right away, so
+    // commands still waiting behind a slow one can be dropped before they run.
+    FString Message;
+    while (bRunning && ExtractMessage(Client, Message))
+    {
+        QueueMessage(Client, Message);
+        bOutDidWork = true;
+    }
+
+    // The stream can't be resynchronized after a bad frame header
+    if (Client.bBadFrame)
+    {
+        UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Frame length over %u bytes, dropping client"), MCPMaxFrameSize);
+        SendResponse(Client, FString::Printf(TEXT("{\"status\":\"error\",\"error\":\"Frame exceeds the %u byte limit\"}"), MCPMaxFrameSize));
+        return false;
+    }
+
+    // Execute one command per pass so cancellations that arrive meanwhile are seen
+    if (bRunning && Client.PendingCommands.Num() > 0)
+    {
+        const FMCPQueuedCommand Command = Client.PendingCommands[0];
+        Client.PendingCommands.RemoveAt(0);
+        ProcessCommand(Client, Command);
+        bOutDidWork = true;
+    }
+
+    return true;
+}
+
+bool FMCPServerRunnable::ExtractMessage(FMCPClientConnection& Client, FString& OutMessage)
+{
+    int32 HeaderSize = 0;
+    int32 MessageLength = INDEX_NONE;
+
+    if (Client.bFramed)
+    {
+        // 4-byte big-endian payload length followed by the payload
+        if (Client.ReceiveBuffer.Num() < MCPFrameHeaderSize)
+        {
+            return false;
+        }
+        const uint8* Header = Client.ReceiveBuffer.GetData();
+        const uint32 PayloadLength = ((uint32)Header[0] << 24) | ((uint32)Header[1] << 16) | ((uint32)Header[2] << 8) | (uint32)Header[3];
+        if (PayloadLength > MCPMaxFrameSize)
+        {
+            Client.bBadFrame = true;
+            return false;
+        }
+        if (Client.ReceiveBuffer.Num() - MCPFrameHeaderSize < (int64)PayloadLength)
+        {
+            return false;
+        }
+        HeaderSize = MCPFrameHeaderSize;
+        MessageLength = (int32)PayloadLength;
+    }
+    else
+    {
+        MessageLength = FindMessageEnd(Client);
+        if (MessageLength == INDEX_NONE)
+        {
+            return false;
+        }
+    }
+
+    FUTF8ToTCHAR Converter(reinterpret_cast<const ANSICHAR*>(Client.ReceiveBuffer.GetData() + HeaderSize), MessageLength);
+    OutMessage = FString(Converter.Length(), Converter.Get());
+    Client.ReceiveBuffer.RemoveAt(0, HeaderSize + MessageLength, false);
+    Client.ResetScan();
+    return true;
+}
+
+int32 FMCPServerRunnable::FindMessageEnd(FMCPClientConnection& Client)
+{
+    // Drop whitespace or stray bytes between messages
+    if (Client.ScanOffset == 0)
+    {
+        int32 Start = 0;
+        while (Start < Client.ReceiveBuffer.Num() && Client.ReceiveBuffer[Start] != '{')
+        {
+            ++Start;
+        }
+        if (Start > 0)
         {
-            // Log raw data for debugging
-            FString HexData;
-            for (int32 i = 0; i < FMath::Min(BytesRead, 50); ++i)
+            Client.ReceiveBuffer.RemoveAt(0, Start, false);
+        }
+    }
+
+    // Structural JSON characters are ASCII, so scanning raw UTF-8 bytes is safe.
+    // Scan state is kept on the client so each byte is only visited once.
+    const uint8* Data = Client.ReceiveBuffer.GetData();
+    const int32 Num = Client.ReceiveBuffer.Num();
+    for (; Client.ScanOffset < Num; ++Client.ScanOffset)
+    {
+        const uint8 Char = Data[Client.ScanOffset];
+        if (Client.bInString)
+        {
+            if (Client.bEscaped)
             {
-                HexData += FString::Printf(TEXT("%02X "), Buffer[i]);
+                Client.bEscaped = false;
             }
-            UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Raw data (first 50 bytes hex): %s%s"), 
-                   *HexData, BytesRead > 50 ? TEXT("...") : TEXT(""));
-            
-            // Convert and log received data
-            Buffer[BytesRead] = 0; // Null terminate
-            FString ReceivedData = UTF8_TO_TCHAR(Buffer);
-            UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Received data as string: '%s'"), *ReceivedData);
-            
-            // Append to message buffer
-            MessageBuffer.Append(ReceivedData);
-            
-            // Process complete messages (messages are terminated with newline)
-            if (MessageBuffer.Contains(TEXT("\n")))
+            else if (Char == '\\')
             {
-                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Newline detected in buffer, processing messages"));
-                
-                TArray<FString> Messages;
-                MessageBuffer.ParseIntoArray(Messages, TEXT("\n"), true);
-                
-                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Found %d message(s) in buffer"), Messages.Num());
-                
-                // Process all complete messages
-                for (int32 i = 0; i < Messages.Num() - 1; ++i)
-                {
-                    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Processing message %d: '%s'"), 
-                           i + 1, *Messages[i]);
-                    ProcessMessage(InClientSocket, Messages[i]);
-                }
-                
-                // Keep any incomplete message in the buffer
-                MessageBuffer = Messages.Last();
-                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Remaining buffer after processing: %s"), 
-                       *MessageBuffer);
+                Client.bEscaped = true;
             }
-            else
+            else if (Char == '"')
             {
-                UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: No complete message yet (no newline detected)"));
+                Client.bInString = false;
             }
         }
-        else if (!bReadSuccess)
+        else if (Char == '"')
         {
-            UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Connection closed or error occurred - Last error: %d"), 
-                   (int32)ISocketSubsystem::Get()->GetLastErrorCode());
-            break;
+            Client.bInString = true;
+        }
+        else if (Char == '{' || Char == '[')
+        {
+            ++Client.Depth;
+        }
+        else if (Char == '}' || Char == ']')
+        {
+            if (--Client.Depth == 0)
+            {
+                return Client.ScanOffset + 1;
+            }
         }
-        
-        // Small sleep to prevent tight loop
-        FPlatformProcess::Sleep(0.01f);
     }
-    
-    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Exited message receive loop"));
+    return INDEX_NONE;
 }
 
-void FMCPServerRunnable::ProcessMessage(TSharedPtr<FSocket> Client, const FString& Message)
+void FMCPServerRunnable::QueueMessage(FMCPClientConnection& Client, const FString& Message)
 {
-    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Processing message: %s"), *Message);
+    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Received: %s"), *Message);
     
     // Parse message as JSON
     TSharedPtr<FJsonObject> JsonMessage;
@@ -282,43 +289,176 @@ void FMCPServerRunnable::ProcessMessage(TSharedPtr<FSocket> Client, const FStrin
     
     if (!FJsonSerializer::Deserialize(Reader, JsonMessage) || !JsonMessage.IsValid())
     {
-        UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to parse message as JSON"));
+        UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *Message);
         return;
     }
     
-    // Extract command type and parameters using MCP protocol format
-    FString CommandType;
-    TSharedPtr<FJsonObject> Params = MakeShareable(new FJsonObject());
+    FMCPQueuedCommand Command;
     
-    if (!JsonMessage->TryGetStringField(TEXT("command"), CommandType))
+    // Optional request id, echoed back so pipelining clients can match responses
+    Command.bHasRequestId = JsonMessage->TryGetNumberField(TEXT("id"), Command.RequestId);
+    
+    // Get command type
+    if (!JsonMessage->TryGetStringField(TEXT("type"), Command.CommandType))
     {
-        UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Message missing 'command' field"));
+        UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
+        if (Command.bHasRequestId)
+        {
+            SendResponse(Client, AddRequestId(TEXT("{\"status\":\"error\",\"error\":\"Missing 'type' field in command\"}"), Command.RequestId));
+        }
         return;
     }
     
-    // Parameters are optional in MCP protocol
-    if (JsonMessage->HasField(TEXT("params")))
+    // Parameters are optional
+    Command.Params = MakeShareable(new FJsonObject());
+    const TSharedPtr<FJsonObject>* ParamsObject = nullptr;
+    if (JsonMessage->TryGetObjectField(TEXT("params"), ParamsObject))
     {
-        TSharedPtr<FJsonValue> ParamsValue = JsonMessage->TryGetField(TEXT("params"));
-        if (ParamsValue.IsValid() && ParamsValue->Type == EJson::Object)
-        {
-            Params = ParamsValue->AsObject();
-        }
+        Command.Params = *ParamsObject;
     }
     
-    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Executing command: %s"), *CommandType);
+    // Protocol commands are handled per connection rather than by the bridge.
+    // Negotiation must complete before the next message is extracted, since it changes the framing.
+    if (Command.CommandType == TEXT("negotiate_protocol"))
+    {
+        HandleNegotiateProtocol(Client, Command.Params);
+        return;
+    }
+    if (Command.CommandType == TEXT("cancel"))
+    {
+        HandleCancel(Client, Command.Params);
+        return;
+    }
     
+    Client.PendingCommands.Add(Command);
+}
+
+void FMCPServerRunnable::ProcessCommand(FMCPClientConnection& Client, const FMCPQueuedCommand& Command)
+{
     // Execute command
-    FString Response = Bridge->ExecuteCommand(CommandType, Params);
-    
-    // Send response with newline terminator
-    Response += TEXT("\n");
-    int32 BytesSent = 0;
+    FString Response = Bridge->ExecuteCommand(Command.CommandType, Command.Params);
+    if (Command.bHasRequestId)
+    {
+        Response = AddRequestId(Response, Command.RequestId);
+    }
     
+    // Log response for debugging
     UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
     
-    if (!Client->Send((uint8*)TCHAR_TO_UTF8(*Response), Response.Len(), BytesSent))
+    SendResponse(Client, Response);
+}
+
+FString FMCPServerRunnable::AddRequestId(const FString& Response, int64 RequestId)
+{
+    // Responses are always JSON objects, so splice the id in after the opening brace
+    const FString IdField = FString::Printf(TEXT("\"id\":%lld"), RequestId);
+    if (Response.Len() <= 2)
+    {
+        return FString::Printf(TEXT("{%s}"), *IdField);
+    }
+    return FString::Printf(TEXT("{%s,%s"), *IdField, *Response.RightChop(1));
+}
+
+void FMCPServerRunnable::HandleNegotiateProtocol(FMCPClientConnection& Client, const TSharedPtr<FJsonObject>& Params)
+{
+    FString RequestedFraming;
+    Params->TryGetStringField(TEXT("framing"), RequestedFraming);
+    const bool bUseFraming = RequestedFraming == TEXT("length_prefixed");
+
+    // Request ids are always echoed and queued commands can always be
+    // cancelled; these tell the client it may rely on that
+    bool bRequestedPipelining = false;
+    Params->TryGetBoolField(TEXT("pipelining"), bRequestedPipelining);
+    bool bRequestedCancellation = false;
+    Params->TryGetBoolField(TEXT("cancellation"), bRequestedCancellation);
+
+    TSharedPtr<FJsonObject> ResultJson = MakeShared<FJsonObject>();
+    ResultJson->SetStringField(TEXT("framing"), bUseFraming ? TEXT("length_prefixed") : TEXT("legacy"));
+    ResultJson->SetBoolField(TEXT("pipelining"), bRequestedPipelining);
+    ResultJson->SetBoolField(TEXT("cancellation"), bRequestedCancellation);
+
+    TSharedPtr<FJsonObject> ResponseJson = MakeShared<FJsonObject>();
+    ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+    ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+
+    FString Response;
+    TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&Response);
+    FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
+
+    // The reply is sent in the old format; framing starts with the next message
+    SendResponse(Client, Response);
+    Client.bFramed = bUseFraming;
+
+    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Client negotiated %s framing"), bUseFraming ? TEXT("length-prefixed") : TEXT("legacy"));
+}
+
+void FMCPServerRunnable::HandleCancel(FMCPClientConnection& Client, const TSharedPtr<FJsonObject>& Params)
+{
+    int64 CancelledId = 0;
+    if (!Params->TryGetNumberField(TEXT("id"), CancelledId))
+    {
+        UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Cancel without an 'id' parameter"));
+        return;
+    }
+
+    const int32 Index = Client.PendingCommands.IndexOfByPredicate([CancelledId](const FMCPQueuedCommand& Command)
+    {
+        return Command.bHasRequestId && Command.RequestId == CancelledId;
+    });
+    if (Index == INDEX_NONE)
+    {
+        // Already executed, or never received
+        UE_LOG(LogMCP, Verbose, TEXT("MCPServerRunnable: Nothing queued to cancel for request %lld"), CancelledId);
+        return;
+    }
+
+    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Cancelled queued %s (request %lld)"), *Client.PendingCommands[Index].CommandType, CancelledId);
+    Client.PendingCommands.RemoveAt(Index);
+
+    // The client still expects one response per request id
+    SendResponse(Client, AddRequestId(TEXT("{\"status\":\"error\",\"error\":\"Cancelled before execution\"}"), CancelledId));
+}
+
+bool FMCPServerRunnable::SendResponse(FMCPClientConnection& Client, const FString& Response)
+{
+    FTCHARToUTF8 Utf8Response(*Response);
+    const int32 PayloadLength = Utf8Response.Length();
+
+    TArray<uint8> Packet;
+    if (Client.bFramed)
     {
-        UE_LOG(LogMCP, Error, TEXT("MCPServerRunnable: Failed to send response"));
+        Packet.Reserve(MCPFrameHeaderSize + PayloadLength);
+        Packet.Add((uint8)((PayloadLength >> 24) & 0xFF));
+        Packet.Add((uint8)((PayloadLength >> 16) & 0xFF));
+        Packet.Add((uint8)((PayloadLength >> 8) & 0xFF));
+        Packet.Add((uint8)(PayloadLength & 0xFF));
     }
-} 
\ No newline at end of file
+    Packet.Append(reinterpret_cast<const uint8*>(Utf8Response.Get()), PayloadLength);
+
+    const uint8* Data = Packet.GetData();
+    int32 Remaining = Packet.Num();
+
+    // Non-blocking sockets may accept only part of a large response per call
+    while (Remaining > 0)
+    {
+        int32 BytesSent = 0;
+        if (!Client.Socket->Send(Data, Remaining, BytesSent))
+        {
+            if ((int32)ISocketSubsystem::Get()->GetLastErrorCode() != SE_EWOULDBLOCK)
+            {
+                UE_LOG(LogMCP, Warning, TEXT("MCPServerRunnable: Failed to send response"));
+                return false;
+            }
+            BytesSent = 0;
+        }
+        if (BytesSent == 0)
+        {
+            FPlatformProcess::Sleep(0.001f);
+        }
+        Data += BytesSent;
+        Remaining -= BytesSent;
+    }
+
+    UE_LOG(LogMCP, Display, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), Packet.Num());
+    return true;
+}
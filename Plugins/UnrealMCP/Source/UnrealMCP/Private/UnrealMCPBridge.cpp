@@ -203,132 +203,204 @@ FString UUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const TShar
     TPromise<FString> Promise;
     TFuture<FString> Future = Promise.GetFuture();
     
-    // Queue execution on Game Thread
+    // Queue execution on Game Thread. A batch runs all of its sub-commands in this one task.
     AsyncTask(ENamedThreads::GameThread, [this, CommandType, Params, Promise = MoveTemp(Promise)]() mutable
     {
-        TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+        TSharedPtr<FJsonObject> ResponseJson = CommandType == TEXT("batch")
+            ? HandleBatchCommand(Params)
+            : DispatchCommand(CommandType, Params);
         
-        try
+        FString ResultString;
+        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
+        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
+        Promise.SetValue(ResultString);
+    });
+    
+    return Future.Get();
+}
+
+// Run a single command and build its {status, result|error} response. Must be called on the game thread.
+TSharedPtr<FJsonObject> UUnrealMCPBridge::DispatchCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+    
+    try
+    {
+        TSharedPtr<FJsonObject> ResultJson;
+        
+        // Check for our specific AddActor command first
+        if (CommandType.Equals(TEXT("AddActor"), ESearchCase::IgnoreCase))
         {
-            TSharedPtr<FJsonObject> ResultJson;
-            
-            // Check for our specific AddActor command first
-            if (CommandType.Equals(TEXT("AddActor"), ESearchCase::IgnoreCase))
-            {
-                UE_LOG(LogMCP, Display, TEXT("UnrealMCPBridge: Processing AddActor command"));
-                ResultJson = ActorCommandHandler->HandleAddActor(Params);
-                
-                // Set success status
-                ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
-                ResponseJson->SetObjectField(TEXT("result"), ResultJson);
-                
-                // Special return for AddActor to avoid duplicate processing
-                FString ResultString;
-                TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-                FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-                Promise.SetValue(ResultString);
-                return;
-            }
-            // Continue with standard commands
-            else if (CommandType == TEXT("ping"))
-            {
-                ResultJson = MakeShareable(new FJsonObject);
-                ResultJson->SetStringField(TEXT("message"), TEXT("pong"));
-            }
-            // Actor Commands
-            else if (CommandType == TEXT("get_actors_in_level") || 
-                     CommandType == TEXT("find_actors_by_name") ||
-                     CommandType == TEXT("create_actor") || 
-                     CommandType == TEXT("delete_actor") || 
-                     CommandType == TEXT("set_actor_transform") ||
-                     CommandType == TEXT("get_actor_properties"))
-            {
-                ResultJson = ActorCommands->HandleCommand(CommandType, Params);
-            }
-            // Editor Commands
-            else if (CommandType == TEXT("focus_viewport") || 
-                     CommandType == TEXT("take_screenshot"))
-            {
-                ResultJson = EditorCommands->HandleCommand(CommandType, Params);
-            }
-            // Blueprint Commands
-            else if (CommandType == TEXT("create_blueprint") || 
-                     CommandType == TEXT("add_component_to_blueprint") || 
-                     CommandType == TEXT("set_component_property") || 
-                     CommandType == TEXT("set_physics_properties") || 
-                     CommandType == TEXT("compile_blueprint") || 
-                     CommandType == TEXT("spawn_blueprint_actor") || 
-                     CommandType == TEXT("set_blueprint_property") || 
-                     CommandType == TEXT("set_static_mesh_properties") ||
-                     CommandType == TEXT("set_pawn_properties"))
-            {
-                ResultJson = BlueprintCommands->HandleCommand(CommandType, Params);
-            }
-            // Blueprint Node Commands
-            else if (CommandType == TEXT("connect_blueprint_nodes") || 
-                     CommandType == TEXT("create_input_mapping") || 
-                     CommandType == TEXT("add_blueprint_get_self_component_reference") ||
-                     CommandType == TEXT("add_blueprint_self_reference") ||
-                     CommandType == TEXT("find_blueprint_nodes") ||
-                     CommandType == TEXT("add_blueprint_event_node") ||
-                     CommandType == TEXT("add_blueprint_input_action_node") ||
-                     CommandType == TEXT("add_blueprint_function_node") ||
-                     CommandType == TEXT("add_blueprint_get_component_node") ||
-                     CommandType == TEXT("add_blueprint_variable"))
-            {
-                ResultJson = BlueprintNodeCommands->HandleCommand(CommandType, Params);
-            }
-            else
-            {
-                ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-                ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
-                
-                FString ResultString;
-                TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-                FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-                Promise.SetValue(ResultString);
-                return;
-            }
+            UE_LOG(LogMCP, Display, TEXT("UnrealMCPBridge: Processing AddActor command"));
+            ResultJson = ActorCommandHandler->HandleAddActor(Params);
             
-            // Check if the result contains an error
-            bool bSuccess = true;
-            FString ErrorMessage;
-            
-            if (ResultJson->HasField(TEXT("success")))
-            {
-                bSuccess = ResultJson->GetBoolField(TEXT("success"));
-                if (!bSuccess && ResultJson->HasField(TEXT("error")))
-                {
-                    ErrorMessage = ResultJson->GetStringField(TEXT("error"));
-                }
-            }
-            
-            if (bSuccess)
-            {
-                // Set success status and include the result
-                ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
-                ResponseJson->SetObjectField(TEXT("result"), ResultJson);
-            }
-            else
+            // Set success status and skip the error check below
+            ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+            ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+            return ResponseJson;
+        }
+        // Continue with standard commands
+        else if (CommandType == TEXT("ping"))
+        {
+            ResultJson = MakeShareable(new FJsonObject);
+            ResultJson->SetStringField(TEXT("message"), TEXT("pong"));
+        }
+        // Actor Commands
+        else if (CommandType == TEXT("get_actors_in_level") || 
+                 CommandType == TEXT("find_actors_by_name") ||
+                 CommandType == TEXT("create_actor") || 
+                 CommandType == TEXT("delete_actor") || 
+                 CommandType == TEXT("delete_actors") ||
+                 CommandType == TEXT("set_actor_transform") ||
+                 CommandType == TEXT("set_actor_transforms") ||
+                 CommandType == TEXT("get_actor_properties"))
+        {
+            ResultJson = ActorCommands->HandleCommand(CommandType, Params);
+        }
+        // Editor Commands
+        else if (CommandType == TEXT("focus_viewport") || 
+                 CommandType == TEXT("take_screenshot"))
+        {
+            ResultJson = EditorCommands->HandleCommand(CommandType, Params);
+        }
+        // Blueprint Commands
+        else if (CommandType == TEXT("create_blueprint") || 
+                 CommandType == TEXT("add_component_to_blueprint") || 
+                 CommandType == TEXT("set_component_property") || 
+                 CommandType == TEXT("set_physics_properties") || 
+                 CommandType == TEXT("compile_blueprint") || 
+                 CommandType == TEXT("spawn_blueprint_actor") || 
+                 CommandType == TEXT("set_blueprint_property") || 
+                 CommandType == TEXT("set_static_mesh_properties") ||
+                 CommandType == TEXT("set_pawn_properties"))
+        {
+            ResultJson = BlueprintCommands->HandleCommand(CommandType, Params);
+        }
+        // Blueprint Node Commands
+        else if (CommandType == TEXT("connect_blueprint_nodes") || 
+                 CommandType == TEXT("create_input_mapping") || 
+                 CommandType == TEXT("add_blueprint_get_self_component_reference") ||
+                 CommandType == TEXT("add_blueprint_self_reference") ||
+                 CommandType == TEXT("find_blueprint_nodes") ||
+                 CommandType == TEXT("add_blueprint_event_node") ||
+                 CommandType == TEXT("add_blueprint_input_action_node") ||
+                 CommandType == TEXT("add_blueprint_function_node") ||
+                 CommandType == TEXT("add_blueprint_get_component_node") ||
+                 CommandType == TEXT("add_blueprint_variable"))
+        {
+            ResultJson = BlueprintNodeCommands->HandleCommand(CommandType, Params);
+        }
+        else
+        {
+            ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+            ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
+            return ResponseJson;
+        }
+        
+        // Check if the result contains an error
+        bool bSuccess = true;
+        FString ErrorMessage;
+        
+        if (ResultJson->HasField(TEXT("success")))
+        {
+            bSuccess = ResultJson->GetBoolField(TEXT("success"));
+            if (!bSuccess && ResultJson->HasField(TEXT("error")))
             {
-                // Set error status and include the error message
-                ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-                ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
+                ErrorMessage = ResultJson->GetStringField(TEXT("error"));
             }
         }
-        catch (const std::exception& e)
+        
+        if (bSuccess)
         {
+            // Set success status and include the result
+            ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+            ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+        }
+        else
+        {
+            // Set error status and include the error message
             ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-            ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
+            ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
+        }
+    }
+    catch (const std::exception& e)
+    {
+        ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+        ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
+    }
+    
+    return ResponseJson;
+}
+
+// Run an ordered list of sub-commands and return their responses in the same order.
+// With stop_on_error, sub-commands after the first failure are reported as skipped.
+TSharedPtr<FJsonObject> UUnrealMCPBridge::HandleBatchCommand(const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+    
+    const TArray<TSharedPtr<FJsonValue>>* Commands = nullptr;
+    if (!Params.IsValid() || !Params->TryGetArrayField(TEXT("commands"), Commands))
+    {
+        ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+        ResponseJson->SetStringField(TEXT("error"), TEXT("Missing 'commands' parameter"));
+        return ResponseJson;
+    }
+    
+    bool bStopOnError = false;
+    Params->TryGetBoolField(TEXT("stop_on_error"), bStopOnError);
+    
+    UE_LOG(LogMCP, Display, TEXT("UnrealMCPBridge: Executing batch of %d commands"), Commands->Num());
+    
+    TArray<TSharedPtr<FJsonValue>> Results;
+    int32 Failed = 0;
+    bool bStopped = false;
+    
+    for (const TSharedPtr<FJsonValue>& CommandValue : *Commands)
+    {
+        TSharedPtr<FJsonObject> SubResponse;
+        const TSharedPtr<FJsonObject>* CommandObject = nullptr;
+        FString SubType;
+        
+        if (bStopped)
+        {
+            SubResponse = MakeShareable(new FJsonObject);
+            SubResponse->SetStringField(TEXT("status"), TEXT("skipped"));
+        }
+        else if (!CommandValue->TryGetObject(CommandObject) || !(*CommandObject)->TryGetStringField(TEXT("type"), SubType))
+        {
+            SubResponse = MakeShareable(new FJsonObject);
+            SubResponse->SetStringField(TEXT("status"), TEXT("error"));
+            SubResponse->SetStringField(TEXT("error"), TEXT("Missing 'type' field in command"));
+        }
+        else if (SubType == TEXT("batch"))
+        {
+            SubResponse = MakeShareable(new FJsonObject);
+            SubResponse->SetStringField(TEXT("status"), TEXT("error"));
+            SubResponse->SetStringField(TEXT("error"), TEXT("Batches cannot be nested"));
+        }
+        else
+        {
+            const TSharedPtr<FJsonObject>* SubParams = nullptr;
+            TSharedPtr<FJsonObject> EmptyParams = MakeShareable(new FJsonObject);
+            SubResponse = DispatchCommand(SubType, (*CommandObject)->TryGetObjectField(TEXT("params"), SubParams) ? *SubParams : EmptyParams);
         }
         
-        FString ResultString;
-        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-        Promise.SetValue(ResultString);
-    });
+        if (!bStopped && SubResponse->GetStringField(TEXT("status")) == TEXT("error"))
+        {
+            Failed++;
+            bStopped = bStopOnError;
+        }
+        Results.Add(MakeShareable(new FJsonValueObject(SubResponse)));
+    }
     
-    return Future.Get();
+    TSharedPtr<FJsonObject> ResultJson = MakeShareable(new FJsonObject);
+    ResultJson->SetArrayField(TEXT("results"), Results);
+    ResultJson->SetNumberField(TEXT("failed"), Failed);
+    ResultJson->SetBoolField(TEXT("stopped"), bStopped);
+    
+    ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+    ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+    return ResponseJson;
 }
 
 // For now, we'll keep the original command handler methods in place
@@ -34,7 +34,9 @@ public:
     
     // Actor utilities
     static TSharedPtr<FJsonValue> ActorToJson(AActor* Actor);
+    static TSharedPtr<FJsonValue> ActorToJson(AActor* Actor, const TArray<FString>& Fields);
     static TSharedPtr<FJsonObject> ActorToJsonObject(AActor* Actor, bool bDetailed = false);
+    static void AddActorTagsFromJson(AActor* Actor, const TSharedPtr<FJsonObject>& JsonObject);
     
     // Blueprint utilities
     static UBlueprint* FindBlueprint(const FString& BlueprintName);
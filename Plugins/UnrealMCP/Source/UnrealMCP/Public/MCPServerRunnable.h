@@ -6,6 +6,57 @@
 #include "Interfaces/IPv4/IPv4Address.h"
 
 class UUnrealMCPBridge;
+class FJsonObject;
+
+/**
+ * A parsed command waiting to be executed for a client.
+ */
+struct FMCPQueuedCommand
+{
+	FString CommandType;
+	TSharedPtr<FJsonObject> Params;
+	int64 RequestId = 0;
+	bool bHasRequestId = false;
+};
+
+/**
+ * State for one accepted client. Clients stay connected across commands, so
+ * received bytes are buffered until a complete JSON message is available.
+ */
+struct FMCPClientConnection
+{
+	TSharedPtr<FSocket> Socket;
+	TArray<uint8> ReceiveBuffer;
+
+	// Set once the client negotiates length-prefixed framing
+	bool bFramed = false;
+
+	// Set when a frame header gives a length over the limit; the client is then dropped
+	bool bBadFrame = false;
+
+	// Received commands not yet executed, oldest first. Pipelining clients
+	// can cancel these by request id.
+	TArray<FMCPQueuedCommand> PendingCommands;
+
+	// Incremental scan state for finding the end of the current message
+	int32 ScanOffset = 0;
+	int32 Depth = 0;
+	bool bInString = false;
+	bool bEscaped = false;
+
+	explicit FMCPClientConnection(TSharedPtr<FSocket> InSocket)
+		: Socket(InSocket)
+	{
+	}
+
+	void ResetScan()
+	{
+		ScanOffset = 0;
+		Depth = 0;
+		bInString = false;
+		bEscaped = false;
+	}
+};
 
 /**
  * Runnable class for the MCP server thread
@@ -23,12 +74,32 @@ public:
 	virtual void Exit() override;
 
 protected:
-	void HandleClientConnection(TSharedPtr<FSocket> ClientSocket);
-	void ProcessMessage(TSharedPtr<FSocket> Client, const FString& Message);
+	void AcceptPendingClients();
+	// Reads any complete commands and executes the oldest. Returns false once the client has disconnected.
+	bool HandleClientConnection(FMCPClientConnection& Client, bool& bOutDidWork);
+	// Parses a received message and queues it, or handles it at once if it is a protocol command
+	void QueueMessage(FMCPClientConnection& Client, const FString& Message);
+	void ProcessCommand(FMCPClientConnection& Client, const FMCPQueuedCommand& Command);
+	bool SendResponse(FMCPClientConnection& Client, const FString& Response);
+
+	// Adds the client's request id to a serialized response object
+	static FString AddRequestId(const FString& Response, int64 RequestId);
+
+	// Handles the connection-level protocol negotiation command
+	void HandleNegotiateProtocol(FMCPClientConnection& Client, const TSharedPtr<FJsonObject>& Params);
+
+	// Drops a queued command the client no longer wants, answering it with an error
+	void HandleCancel(FMCPClientConnection& Client, const TSharedPtr<FJsonObject>& Params);
+
+	// Removes the next complete message from the buffer. Returns false if none is available yet.
+	static bool ExtractMessage(FMCPClientConnection& Client, FString& OutMessage);
+
+	// Returns the length of the first complete JSON message in the buffer, or INDEX_NONE
+	static int32 FindMessageEnd(FMCPClientConnection& Client);
 
 private:
 	UUnrealMCPBridge* Bridge;
 	TSharedPtr<FSocket> ListenerSocket;
-	TSharedPtr<FSocket> ClientSocket;
+	TArray<TSharedPtr<FMCPClientConnection>> Clients;
 	bool bRunning;
 }; 
\ No newline at end of file
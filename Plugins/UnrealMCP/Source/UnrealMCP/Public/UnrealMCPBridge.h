@@ -79,6 +79,12 @@ private:
 	TSharedPtr<FUnrealMCPBlueprintNodeCommands> BlueprintNodeCommands;
 	TSharedPtr<FActorCommandHandler> ActorCommandHandler;
 
+	// Runs one command on the game thread and builds its {status, result|error} response
+	TSharedPtr<FJsonObject> DispatchCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
+
+	// Runs every sub-command of a batch in order within a single game thread task
+	TSharedPtr<FJsonObject> HandleBatchCommand(const TSharedPtr<FJsonObject>& Params);
+
 	// Command handlers
 	TSharedPtr<FJsonObject> HandleLevelCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
 	TSharedPtr<FJsonObject> HandleAssetCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
@@ -17,8 +17,13 @@ import json
 import logging
 from typing import Dict, Any, Optional
 
-# Add the parent directory to the path so we can import the server module
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the Python directory to the path so we can import the server module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server.sweeper import ttl_tags
+
+# Seconds before the MCP server deletes test cubes a failed run leaves behind
+TEST_ACTOR_TTL = 600
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -98,7 +103,8 @@ def create_test_cube(name: str, location: list[float]) -> Optional[Dict[str, Any
         "type": "StaticMeshActor",
         "location": location,
         "rotation": [0.0, 0.0, 0.0],
-        "scale": [1.0, 1.0, 1.0]
+        "scale": [1.0, 1.0, 1.0],
+        "tags": ttl_tags(TEST_ACTOR_TTL)
     }
     
     response = send_command("create_actor", cube_params)
@@ -159,6 +165,15 @@ def set_actor_transform(
     logger.info(f"Modified transform for actor '{name}' successfully")
     return response
 
+def delete_test_cubes() -> None:
+    """Delete every test cube in one command, so runs don't leave them behind."""
+    response = send_command("delete_actors", {"pattern": "TestCube_"})
+    if not response or response.get("status") != "success":
+        logger.error(f"Failed to delete test cubes: {response}")
+        return
+        
+    logger.info(f"Deleted test cubes: {response['result']['deleted']}")
+
 def main():
     """Main function to test actor creation and manipulation."""
     try:
@@ -198,6 +213,8 @@ def main():
     except Exception as e:
         logger.error(f"Error in main: {e}")
         sys.exit(1)
+    finally:
+        delete_test_cubes()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
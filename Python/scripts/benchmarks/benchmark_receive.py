@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for receiving legacy (unframed) responses from Unreal.
+
+Compares the old receive loop, which re-joined, re-decoded and re-parsed every
+chunk received so far, against UnrealConnection.receive_full_response, which
+finds the end of the message with an incremental scanner and parses once.
+
+Responses are streamed over a local socket pair in 4 KB writes, shaped like a
+get_actors_in_level result. No Unreal Engine instance is needed.
+
+Usage:
+    python scripts/benchmarks/benchmark_receive.py [--full]
+
+The old loop is quadratic and takes many minutes on the 50 MB response, so it
+is skipped at that size unless --full is given.
+"""
+
+import sys
+import os
+import json
+import socket
+import threading
+import time
+import logging
+
+# Add the Python directory to the path so we can import the server package
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from server.core import UnrealConnection
+
+# Keep the client's per-response logging out of the timings
+logging.getLogger("UnrealMCP").setLevel(logging.WARNING)
+
+SIZES = [("1 KB", 1024), ("1 MB", 1024 * 1024), ("50 MB", 50 * 1024 * 1024)]
+SEND_CHUNK = 4096
+LEGACY_SIZE_LIMIT = 1024 * 1024
+REPEATS = 5
+
+
+def build_response(target_size: int) -> bytes:
+    """Build a get_actors_in_level style response of roughly target_size bytes."""
+    actor = {
+        "name": "StaticMeshActor_0000000",
+        "class": "StaticMeshActor",
+        "location": [1250.5, -340.25, 87.0],
+        "rotation": [0.0, 90.0, 0.0],
+        "scale": [1.0, 1.0, 1.0],
+    }
+    actor_size = len(json.dumps(actor)) + 2
+    count = max(1, target_size // actor_size)
+    actors = [dict(actor, name=f"StaticMeshActor_{i:07d}") for i in range(count)]
+    return json.dumps({"status": "success", "result": {"actors": actors}}).encode("utf-8")
+
+
+def legacy_receive(sock, buffer_size=4096) -> bytes:
+    """The receive loop used before the incremental scanner, minus logging."""
+    chunks = []
+    while True:
+        chunk = sock.recv(buffer_size)
+        if not chunk:
+            raise Exception("Connection closed before receiving data")
+        chunks.append(chunk)
+        data = b"".join(chunks)
+        try:
+            json.loads(data.decode("utf-8"))
+            return data
+        except json.JSONDecodeError:
+            continue
+
+
+def scanner_receive(sock) -> bytes:
+    """The current receive path, including the single final parse."""
+    data = _connection.receive_full_response(sock)
+    json.loads(data)
+    return data
+
+
+_connection = UnrealConnection()
+
+
+def time_receive(receive, payload: bytes) -> float:
+    """Stream payload through a socket pair and time how long receive takes."""
+    reader, writer = socket.socketpair()
+    reader.settimeout(None)
+
+    def send():
+        for offset in range(0, len(payload), SEND_CHUNK):
+            writer.sendall(payload[offset : offset + SEND_CHUNK])
+
+    sender = threading.Thread(target=send)
+    start = time.perf_counter()
+    sender.start()
+    try:
+        data = receive(reader)
+        elapsed = time.perf_counter() - start
+    finally:
+        sender.join()
+        reader.close()
+        writer.close()
+
+    if len(data) != len(payload):
+        raise Exception(f"Received {len(data)} bytes, expected {len(payload)}")
+    return elapsed
+
+
+def best_of(receive, payload: bytes, repeats: int) -> float:
+    return min(time_receive(receive, payload) for _ in range(repeats))
+
+
+def main():
+    full = "--full" in sys.argv
+
+    print(f"{'size':>8} {'bytes':>12} {'legacy (s)':>12} {'scanner (s)':>12} {'speedup':>9}")
+    for label, size in SIZES:
+        payload = build_response(size)
+        repeats = REPEATS if size <= LEGACY_SIZE_LIMIT else 1
+
+        scanner_time = best_of(scanner_receive, payload, repeats)
+        if full or size <= LEGACY_SIZE_LIMIT:
+            legacy_time = best_of(legacy_receive, payload, repeats)
+            legacy_text = f"{legacy_time:12.4f}"
+            speedup_text = f"{legacy_time / scanner_time:8.1f}x"
+        else:
+            legacy_text = f"{'skipped':>12}"
+            speedup_text = f"{'-':>9}"
+
+        print(
+            f"{label:>8} {len(payload):>12} {legacy_text} {scanner_time:12.4f} {speedup_text}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for spatial queries over the level mirror.
+
+Builds a LevelMirror snapshot of a synthetic 100,000-actor level (actors
+spread over 2 km x 2 km, a few storeys high) and times radius, box and
+nearest-actor queries against a linear scan of the same actor list, which is
+what an agent filtering the get_actors_in_level dump does. No Unreal Engine
+instance is needed.
+
+The timings are what a spatial tool call costs once the connection's level
+mirror is current, which it is after one streamed listing and stays while
+actor writes go through the server, whatever UNREAL_MIRROR_LEVEL is set to.
+A stale mirror adds one streamed listing of the level to the next query.
+
+Usage:
+    python scripts/benchmarks/benchmark_spatial.py [actor_count]
+"""
+
+import sys
+import os
+import math
+import random
+import time
+
+# Add the Python directory to the path so we can import the server package
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from server.constants import UNREAL_SPATIAL_CELL_SIZE
+from server.mirror import LevelMirror
+
+ACTOR_COUNT = 100_000
+LEVEL_SIZE = 200_000.0  # Unreal units (cm)
+QUERIES = 500
+CLASSES = ["StaticMeshActor", "PointLight", "SpotLight", "CameraActor", "TriggerBox"]
+
+
+def build_level(count: int) -> LevelMirror:
+    """Snapshot of a get_actors_in_level style listing with ``count`` actors."""
+    rng = random.Random(1)
+    actors = [
+        {
+            "name": f"Actor_{i:06d}",
+            "class": CLASSES[i % len(CLASSES)],
+            "location": [
+                rng.uniform(0, LEVEL_SIZE),
+                rng.uniform(0, LEVEL_SIZE),
+                rng.uniform(0, 1500.0),
+            ],
+            "rotation": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0],
+        }
+        for i in range(count)
+    ]
+    return LevelMirror.snapshot(actors, UNREAL_SPATIAL_CELL_SIZE)
+
+
+def scan_radius(actors, center, radius):
+    return sorted(
+        (math.dist(center, actor["location"]), actor["name"])
+        for actor in actors
+        if math.dist(center, actor["location"]) <= radius
+    )
+
+
+def scan_nearest(actors, center, k):
+    return sorted((math.dist(center, actor["location"]), actor["name"]) for actor in actors)[:k]
+
+
+def time_queries(label: str, query, centers):
+    started = time.perf_counter()
+    for center in centers:
+        query(center)
+    per_query = (time.perf_counter() - started) / len(centers)
+    print(f"  {label:<36} {per_query * 1e6:>10.1f} us/query")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ACTOR_COUNT
+    started = time.perf_counter()
+    level = build_level(count)
+    print(f"Indexed {count} actors in {time.perf_counter() - started:.2f}s")
+
+    rng = random.Random(2)
+    centers = [
+        [rng.uniform(0, LEVEL_SIZE), rng.uniform(0, LEVEL_SIZE), 0.0] for _ in range(QUERIES)
+    ]
+    actors = level.answer("get_actors_in_level", {})["result"]["actors"]
+
+    print("Index:")
+    time_queries("radius 2000", lambda c: level.in_radius(c, 2000.0), centers)
+    time_queries(
+        "radius 2000, PointLight only",
+        lambda c: level.in_radius(c, 2000.0, "PointLight"),
+        centers,
+    )
+    time_queries(
+        "box 4000 x 4000 x 2000",
+        lambda c: level.in_box([c[0] - 2000, c[1] - 2000, 0], [c[0] + 2000, c[1] + 2000, 2000]),
+        centers,
+    )
+    time_queries("nearest 10", lambda c: level.nearest(c, 10), centers)
+    time_queries("nearest 10, PointLight only", lambda c: level.nearest(c, 10, "PointLight"), centers)
+
+    print("Linear scan (first 20 queries):")
+    time_queries("radius 2000", lambda c: scan_radius(actors, c, 2000.0), centers[:20])
+    time_queries("nearest 10", lambda c: scan_nearest(actors, c, 10), centers[:20])
+
+
+if __name__ == "__main__":
+    main()
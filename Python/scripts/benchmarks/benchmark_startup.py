@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Startup latency benchmark for the MCP server.
+
+Launches the server over stdio the way an MCP client does and times how long
+it takes to answer ``initialize`` and ``tools/list``, measured from process
+launch. Three editor states are simulated on the Unreal port:
+
+- reachable: a stand-in editor that answers every command
+- not running: nothing listening, connects are refused
+- not responding: connects are accepted but nothing is ever sent back, so
+  every connect waits for the socket timeout
+
+A real Unreal Editor must not be running, since the stand-ins use its port.
+
+Usage:
+    python scripts/benchmarks/benchmark_startup.py
+"""
+
+import sys
+import os
+import json
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PYTHON_DIR)
+
+from server.constants import UNREAL_HOST, UNREAL_PORT
+
+REPEATS = 3
+RESPONSE_TIMEOUT = 60
+
+
+class StandInEditor:
+    """Listens on the Unreal port and either answers commands or stays silent."""
+
+    def __init__(self, respond: bool):
+        self.respond = respond
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((UNREAL_HOST, UNREAL_PORT))
+        self.listener.listen(16)
+        self.clients = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self.listener.accept()
+            except OSError:
+                return
+            self.clients.append(client)
+            if self.respond:
+                threading.Thread(target=self._serve, args=(client,), daemon=True).start()
+
+    def _serve(self, client: socket.socket):
+        # Unframed JSON only: the negotiation reply accepts no protocol options
+        decoder = json.JSONDecoder()
+        buffer = ""
+        while True:
+            try:
+                chunk = client.recv(65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer += chunk.decode("utf-8")
+            while buffer.strip():
+                try:
+                    _, end = decoder.raw_decode(buffer.lstrip())
+                except ValueError:
+                    break
+                buffer = buffer.lstrip()[end:]
+                client.sendall(b'{"status": "success", "result": {}}')
+
+    def close(self):
+        self.listener.close()
+        for client in self.clients:
+            client.close()
+
+
+def request(process: subprocess.Popen, message: dict):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def read_response(process: subprocess.Popen, request_id: int) -> dict:
+    """Read stdout lines until the response to request_id arrives."""
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise Exception("Server exited before responding")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+def time_startup():
+    """Launch the server and time its initialize and tools/list responses."""
+    env = dict(os.environ, PYTHONPATH=PYTHON_DIR)
+    with tempfile.TemporaryDirectory() as workdir:  # Keeps the server's log file out of the repo
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "server"],
+            cwd=workdir,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        timer = threading.Timer(RESPONSE_TIMEOUT, process.kill)
+        timer.start()
+        try:
+            request(process, {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "benchmark", "version": "1.0"},
+                },
+            })
+            read_response(process, 1)
+            initialize_time = time.perf_counter() - start
+
+            request(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+            request(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+            read_response(process, 2)
+            tools_time = time.perf_counter() - start
+        finally:
+            timer.cancel()
+            process.kill()
+            process.wait()
+    return initialize_time, tools_time
+
+
+def main():
+    scenarios = [
+        ("reachable", lambda: StandInEditor(respond=True)),
+        ("not running", lambda: None),
+        ("not responding", lambda: StandInEditor(respond=False)),
+    ]
+
+    print(f"{'editor':>15} {'initialize (s)':>15} {'tools/list (s)':>15}")
+    for label, start_editor in scenarios:
+        editor = start_editor()
+        try:
+            timings = [time_startup() for _ in range(REPEATS)]
+        finally:
+            if editor:
+                editor.close()
+        initialize_time = min(t[0] for t in timings)
+        tools_time = min(t[1] for t in timings)
+        print(f"{label:>15} {initialize_time:15.3f} {tools_time:15.3f}")
+
+
+if __name__ == "__main__":
+    main()
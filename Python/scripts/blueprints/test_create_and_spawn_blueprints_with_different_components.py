@@ -43,6 +43,11 @@ from typing import Dict, Any, Optional, List
 # Add the parent directory to the path so we can import the server module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from server.sweeper import ttl_tags
+
+# Seconds before the MCP server deletes the spawned test actors
+TEST_ACTOR_TTL = 600
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("TestComponentCreation")
@@ -205,7 +210,8 @@ def spawn_blueprint_actor(blueprint_name: str, actor_name: str, location: List[f
     """Spawn an actor from the specified blueprint."""
     spawn_params: Dict[str, Any] = {
         "blueprint_name": blueprint_name,
-        "actor_name": actor_name
+        "actor_name": actor_name,
+        "tags": ttl_tags(TEST_ACTOR_TTL)
     }
     
     # Add location if provided
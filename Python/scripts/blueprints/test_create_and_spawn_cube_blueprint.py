@@ -25,6 +25,11 @@ from typing import Dict, Any, Optional
 # Add the parent directory to the path so we can import the server module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from server.sweeper import ttl_tags
+
+# Seconds before the MCP server deletes the spawned test actor
+TEST_ACTOR_TTL = 600
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("TestBasicBlueprint")
@@ -170,7 +175,8 @@ def main():
                 "actor_name": "TestBPInstance",
                 "location": [0.0, 0.0, 100.0],  # 100 units up
                 "rotation": [0.0, 0.0, 0.0],
-                "scale": [1.0, 1.0, 1.0]
+                "scale": [1.0, 1.0, 1.0],
+                "tags": ttl_tags(TEST_ACTOR_TTL)
             }
             
             response = send_command(sock, "spawn_blueprint_actor", spawn_params)
@@ -6,6 +6,7 @@ from .tools.actor_tools import register_actor_tools
 from .tools.editor_tools import register_editor_tools
 from .tools.blueprint_tools import register_blueprint_tools
 from .tools.node_tools import register_blueprint_node_tools
+from .tools.diagnostics_tools import register_diagnostics_tools
 
 
 # Initialize server
@@ -20,6 +21,7 @@ register_actor_tools(mcp)
 register_editor_tools(mcp)
 register_blueprint_tools(mcp)
 register_blueprint_node_tools(mcp)
+register_diagnostics_tools(mcp)
 
 
 @mcp.prompt()
@@ -30,11 +32,18 @@ def unreal_best_practices():
     
     ## Actor Management
     - ALWAYS use `find_actors_by_name(name)` to check if an actor exists before creating or modifying it
-    - `create_actor(name, type, location, rotation, scale)` - Create actors (e.g. `CUBE`, `SPHERE`, `CAMERA`, `LIGHT`)
+    - `create_actor(name, type, location, rotation, scale, ttl)` - Create actors (e.g. `CUBE`, `SPHERE`, `CAMERA`, `LIGHT`); give a `ttl` in seconds for temporary actors, which are deleted automatically once it passes
+    - `create_actors(actors | names, types, locations, rotations, scales, ttl)` - Create many actors at once; use this instead of repeated `create_actor` calls when populating a level
     - `delete_actor(name)` - Remove actors
+    - `delete_actors(names, pattern, tag)` - Remove every actor matching the filters in one call, e.g. all actors whose name contains `TestCube_`, or tag `mcp_temporary` for every temporary actor
     - `set_actor_transform(name, location, rotation, scale)` - Modify actor position, rotation, and scale
+    - `set_actor_transforms(names, locations, rotations, scales)` - Move many actors at once, e.g. for a re-layout; only the components given are changed
     - `get_actor_properties(name)` - Get actor properties
-    - `get_actors_in_level()` - Get all actors in the current level
+    - `get_actor_transform(name)` - Get an actor's location, rotation and scale
+    - `get_actors_in_level(limit, cursor, fields, actor_class, name_pattern)` - List actors in the current level; on large levels, filter, project fields (e.g. `["name"]`) and page with `limit`/`cursor` rather than listing everything
+    - `export_level_snapshot(path, fields, actor_class, name_pattern)` - Write the level's actors to a JSON Lines file, with a count per class, without loading the whole listing
+    - `find_actors_in_radius(radius, location, actor, actor_class)` / `find_actors_in_box(min_corner, max_corner, actor_class)` - Find actors in a region
+    - `nearest_actors(k, actor_class, location, actor)` - Find the k actors nearest a point or actor
     
     ## Blueprint Management
     - `create_blueprint(name, parent_class)` - Create new Blueprint classes
@@ -44,7 +53,7 @@ def unreal_best_practices():
     - `compile_blueprint(blueprint_name)` - Compile Blueprint changes
     - `set_blueprint_property(blueprint_name, property_name, property_value)` - Set Blueprint class properties
     - `set_pawn_properties(blueprint_name, auto_possess_player, use_controller_rotation_yaw, use_controller_rotation_pitch, use_controller_rotation_roll, can_be_damaged)` - Configure Pawn settings
-    - `spawn_blueprint_actor(blueprint_name, actor_name, location, rotation, scale)` - Spawn Blueprint actors in the level
+    - `spawn_blueprint_actor(blueprint_name, actor_name, location, rotation, scale, ttl)` - Spawn Blueprint actors in the level
     
     ## Blueprint Node Management
     - `add_blueprint_event_node(blueprint_name, event_type, node_position)` - Add event nodes (BeginPlay, Tick, etc.)
@@ -61,6 +70,10 @@ def unreal_best_practices():
     - `focus_viewport(target, location, distance, orientation)` - Focus viewport on actors or locations
     - `take_screenshot(filename, show_ui, resolution)` - Capture viewport screenshots
     
+    ## Diagnostics
+    - `get_unreal_metrics()` - Connection metrics such as circuit breaker state; works while Unreal is down
+    - `get_level_mirror_status(resync)` - How current the server's copy of the level is; `resync=True` refreshes it after editing the level by hand
+    
     ## Best Practices
     ### Actor Creation and Management
     - When creating actors, always provide a unique name to avoid conflicts
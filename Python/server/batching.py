@@ -0,0 +1,208 @@
+"""
+Write coalescing for the asyncio Unreal client.
+
+Blueprint build steps are mostly small writes whose results callers only check
+for success. Sent one by one, each costs a round trip and a game thread hop.
+``WriteCoalescer`` holds such commands for a short window, or until a size cap
+is reached, and sends them as one ``batch`` command. Each caller still awaits
+its own response.
+
+Some writes make earlier ones to the same target pointless: only the last of a
+run of ``set_actor_transform`` calls on one actor matters. ``LatestWinsWrites``
+keeps at most one such write per target in flight and one waiting behind it;
+a newer write replaces the waiting one instead of queueing after it.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from .metrics import metrics
+
+logger = logging.getLogger("UnrealMCP")
+
+# Writes whose responses nothing else depends on, safe to hold back briefly
+COALESCED_COMMANDS = frozenset(
+    {
+        "add_blueprint_variable",
+        "add_component_to_blueprint",
+        "connect_blueprint_nodes",
+        "create_input_mapping",
+        "set_blueprint_property",
+        "set_component_property",
+        "set_pawn_properties",
+        "set_physics_properties",
+        "set_static_mesh_properties",
+    }
+)
+
+# Writes where only the latest per target matters, with the parameter naming the target
+LATEST_WINS_COMMANDS = {
+    "focus_viewport": "target",
+    "set_actor_transform": "name",
+}
+# Of those, commands whose parameters each set something independently, so a
+# replaced write's parameters are merged under the newer write's
+MERGED_COMMANDS = frozenset({"set_actor_transform"})
+
+SendBatch = Callable[[Sequence[Tuple[str, Optional[Dict[str, Any]]]]], Awaitable[List[Dict[str, Any]]]]
+
+
+class WriteCoalescer:
+    """Buffers commands and flushes them as a single batch.
+
+    The first buffered command arms a timer of ``window`` seconds; the buffer
+    is flushed when it fires or as soon as ``max_size`` commands are waiting.
+    Each flush waits for the one before it, so batches reach the editor in
+    submission order.
+    """
+
+    def __init__(self, send_batch: SendBatch, window: float, max_size: int):
+        self.window = window
+        self.max_size = max_size
+        self._send_batch = send_batch
+        self._pending: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._last_flush: Optional[asyncio.Task] = None
+
+    async def submit(self, command: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Buffer a command and wait for its response from the next flush."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((command, params, future))
+
+        if len(self._pending) >= self.max_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> Optional[asyncio.Task]:
+        """Hand the buffered commands to a flush task queued behind the previous one."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            self._last_flush = asyncio.create_task(self._flush(pending, self._last_flush))
+        return self._last_flush
+
+    async def _flush(self, pending, previous: Optional[asyncio.Task]):
+        if previous is not None:
+            await asyncio.wait({previous})
+
+        # Callers that gave up while their command was buffered don't need it sent
+        pending = [entry for entry in pending if not entry[2].done()]
+        if not pending:
+            return
+
+        logger.debug(f"Flushing {len(pending)} coalesced commands")
+        try:
+            results = await self._send_batch([(command, params) for command, params, _ in pending])
+        except Exception as e:
+            logger.error(f"Error flushing coalesced commands: {e}")
+            results = [{"status": "error", "error": str(e)} for _ in pending]
+
+        for (_, _, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def flush(self):
+        """Send everything buffered so far and wait until it has been answered.
+
+        A command sent after this returns can't overtake any buffered write.
+        """
+        task = self._start_flush()
+        if task is not None:
+            await asyncio.wait({task})
+
+    def discard(self, reason: str):
+        """Drop buffered commands, answering each with an error."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        for _, _, future in pending:
+            if not future.done():
+                future.set_result({"status": "error", "error": reason})
+
+
+def latest_wins_key(command: str, params: Optional[Dict[str, Any]]) -> Optional[Hashable]:
+    """Key under which a command supersedes earlier ones, or None if it doesn't."""
+    target_param = LATEST_WINS_COMMANDS.get(command)
+    if target_param is None:
+        return None
+    return (command, (params or {}).get(target_param))
+
+
+SendCommand = Callable[[str, Optional[Dict[str, Any]], Optional[float]], Awaitable[Dict[str, Any]]]
+
+
+class _KeyState:
+    __slots__ = ("params", "deadline", "future")
+
+    def __init__(self):
+        # Write waiting for the in-flight one to finish, if any
+        self.params: Optional[Dict[str, Any]] = None
+        self.deadline: Optional[float] = None
+        self.future: Optional[asyncio.Future] = None
+
+
+class LatestWinsWrites:
+    """Collapses writes to the same target that are superseded before being sent.
+
+    While a write for a key is in flight, the next one waits. A write arriving
+    while another is already waiting replaces it; the callers of both get the
+    response to the write actually sent. Replaced writes are counted in the
+    ``coalesce.<command>.elided`` metric.
+    """
+
+    def __init__(self, send_command: SendCommand):
+        self._send_command = send_command
+        self._keys: Dict[Hashable, _KeyState] = {}
+        self._drivers: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        key: Hashable,
+        command: str,
+        params: Optional[Dict[str, Any]],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a write for ``key``, or fold it into the one waiting to be sent."""
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _KeyState()
+            future = asyncio.get_running_loop().create_future()
+            driver = asyncio.create_task(self._drive(key, state, command, params, deadline, future))
+            self._drivers.add(driver)
+            driver.add_done_callback(self._drivers.discard)
+        elif state.future is None:
+            state.params, state.deadline = params, deadline
+            future = state.future = asyncio.get_running_loop().create_future()
+        else:
+            metrics.increment(f"coalesce.{command}.elided")
+            if command in MERGED_COMMANDS:
+                params = {**(state.params or {}), **(params or {})}
+            state.params, state.deadline = params, deadline
+            future = state.future
+
+        # Shielded, since other callers may share the response
+        async with asyncio.timeout_at(deadline):
+            return await asyncio.shield(future)
+
+    async def _drive(self, key, state: _KeyState, command, params, deadline, future):
+        """Send the writes for a key one after another until none is waiting."""
+        while True:
+            try:
+                result = await self._send_command(command, params, deadline)
+            except Exception as e:
+                logger.error(f"Error sending {command}: {e}")
+                result = {"status": "error", "error": str(e)}
+            if not future.done():
+                future.set_result(result)
+
+            if state.future is None:
+                del self._keys[key]
+                return
+            params, deadline, future = state.params, state.deadline, state.future
+            state.params = state.deadline = state.future = None
@@ -0,0 +1,120 @@
+"""
+Circuit breaker for the connection to Unreal Engine.
+
+While the editor is down every command would otherwise pay a connect attempt,
+up to the socket timeout each. After enough consecutive transport failures the
+breaker opens and commands fail immediately. Once the backoff delay has passed
+a single probe command is let through (half-open); if it succeeds the breaker
+closes, otherwise it reopens with a longer delay.
+"""
+
+import logging
+import threading
+import time
+
+from .metrics import metrics
+
+logger = logging.getLogger("UnrealMCP")
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting Unreal while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Three-state circuit breaker with exponential probe backoff.
+
+    Transitions are counted as ``breaker.<name>.<from>_to_<to>`` metrics and
+    the current state is kept in the ``breaker.<name>.state`` gauge.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        base_backoff: float,
+        max_backoff: float,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = CLOSED
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._backoff = base_backoff
+        self._retry_at = 0.0
+        self._probing = False
+        metrics.set_gauge(f"breaker.{name}.state", CLOSED)
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        logger.info(f"Unreal circuit breaker {self.name}: {self.state} -> {state}")
+        metrics.increment(f"breaker.{self.name}.{self.state}_to_{state}")
+        metrics.set_gauge(f"breaker.{self.name}.state", state)
+        self.state = state
+
+    def check(self):
+        """Raise CircuitOpenError unless a command may be sent now.
+
+        When the backoff delay has passed, the first caller becomes the
+        half-open probe and everyone else keeps failing fast until it reports.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now >= self._retry_at:
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            metrics.increment(f"breaker.{self.name}.rejected")
+            retry_in = max(self._retry_at - now, 0.0)
+
+        raise CircuitOpenError(
+            f"Unreal Engine is unreachable (circuit open); "
+            f"next connection attempt in {retry_in:.1f}s"
+        )
+
+    def record_success(self):
+        """Report a command that reached Unreal and got a response."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._backoff = self.base_backoff
+            self._transition(CLOSED)
+
+    def record_failure(self):
+        """Report a command that failed to reach Unreal or get a response."""
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN:
+                # Failed probe: wait longer before the next one
+                self._probing = False
+                self._backoff = min(self._backoff * 2, self.max_backoff)
+            elif self._failures < self.failure_threshold:
+                return
+            self._retry_at = time.monotonic() + self._backoff
+            self._transition(OPEN)
+
+    def release(self):
+        """Report a command abandoned before its outcome was known."""
+        with self._lock:
+            self._probing = False
+
+    def status(self) -> dict:
+        """Current state and, while open, seconds until the next probe."""
+        with self._lock:
+            retry_in = max(self._retry_at - time.monotonic(), 0.0) if self.state == OPEN else 0.0
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "retry_in": round(retry_in, 3),
+            }
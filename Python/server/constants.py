@@ -2,3 +2,105 @@
 UNREAL_HOST = "127.0.0.1"
 UNREAL_PORT = 55557
 SERVER_PORT = 8000  # Port for HTTP server
+
+# Connection pool
+UNREAL_POOL_SIZE = 4  # Maximum sockets kept open to the editor
+UNREAL_SOCKET_TIMEOUT = 5  # Seconds, for connects and for commands with no latency history yet
+
+# Wire framing to request from the plugin: "length_prefixed" or "legacy"
+UNREAL_FRAMING = "length_prefixed"
+
+# Keep many commands in flight on one socket when the plugin echoes request ids
+UNREAL_PIPELINING = True
+
+# Most sub-commands sent in one batch; longer lists are split so a single
+# game thread task doesn't stall the editor
+UNREAL_MAX_BATCH_SIZE = 100
+
+# Most actors moved by one set_actor_transforms command, for the same reason
+UNREAL_MAX_TRANSFORMS_PER_COMMAND = 500
+
+# Opt-in: hold fire-and-forget writes briefly and send them as one batch
+UNREAL_COALESCE_WRITES = False
+UNREAL_COALESCE_WINDOW = 0.005  # Seconds to wait for more writes after the first
+UNREAL_COALESCE_MAX_SIZE = 50  # Flush as soon as this many writes are waiting
+
+# Replace a set_actor_transform or focus_viewport still waiting to be sent with
+# a newer one to the same actor or target, instead of sending both
+UNREAL_LATEST_WINS = True
+
+# Let identical concurrent read-only commands share one request and response
+UNREAL_SINGLE_FLIGHT = True
+
+# Seconds to reuse a response to each read-only command, unless a write that
+# could change it is sent first. Commands not listed aren't cached
+UNREAL_CACHE_TTLS = {
+    "get_actor_properties": 2.0,
+    "get_actors_in_level": 5.0,
+    "find_actors_by_name": 5.0,
+    "find_blueprint_nodes": 10.0,
+}
+# Most responses kept, least recently used dropped first
+UNREAL_CACHE_MAX_ENTRIES = 256
+
+# Keep a client-side copy of the level's actors, updated from actor write
+# responses, and answer actor listings and searches from it. Resyncs are
+# streamed, and only a read of the whole level waits for one; narrower reads
+# of a stale copy go to the editor.
+UNREAL_MIRROR_LEVEL = True
+# Seconds before the copy is refreshed from the editor, to pick up changes
+# made there by hand
+UNREAL_MIRROR_MAX_AGE = 30.0
+# Edge of the grid cells the mirror buckets actor locations in (Unreal units);
+# about the radius of a typical "what's near" query
+UNREAL_SPATIAL_CELL_SIZE = 2000.0
+
+# Circuit breaker: fail fast after this many consecutive transport failures,
+# then probe again after a backoff that doubles up to the maximum (seconds)
+UNREAL_BREAKER_FAILURE_THRESHOLD = 3
+UNREAL_BREAKER_BASE_BACKOFF = 1.0
+UNREAL_BREAKER_MAX_BACKOFF = 30.0
+
+# Seconds between background pings that measure RTT and keep a connection warm,
+# 0 to disable
+UNREAL_HEARTBEAT_INTERVAL = 10
+
+# Seconds between background sweeps that delete expired temporary actors (those
+# created with a TTL), 0 to disable, and most actors deleted per command
+UNREAL_SWEEP_INTERVAL = 30
+UNREAL_SWEEP_BATCH_SIZE = 100
+
+# Seconds to wait before each retry of the background startup connect
+UNREAL_STARTUP_RETRY_DELAYS = (1, 2, 4, 8)
+
+# Most commands sent on the pipelined connection before their responses arrive.
+# The limit actually used adapts to response latencies, starting from
+# UNREAL_INITIAL_IN_FLIGHT and never going below UNREAL_MIN_IN_FLIGHT
+UNREAL_MAX_IN_FLIGHT = 32
+UNREAL_INITIAL_IN_FLIGHT = 4
+UNREAL_MIN_IN_FLIGHT = 1
+
+# Response timeouts are learned per command type from recent latencies and
+# kept within these bounds (seconds)
+UNREAL_MIN_TIMEOUT = 1.0
+UNREAL_MAX_TIMEOUT = 120.0
+# Starting timeouts for commands known to be much faster or slower than the
+# default, used until enough latencies have been observed
+UNREAL_COMMAND_TIMEOUTS = {
+    "ping": 2.0,
+    "find_actors_by_name": 3.0,
+    "get_actors_in_level": 15.0,
+    "delete_actors": 30.0,
+    "take_screenshot": 30.0,
+    "compile_blueprint": 60.0,
+}
+
+# Seconds a tool call may spend on Unreal commands, unless the MCP client sets
+# a numeric "timeout" in the request's _meta
+UNREAL_TOOL_DEADLINE = 120.0
+
+# Share of the in-flight (or pooled connection) limit each priority lane may
+# hold at once; interactive commands may use all of it
+UNREAL_LANE_SHARES = {"interactive": 1.0, "normal": 0.5, "bulk": 0.25}
+# Seconds a waiting command may be passed over before it goes ahead of higher lanes
+UNREAL_LANE_MAX_WAIT = 2.0
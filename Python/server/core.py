@@ -1,10 +1,74 @@
+import asyncio
 import logging
+import select
 import socket
 import sys
+import time
 import json
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional
-from .constants import UNREAL_HOST, UNREAL_PORT
+import threading
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Sequence, Tuple
+from .constants import (
+    UNREAL_HOST,
+    UNREAL_PORT,
+    UNREAL_POOL_SIZE,
+    UNREAL_SOCKET_TIMEOUT,
+    UNREAL_FRAMING,
+    UNREAL_PIPELINING,
+    UNREAL_MAX_BATCH_SIZE,
+    UNREAL_COALESCE_WRITES,
+    UNREAL_COALESCE_WINDOW,
+    UNREAL_COALESCE_MAX_SIZE,
+    UNREAL_LATEST_WINS,
+    UNREAL_SINGLE_FLIGHT,
+    UNREAL_CACHE_MAX_ENTRIES,
+    UNREAL_CACHE_TTLS,
+    UNREAL_MIRROR_LEVEL,
+    UNREAL_MIRROR_MAX_AGE,
+    UNREAL_SPATIAL_CELL_SIZE,
+    UNREAL_BREAKER_FAILURE_THRESHOLD,
+    UNREAL_BREAKER_BASE_BACKOFF,
+    UNREAL_BREAKER_MAX_BACKOFF,
+    UNREAL_HEARTBEAT_INTERVAL,
+    UNREAL_SWEEP_INTERVAL,
+    UNREAL_SWEEP_BATCH_SIZE,
+    UNREAL_STARTUP_RETRY_DELAYS,
+    UNREAL_MAX_IN_FLIGHT,
+    UNREAL_INITIAL_IN_FLIGHT,
+    UNREAL_MIN_IN_FLIGHT,
+    UNREAL_MIN_TIMEOUT,
+    UNREAL_MAX_TIMEOUT,
+    UNREAL_COMMAND_TIMEOUTS,
+    UNREAL_LANE_SHARES,
+    UNREAL_LANE_MAX_WAIT,
+)
+from .breaker import CircuitBreaker, CircuitOpenError
+from .deadlines import current_deadline
+from .heartbeat import run_heartbeat
+from .sweeper import run_sweeper
+from .lanes import BULK, NORMAL, LaneScheduler, lane_for
+from .limiter import AIMDLimiter
+from .mirror import MIRRORED_READS, LevelMirror, is_whole_level
+from .multiplexer import Multiplexer
+from .timeouts import TimeoutPolicy
+from .batching import COALESCED_COMMANDS, LatestWinsWrites, WriteCoalescer, latest_wins_key
+from .reads import READ_ONLY_COMMANDS, ResponseCache, SingleFlight, read_key
+from .protocol import (
+    BATCH_COMMAND,
+    FRAME_HEADER,
+    FRAMING_LEGACY,
+    MAX_FRAME_SIZE,
+    NEGOTIATE_COMMAND,
+    JsonArrayItems,
+    JsonMessageScanner,
+    UnrealConnectionClosed,
+    UnrealTimeout,
+    batch_params,
+    encode_command,
+    encode_frame,
+    read_frame,
+    recv_frame,
+)
 from mcp.server.fastmcp import FastMCP
 
 # Configure logging with more detailed format
@@ -20,237 +84,1238 @@ logging.basicConfig(
 logger = logging.getLogger("UnrealMCP")
 
 
+def _normalize_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert error replies in a decoded response to the standard format."""
+    # Bodies aren't logged, only their size on receipt: listings can be
+    # megabytes, and formatting them costs as much as decoding them
+
+    # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
+    if response.get("status") == "error":
+        error_message = response.get("error") or response.get(
+            "message", "Unknown Unreal error"
+        )
+        logger.error(f"Unreal error (status=error): {error_message}")
+        # We want to preserve the original error structure but ensure error is accessible
+        if "error" not in response:
+            response["error"] = error_message
+    elif response.get("success") is False:
+        # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
+        error_message = response.get("error") or response.get(
+            "message", "Unknown Unreal error"
+        )
+        logger.error(f"Unreal error (success=false): {error_message}")
+        # Convert to the standard format expected by higher layers
+        response = {"status": "error", "error": error_message}
+
+    return response
+
+
+# (command, params) pair sent as part of a batch
+BatchCommand = Tuple[str, Optional[Dict[str, Any]]]
+
+
+def _batch_chunks(commands: Sequence[BatchCommand]) -> List[Sequence[BatchCommand]]:
+    """Split a command list into batches the plugin runs in one game thread task."""
+    return [
+        commands[start:start + UNREAL_MAX_BATCH_SIZE]
+        for start in range(0, len(commands), UNREAL_MAX_BATCH_SIZE)
+    ]
+
+
+def _batch_unsupported(response: Dict[str, Any]) -> bool:
+    """Whether the plugin rejected a batch because it predates the command."""
+    return response.get("error") == f"Unknown command: {BATCH_COMMAND}"
+
+
+def _batch_failed(results: List[Dict[str, Any]]) -> bool:
+    return any(result.get("status") == "error" for result in results)
+
+
+def _batch_results(response: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """Split a batch response into one normalized response per sub-command."""
+    if response.get("status") == "error":
+        # The batch as a whole failed (timeout, lost connection...), so every
+        # sub-command shares its error
+        return [dict(response) for _ in range(count)]
+
+    results = (response.get("result") or {}).get("results") or []
+    if len(results) != count:
+        error = f"Batch returned {len(results)} results for {count} commands"
+        return [{"status": "error", "error": error} for _ in range(count)]
+    return [_normalize_response(result) for result in results]
+
+
+def _make_breaker(name: str) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        UNREAL_BREAKER_FAILURE_THRESHOLD,
+        UNREAL_BREAKER_BASE_BACKOFF,
+        UNREAL_BREAKER_MAX_BACKOFF,
+    )
+
+
+def _make_timeout_policy() -> TimeoutPolicy:
+    return TimeoutPolicy(
+        UNREAL_SOCKET_TIMEOUT,
+        UNREAL_MIN_TIMEOUT,
+        UNREAL_MAX_TIMEOUT,
+        UNREAL_COMMAND_TIMEOUTS,
+    )
+
+
+def _make_lane_scheduler(name: str, limit: int) -> LaneScheduler:
+    return LaneScheduler(name, limit, UNREAL_LANE_SHARES, UNREAL_LANE_MAX_WAIT)
+
+
+def _negotiation_result(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Protocol options accepted by the plugin in reply to a negotiation request.
+
+    Older plugin builds reply with an unknown command error, meaning none.
+    """
+    if response.get("status") == "success":
+        return response.get("result") or {}
+    return {}
+
+
+def _deadline_exceeded(command: str) -> Dict[str, Any]:
+    logger.warning(f"Deadline exceeded waiting for Unreal to answer {command}")
+    return {"status": "error", "error": f"Deadline exceeded waiting for Unreal to answer {command}"}
+
+
 class UnrealConnection:
-    """Connection to an Unreal Engine instance."""
+    """Pooled connection to an Unreal Engine instance.
 
-    def __init__(self):
+    Sockets are kept open across commands and handed out one per command, so
+    concurrent callers never share a socket. Idle sockets are health checked on
+    checkout; if the plugin closed a reused socket the command is retried once
+    on a fresh one, which is the old connect-per-command behavior.
+
+    Each new socket negotiates length-prefixed framing with the plugin. Plugin
+    builds that don't support it answer with an unknown command error, after
+    which the connection sticks to legacy bare JSON messages.
+    """
+
+    def __init__(self, pool_size: int = UNREAL_POOL_SIZE):
         """Initialize the connection."""
-        self.socket = None
+        self.pool_size = pool_size
         self.connected = False
+        # Framing supported by the plugin, None until the first negotiation
+        self.framing: Optional[str] = None
+        self._framed_sockets = set()
+        self._idle: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self.breaker = _make_breaker("sync")
+        self.timeouts = _make_timeout_policy()
 
-    def connect(self) -> bool:
-        """Connect to the Unreal Engine instance."""
-        try:
-            # Close any existing socket
-            if self.socket:
-                try:
-                    self.socket.close()
-                except:
-                    pass
-                self.socket = None
-
-            logger.info(f"Connecting to Unreal at {UNREAL_HOST}:{UNREAL_PORT}...")
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5)  # 5 second timeout
+    def _open_socket(self) -> Tuple[socket.socket, bool]:
+        """Open a new socket to the Unreal Engine instance.
 
+        Returns the socket and whether it already carried an exchange.
+        """
+        logger.info(f"Connecting to Unreal at {UNREAL_HOST}:{UNREAL_PORT}...")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(UNREAL_SOCKET_TIMEOUT)
+
+        try:
             # Set socket options for better stability
-            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
             # Set larger buffer sizes
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+
+            sock.connect((UNREAL_HOST, UNREAL_PORT))
+            negotiated = self._negotiate(sock)
+        except Exception:
+            self._close_socket(sock)
+            raise
+
+        logger.info("Connected to Unreal Engine")
+        return sock, negotiated
+
+    def _negotiate(self, sock: socket.socket) -> bool:
+        """Ask the plugin to switch a new socket to framed messages.
+
+        Returns whether a negotiation exchange took place on the socket.
+        """
+        if UNREAL_FRAMING == FRAMING_LEGACY or self.framing == FRAMING_LEGACY:
+            return False
+
+        sock.sendall(encode_command(NEGOTIATE_COMMAND, {"framing": UNREAL_FRAMING}))
+        response = json.loads(self.receive_full_response(sock).decode("utf-8"))
+
+        if _negotiation_result(response).get("framing") == UNREAL_FRAMING:
+            self._framed_sockets.add(sock)
+            self.framing = UNREAL_FRAMING
+        else:
+            logger.info("Unreal plugin does not support framing, using legacy messages")
+            self.framing = FRAMING_LEGACY
+        return True
+
+    @staticmethod
+    def _is_alive(sock: socket.socket) -> bool:
+        """Check that an idle socket is still open without sending anything."""
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return True
+            # An idle socket should have nothing to read: either the peer
+            # closed it or there are stray bytes we can't match to a command.
+            return False
+        except (OSError, ValueError):
+            return False
+
+    def _checkout(self) -> Tuple[socket.socket, bool]:
+        """Take a socket from the pool, opening one if none is idle.
 
-            self.socket.connect((UNREAL_HOST, UNREAL_PORT))
+        Returns the socket and whether it was used before, in which case the
+        plugin may have closed it since.
+        """
+        if not self._slots.acquire(timeout=UNREAL_SOCKET_TIMEOUT):
+            raise Exception("Timed out waiting for a free Unreal connection")
+
+        try:
+            while True:
+                with self._lock:
+                    sock = self._idle.pop() if self._idle else None
+                if sock is None:
+                    break
+                if self._is_alive(sock):
+                    return sock, True
+                logger.debug("Discarding stale pooled connection")
+                self._close_socket(sock)
+
+            sock, used = self._open_socket()
             self.connected = True
-            logger.info("Connected to Unreal Engine")
+            return sock, used
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, sock: socket.socket, reusable: bool = True):
+        """Return a socket to the pool, or close it if it can't be reused."""
+        try:
+            if reusable:
+                with self._lock:
+                    if len(self._idle) < self.pool_size:
+                        self._idle.append(sock)
+                        return
+            self._close_socket(sock)
+        finally:
+            self._slots.release()
+
+    def _close_socket(self, sock: socket.socket):
+        self._framed_sockets.discard(sock)
+        try:
+            sock.close()
+        except:
+            pass
+
+    def connect(self) -> bool:
+        """Open a connection to the Unreal Engine instance and add it to the pool."""
+        try:
+            self.breaker.check()
+            try:
+                sock, _ = self._checkout()
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            self._checkin(sock)
             return True
 
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            return False
         except Exception as e:
             logger.error(f"Failed to connect to Unreal: {e}")
             self.connected = False
             return False
 
     def disconnect(self):
-        """Disconnect from the Unreal Engine instance."""
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-        self.socket = None
+        """Close every pooled connection to the Unreal Engine instance."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sock in idle:
+            self._close_socket(sock)
         self.connected = False
 
-    def receive_full_response(self, sock, buffer_size=4096) -> bytes:
-        """Receive a complete response from Unreal, handling chunked data."""
-        chunks = []
-        sock.settimeout(5)  # 5 second timeout
+    def receive_full_response(
+        self, sock, buffer_size=65536, timeout: float = UNREAL_SOCKET_TIMEOUT
+    ) -> bytes:
+        """Receive a complete legacy response from Unreal, handling chunked data.
+
+        Legacy messages have no framing, so the end of the message is found by
+        scanning the chunks as they arrive; the caller parses the result once.
+        """
+        scanner = JsonMessageScanner()
+        sock.settimeout(timeout)
         try:
             while True:
                 chunk = sock.recv(buffer_size)
                 if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                chunks.append(chunk)
-
-                # Process the data received so far
-                data = b"".join(chunks)
-                decoded_data = data.decode("utf-8")
-
-                # Try to parse as JSON to check if complete
-                try:
-                    json.loads(decoded_data)
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # Not complete JSON yet, continue reading
+                    if not scanner.buffer:
+                        raise UnrealConnectionClosed(
+                            "Connection closed before receiving data"
+                        )
+                    raise Exception("Connection closed before the response was complete")
+
+                end = scanner.feed(chunk)
+                if end < 0:
                     logger.debug(f"Received partial response, waiting for more data...")
                     continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    continue
+
+                data = scanner.buffer
+                if end < len(data):
+                    logger.warning(
+                        f"Discarding {len(data) - end} unexpected bytes after response"
+                    )
+                    del data[end:]
+                logger.info(f"Received complete response ({len(data)} bytes)")
+                return data
         except socket.timeout:
             logger.warning("Socket timeout during receive")
-            if chunks:
-                # If we have some data already, try to use it
-                data = b"".join(chunks)
-                try:
-                    json.loads(data.decode("utf-8"))
-                    logger.info(
-                        f"Using partial response after timeout ({len(data)} bytes)"
-                    )
-                    return data
-                except:
-                    pass
-            raise Exception("Timeout receiving Unreal response")
+            raise UnrealTimeout()
         except Exception as e:
             logger.error(f"Error during receive: {str(e)}")
             raise
 
     def send_command(
-        self, command: str, params: Dict[str, Any] = None
+        self, command: str, params: Dict[str, Any] = None, timeout: float = None
     ) -> Optional[Dict[str, Any]]:
-        """Send a command to Unreal Engine and get the response."""
-        # Always reconnect for each command, since Unreal closes the connection after each command
-        # This is different from Unity which keeps connections alive
-        if self.socket:
+        """Send a command to Unreal Engine and get the response.
+
+        ``timeout`` overrides the response timeout learned for the command.
+        """
+        timeout = timeout or self.timeouts.timeout_for(command)
+        try:
+            self.breaker.check()
+            started = time.perf_counter()
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
+                response_data = self._exchange(encode_command(command, params), timeout)
+                response = json.loads(response_data.decode("utf-8"))
+            except Exception as e:
+                if isinstance(e, UnrealTimeout):
+                    self.timeouts.expired(command, timeout)
+                self.breaker.record_failure()
+                raise
+            self.timeouts.observe(command, time.perf_counter() - started)
+            self.breaker.record_success()
+            return _normalize_response(response)
+
+        except CircuitOpenError as e:
+            return {"status": "error", "error": str(e)}
+        except Exception as e:
+            logger.error(f"Error sending command: {e}")
+            return {"status": "error", "error": str(e)}
+
+    def send_batch(
+        self,
+        commands: Sequence[BatchCommand],
+        stop_on_error: bool = False,
+        timeout: float = None,
+    ) -> List[Dict[str, Any]]:
+        """Send (command, params) pairs in as few round trips as possible.
+
+        Returns one response per command, in order. With ``stop_on_error``,
+        commands after the first failure are not run and report a "skipped"
+        status. ``timeout`` overrides the timeout for each batch sent.
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in _batch_chunks(commands):
+            if stop_on_error and _batch_failed(results):
+                results.extend({"status": "skipped"} for _ in chunk)
+                continue
+
+            response = self.send_command(
+                BATCH_COMMAND,
+                batch_params(chunk, stop_on_error),
+                timeout or self.timeouts.timeout_for_batch(command for command, _ in chunk),
+            )
+            if not _batch_unsupported(response):
+                results.extend(_batch_results(response, len(chunk)))
+                continue
+
+            # Older plugin builds: run the commands one at a time
+            for command, params in chunk:
+                if stop_on_error and _batch_failed(results):
+                    results.append({"status": "skipped"})
+                else:
+                    results.append(self.send_command(command, params))
+        return results
+
+    def _exchange(self, payload: bytes, timeout: float = UNREAL_SOCKET_TIMEOUT) -> bytes:
+        """Send one encoded command on a pooled socket and read its response."""
+        # A pooled socket may have been closed by the plugin since it was last
+        # used (older plugin builds close after every command). In that case
+        # nothing was executed, so retry once on a freshly opened socket.
+        for attempt in range(2):
+            sock, reused = self._checkout()
+            try:
+                logger.info(f"Sending command: {payload.decode('utf-8')}")
+                sock.settimeout(timeout)
+                if sock in self._framed_sockets:
+                    sock.sendall(encode_frame(payload))
+                    response_data = recv_frame(sock)
+                else:
+                    sock.sendall(payload)
+                    response_data = self.receive_full_response(sock, timeout=timeout)
+            except socket.timeout:
+                self._checkin(sock, reusable=False)
+                raise UnrealTimeout()
+            except (UnrealConnectionClosed, ConnectionError) as e:
+                self._checkin(sock, reusable=False)
+                if reused and attempt == 0:
+                    logger.info(f"Pooled connection was closed by Unreal ({e}), reconnecting")
+                    continue
+                self.connected = False
+                raise
+            except Exception:
+                # Timeouts or partial reads leave the stream in an unknown state
+                self._checkin(sock, reusable=False)
+                raise
+
+            self._checkin(sock)
+            return response_data
+
+
+class _AsyncStream:
+    """An open asyncio stream to Unreal and its negotiated framing."""
+
+    __slots__ = ("reader", "writer", "framed")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.framed = False
 
-        if not self.connect():
-            logger.error("Failed to connect to Unreal Engine for command")
-            return None
+    def is_alive(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
 
+    def close(self):
         try:
-            # Match Unity's command format exactly
-            command_obj = {
-                "type": command,  # Use "type" instead of "command"
-                "params": params or {},  # Use Unity's params or {} pattern
-            }
+            self.writer.close()
+        except:
+            pass
 
-            # Send without newline, exactly like Unity
-            command_json = json.dumps(command_obj)
-            logger.info(f"Sending command: {command_json}")
-            self.socket.sendall(command_json.encode("utf-8"))
 
-            # Read response using improved handler
-            response_data = self.receive_full_response(self.socket)
-            response = json.loads(response_data.decode("utf-8"))
+class AsyncUnrealConnection:
+    """Asyncio connection to an Unreal Engine instance.
 
-            # Log complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
+    Has the same command/response semantics as UnrealConnection, including the
+    stream pool, framing negotiation and retry on a stale pooled stream, but
+    never blocks the event loop, so concurrent tool calls overlap while the
+    editor is busy with a slow command. Commands wait for a stream, or an
+    in-flight slot, in priority lanes (see ``lanes``).
 
-            # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get(
-                    "message", "Unknown Unreal error"
-                )
-                logger.error(f"Unreal error (status=error): {error_message}")
-                # We want to preserve the original error structure but ensure error is accessible
-                if "error" not in response:
-                    response["error"] = error_message
-            elif response.get("success") is False:
-                # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
-                error_message = response.get("error") or response.get(
-                    "message", "Unknown Unreal error"
+    When the plugin supports pipelining, every command goes over one shared
+    stream instead: each request carries an ``id`` that the plugin echoes back,
+    so many commands can be in flight and a reader task matches responses to
+    waiting callers in whatever order they arrive. How many is learned from
+    response latencies (see ``limiter``). The pool is only used with
+    plugin builds that can't pipeline.
+
+    With ``coalesce_writes``, fire-and-forget writes are held back briefly and
+    sent together as one batch (see ``WriteCoalescer``). Any other command
+    flushes them first, so commands still reach the editor in call order.
+    With ``latest_wins``, a transform or viewport write waiting behind another
+    to the same target is replaced by a newer one (see ``LatestWinsWrites``).
+    With ``single_flight``, identical concurrent reads share one request (see
+    ``SingleFlight``), and with ``cache_reads`` recent read responses are
+    reused until a write invalidates them (see ``ResponseCache``).
+
+    A copy of the level kept current from actor write responses (see
+    ``LevelMirror``) answers spatial queries and transform lookups, and with
+    ``mirror_level`` actor listings and searches too.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = UNREAL_POOL_SIZE,
+        coalesce_writes: bool = UNREAL_COALESCE_WRITES,
+        latest_wins: bool = UNREAL_LATEST_WINS,
+        single_flight: bool = UNREAL_SINGLE_FLIGHT,
+        cache_reads: bool = bool(UNREAL_CACHE_TTLS),
+        mirror_level: bool = UNREAL_MIRROR_LEVEL,
+    ):
+        """Initialize the connection."""
+        self.pool_size = pool_size
+        self.connected = False
+        # Protocol options supported by the plugin, None until the first negotiation
+        self.framing: Optional[str] = None
+        self.pipelining: Optional[bool] = None
+        self.cancellation: Optional[bool] = None
+        self._idle: List[_AsyncStream] = []
+        self._slots = _make_lane_scheduler("pool", pool_size)
+        self._pipeline: Optional[Multiplexer] = None
+        self._pipeline_lock = asyncio.Lock()
+        self.breaker = _make_breaker("async")
+        self.timeouts = _make_timeout_policy()
+        # Outlives each pipelined stream, so a reconnect starts from what was learned
+        self.limiter = AIMDLimiter(
+            "pipeline", UNREAL_INITIAL_IN_FLIGHT, UNREAL_MIN_IN_FLIGHT, UNREAL_MAX_IN_FLIGHT
+        )
+        self._coalescer: Optional[WriteCoalescer] = None
+        if coalesce_writes:
+            self._coalescer = WriteCoalescer(
+                lambda commands: self._send_batch(commands, lane=NORMAL),
+                UNREAL_COALESCE_WINDOW,
+                UNREAL_COALESCE_MAX_SIZE,
+            )
+        self._latest_wins: Optional[LatestWinsWrites] = None
+        if latest_wins:
+            self._latest_wins = LatestWinsWrites(
+                lambda command, params, deadline: self._send_followed(
+                    command, params, deadline=deadline
                 )
-                logger.error(f"Unreal error (success=false): {error_message}")
-                # Convert to the standard format expected by higher layers
-                response = {"status": "error", "error": error_message}
+            )
+        self._single_flight: Optional[SingleFlight] = SingleFlight() if single_flight else None
+        self.cache: Optional[ResponseCache] = None
+        if cache_reads:
+            self.cache = ResponseCache(UNREAL_CACHE_MAX_ENTRIES, UNREAL_CACHE_TTLS)
+        # Only seeded once something reads it, so it costs nothing until then
+        self.mirror = LevelMirror(UNREAL_MIRROR_MAX_AGE, UNREAL_SPATIAL_CELL_SIZE)
+        self.mirror_reads = mirror_level
+        self._mirror_lock = asyncio.Lock()
+
+    async def _open_stream(self) -> Tuple[_AsyncStream, bool]:
+        """Open a new stream to the Unreal Engine instance.
+
+        Returns the stream and whether it already carried an exchange.
+        """
+        logger.info(f"Connecting to Unreal at {UNREAL_HOST}:{UNREAL_PORT}...")
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(UNREAL_HOST, UNREAL_PORT, limit=65536),
+            UNREAL_SOCKET_TIMEOUT,
+        )
+        stream = _AsyncStream(reader, writer)
+
+        try:
+            # Set socket options for better stability
+            sock = writer.get_extra_info("socket")
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            negotiated = await asyncio.wait_for(self._negotiate(stream), UNREAL_SOCKET_TIMEOUT)
+        except asyncio.TimeoutError:
+            stream.close()
+            raise Exception("Timeout negotiating protocol with Unreal")
+        except BaseException:
+            stream.close()
+            raise
+
+        logger.info("Connected to Unreal Engine")
+        return stream, negotiated
+
+    async def _negotiate(self, stream: _AsyncStream) -> bool:
+        """Ask the plugin to switch a new stream to framed messages.
+
+        Returns whether a negotiation exchange took place on the stream.
+        """
+        if UNREAL_FRAMING == FRAMING_LEGACY or self.framing == FRAMING_LEGACY:
+            self.pipelining = False
+            self.cancellation = False
+            return False
+
+        request = {
+            "framing": UNREAL_FRAMING,
+            "pipelining": UNREAL_PIPELINING,
+            "cancellation": UNREAL_PIPELINING,
+        }
+        stream.writer.write(encode_command(NEGOTIATE_COMMAND, request))
+        await stream.writer.drain()
+        result = _negotiation_result(json.loads(await self._receive_legacy(stream)))
+
+        if result.get("framing") == UNREAL_FRAMING:
+            stream.framed = True
+            self.framing = UNREAL_FRAMING
+            self.pipelining = UNREAL_PIPELINING and result.get("pipelining") is True
+            self.cancellation = self.pipelining and result.get("cancellation") is True
+        else:
+            logger.info("Unreal plugin does not support framing, using legacy messages")
+            self.framing = FRAMING_LEGACY
+            self.pipelining = False
+            self.cancellation = False
+        return True
+
+    async def _checkout(self, lane: str = NORMAL) -> Tuple[_AsyncStream, bool]:
+        """Take a stream from the pool for a command in ``lane``, opening one if none is idle.
+
+        Returns the stream and whether it was used before, in which case the
+        plugin may have closed it since.
+        """
+        try:
+            await asyncio.wait_for(self._slots.acquire(lane), UNREAL_SOCKET_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise Exception("Timed out waiting for a free Unreal connection")
+
+        try:
+            stream = self._take_idle()
+            if stream is not None:
+                return stream, True
+
+            stream, used = await self._open_stream()
+            self.connected = True
+            return stream, used
+        except BaseException:
+            self._slots.release(lane)
+            raise
+
+    def _take_idle(self) -> Optional[_AsyncStream]:
+        """Pop a live stream from the pool, discarding stale ones."""
+        while self._idle:
+            stream = self._idle.pop()
+            if stream.is_alive():
+                return stream
+            logger.debug("Discarding stale pooled connection")
+            stream.close()
+        return None
 
-            # Always close the connection after command is complete
-            # since Unreal will close it on its side anyway
+    def _checkin(self, stream: _AsyncStream, reusable: bool = True, lane: str = NORMAL):
+        """Return a stream to the pool, or close it if it can't be reused."""
+        self._add_idle(stream) if reusable else stream.close()
+        self._slots.release(lane)
+
+    def _add_idle(self, stream: _AsyncStream):
+        if len(self._idle) < self.pool_size:
+            self._idle.append(stream)
+        else:
+            stream.close()
+
+    async def _get_pipeline(self) -> Optional[Multiplexer]:
+        """Return the multiplexer for the shared pipelined stream, opening it if needed.
+
+        Returns None if the plugin can't pipeline.
+        """
+        async with self._pipeline_lock:
+            if self._pipeline is not None and self._pipeline.is_alive():
+                return self._pipeline
+            if self.pipelining is False:
+                return None
+
+            # Promote a warm spare if there is one
+            stream = self._take_idle() if self.pipelining else None
+            if stream is None:
+                stream, _ = await self._open_stream()
+            self.connected = True
+            if not self.pipelining:
+                # Keep the negotiated stream for one-command-at-a-time use
+                self._add_idle(stream)
+                return None
+
+            self._pipeline = Multiplexer(
+                stream,
+                _make_lane_scheduler("pipeline", UNREAL_MAX_IN_FLIGHT),
+                self._pipeline_closed,
+                self.timeouts.observe,
+                cancellation=self.cancellation,
+                limiter=self.limiter,
+            )
+            return self._pipeline
+
+    def _pipeline_closed(self, pipeline: Multiplexer):
+        if self._pipeline is pipeline:
+            self._pipeline = None
+            self.connected = False
+            if self.cache is not None:
+                # The editor may have restarted, possibly with another level
+                self.cache.clear()
+            self.mirror.invalidate()
+
+    async def connect(self) -> bool:
+        """Open a connection to the Unreal Engine instance."""
+        try:
+            self.breaker.check()
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+                if await self._get_pipeline() is None:
+                    stream, _ = await self._checkout()
+                    self._checkin(stream)
+            except asyncio.CancelledError:
+                self.breaker.release()
+                raise
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return True
+
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            return False
+        except Exception as e:
+            logger.error(f"Failed to connect to Unreal: {e}")
             self.connected = False
+            return False
+
+    async def warm_up(self):
+        """Make sure the next command won't have to wait for a connect.
+
+        Opens the pipelined stream if it isn't open, and keeps one spare
+        negotiated stream in the pool to replace it if it drops (or to serve
+        the next command when the plugin can't pipeline).
+        """
+        if self.pipelining is not False:
+            await self._get_pipeline()
+
+        spare = self._take_idle()
+        if spare is None:
+            spare, _ = await self._open_stream()
+            self.connected = True
+        self._add_idle(spare)
+
+    def disconnect(self):
+        """Close every connection to the Unreal Engine instance."""
+        if self._coalescer is not None:
+            self._coalescer.discard("Disconnected from Unreal before the command was sent")
+        idle, self._idle = self._idle, []
+        for stream in idle:
+            stream.close()
+        if self._pipeline is not None:
+            self._pipeline.close()
+        if self.cache is not None:
+            self.cache.clear()
+        self.mirror.invalidate()
+        self.connected = False
+
+    async def _receive_legacy(self, stream: _AsyncStream) -> bytes:
+        """Receive a complete unframed response."""
+        scanner = JsonMessageScanner()
+        while True:
+            chunk = await stream.reader.read(65536)
+            if not chunk:
+                if not scanner.buffer:
+                    raise UnrealConnectionClosed("Connection closed before receiving data")
+                raise Exception("Connection closed before the response was complete")
+
+            end = scanner.feed(chunk)
+            if end >= 0:
+                data = scanner.buffer
+                if end < len(data):
+                    logger.warning(
+                        f"Discarding {len(data) - end} unexpected bytes after response"
+                    )
+                    del data[end:]
+                return data
+
+    async def _receive_frame(self, stream: _AsyncStream) -> bytes:
+        """Receive one length-prefixed response."""
+        return await read_frame(stream.reader)
+
+    async def _exchange(
+        self, payload: bytes, timeout: float = UNREAL_SOCKET_TIMEOUT, lane: str = NORMAL
+    ) -> bytes:
+        """Send one encoded command on a pooled stream and read its response."""
+        for attempt in range(2):
+            stream, reused = await self._checkout(lane)
+            try:
+                logger.info(f"Sending command: {payload.decode('utf-8')}")
+                stream.writer.write(encode_frame(payload) if stream.framed else payload)
+                await stream.writer.drain()
+                receive = self._receive_frame if stream.framed else self._receive_legacy
+                response_data = await asyncio.wait_for(receive(stream), timeout)
+            except (UnrealConnectionClosed, ConnectionError) as e:
+                self._checkin(stream, reusable=False, lane=lane)
+                if reused and attempt == 0:
+                    logger.info(f"Pooled connection was closed by Unreal ({e}), reconnecting")
+                    continue
+                self.connected = False
+                raise
+            except asyncio.TimeoutError:
+                self._checkin(stream, reusable=False, lane=lane)
+                raise UnrealTimeout()
+            except BaseException:
+                # Errors and cancellation leave the stream in an unknown state
+                self._checkin(stream, reusable=False, lane=lane)
+                raise
 
+            self._checkin(stream, lane=lane)
+            logger.info(f"Received complete response ({len(response_data)} bytes)")
+            return response_data
+
+    async def _request(
+        self, command: str, params: Dict[str, Any], timeout: float, lane: str
+    ) -> Dict[str, Any]:
+        """Send a command on the pipelined stream if possible, else on a pooled one."""
+        if self.pipelining is not False:
+            pipeline = await self._get_pipeline()
+            if pipeline is not None:
+                return await pipeline.submit(command, params, timeout, lane)
+
+        response_data = await self._exchange(encode_command(command, params), timeout, lane)
+        return json.loads(response_data.decode("utf-8"))
+
+    async def send_command(
+        self,
+        command: str,
+        params: Dict[str, Any] = None,
+        timeout: float = None,
+        deadline: float = None,
+        lane: str = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a command to Unreal Engine and get the response.
+
+        ``timeout`` overrides the response timeout learned for the command.
+        ``deadline`` is the event loop time by which the whole exchange,
+        connecting included, must finish; it defaults to the deadline of the
+        MCP request being handled (see ``deadlines``). ``lane`` overrides the
+        command's default priority lane.
+        """
+        if deadline is None:
+            deadline = current_deadline()
+        if command not in READ_ONLY_COMMANDS:
+            self._note_write(command, params)
+        # Only commands sent the default way are held back or shared
+        shareable = timeout is None and lane is None
+
+        try:
+            if self._coalescer is not None:
+                if command in COALESCED_COMMANDS and timeout is None:
+                    async with asyncio.timeout_at(deadline):
+                        return await self._coalescer.submit(command, params)
+                await self._coalescer.flush()
+
+            if self._latest_wins is not None and shareable:
+                key = latest_wins_key(command, params)
+                if key is not None:
+                    return await self._latest_wins.submit(key, command, params, deadline)
+
+            if self.mirror_reads and command in MIRRORED_READS and shareable:
+                return await self._send_mirrored_read(command, params, deadline)
+
+            read = read_key(command, params)
+            if read is not None and shareable:
+                return await self._send_read(read, command, params, deadline)
+        except asyncio.TimeoutError:
+            return _deadline_exceeded(command)
+        return await self._send_followed(command, params, timeout, deadline, lane)
+
+    async def _send_mirrored_read(
+        self, command: str, params: Dict[str, Any], deadline: Optional[float]
+    ) -> Dict[str, Any]:
+        """Answer a read from the level mirror, resyncing it first if needed.
+
+        A stale mirror is only resynced for a read of the whole level; narrower
+        reads are cheaper for the editor to answer itself.
+        """
+        if self.mirror.needs_sync() and (
+            not is_whole_level(command, params) or not await self.resync_mirror(deadline=deadline)
+        ):
+            return await self._send_read(read_key(command, params), command, params, deadline)
+        return self.mirror.answer(command, params)
+
+    async def resync_mirror(self, force: bool = False, deadline: float = None) -> bool:
+        """Reseed the level mirror from the editor if it is stale, or always with ``force``.
+
+        Returns whether the mirror is current. The listing is streamed (see
+        ``stream_actors``). One that a followed write may have overtaken isn't
+        used, so this returns False if one lands while it is in flight, as
+        well as on errors.
+        """
+        if deadline is None:
+            deadline = current_deadline()
+        try:
+            async with asyncio.timeout_at(deadline):
+                async with self._mirror_lock:
+                    if not force and not self.mirror.needs_sync():
+                        return True
+                    generation = self.mirror.generation
+                    actors = [actor async for actor in self.stream_actors()]
+                    return self.mirror.seed(actors, generation)
+        except asyncio.TimeoutError:
+            return False
+        except Exception as e:
+            logger.warning(f"Could not resync the level mirror: {e}")
+            return False
+
+    async def _current_level(
+        self, params: Dict[str, Any] = None
+    ) -> Tuple[Optional[LevelMirror], Optional[Dict[str, Any]]]:
+        """The level mirror if it can be brought up to date, else a snapshot of the level.
+
+        The snapshot is of the actors get_actors_in_level lists for ``params``,
+        streamed from the editor. Returns None and an error response if the
+        level couldn't be listed.
+        """
+        if not self.mirror.needs_sync() or await self.resync_mirror():
+            return self.mirror, None
+
+        try:
+            async with asyncio.timeout_at(current_deadline()):
+                actors = [actor async for actor in self.stream_actors(params)]
+        except asyncio.TimeoutError:
+            return None, _deadline_exceeded("get_actors_in_level")
+        except Exception as e:
+            return None, {"status": "error", "error": str(e)}
+        return LevelMirror.snapshot(actors, UNREAL_SPATIAL_CELL_SIZE), None
+
+    async def query_level(self, query: Callable[[LevelMirror], Any]) -> Dict[str, Any]:
+        """Run ``query`` against the current actors in the level.
+
+        Returns a response in the plugin's format with the query's result, or
+        with the message of a ValueError it raises (e.g. for a missing actor).
+        """
+        # Spatial queries only look at where actors are and what they are
+        level, error = await self._current_level({"fields": ["name", "class", "location"]})
+        if level is None:
+            return error
+        try:
+            return {"status": "success", "result": query(level)}
+        except ValueError as e:
+            return {"status": "error", "error": str(e)}
+
+    async def get_actor_transform(self, name: str) -> Dict[str, Any]:
+        """Location, rotation and scale of one actor, from the level mirror if possible."""
+        level, error = await self._current_level({"name_pattern": name})
+        if level is None:
+            return error
+        actor = level.get_actor(name)
+        if actor is None:
+            return {"status": "error", "error": f"Actor not found: {name}"}
+        return {"status": "success", "result": actor}
+
+    async def delete_expired(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a delete_actors sweep of expired temporary actors (see ``sweeper``).
+
+        Unlike send_command, cached reads and the level mirror are only
+        updated once actors were actually deleted, and only for those actors,
+        so a sweep that finds nothing to delete costs readers nothing.
+        """
+        response = await self._send_command("delete_actors", params)
+        if response.get("status") != "success":
             return response
+        deleted = (response.get("result") or {}).get("deleted")
+        if deleted:
+            params = {"names": deleted}
+            self._note_write("delete_actors", params)
+            self.mirror.apply("delete_actors", params, response)
+        return response
+
+    async def _send_followed(
+        self,
+        command: str,
+        params: Dict[str, Any] = None,
+        timeout: float = None,
+        deadline: float = None,
+        lane: str = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a command, updating the level mirror from its response."""
+        response = await self._send_command(command, params, timeout, deadline, lane)
+        self.mirror.apply(command, params, response)
+        return response
+
+    async def _send_read(
+        self, key, command: str, params: Dict[str, Any], deadline: Optional[float]
+    ) -> Dict[str, Any]:
+        """Answer a shareable read from the cache, or a request shared with identical reads."""
+        cacheable = self.cache is not None and self.cache.cacheable(command)
+        if cacheable:
+            response = self.cache.get(key)
+            if response is not None:
+                return response
+            generation = self.cache.generation
+
+        if self._single_flight is not None:
+            # Callers with other deadlines may join, so only the command's
+            # timeout bounds the shared request; each caller stops waiting
+            # at its own deadline
+            response = await self._single_flight.submit(
+                key, lambda: self._send_command(command, params), deadline
+            )
+        else:
+            response = await self._send_command(command, params, deadline=deadline)
+
+        if cacheable:
+            self.cache.put(key, command, params, response, generation)
+        return response
+
+    def _note_write(self, command: str, params: Optional[Dict[str, Any]]):
+        """Keep reads sent before a write from answering callers after it."""
+        if self._single_flight is not None:
+            self._single_flight.invalidate()
+        if self.cache is not None:
+            self.cache.invalidate(command, params)
+        self.mirror.note_write(command, params)
+
+    async def _send_command(
+        self,
+        command: str,
+        params: Dict[str, Any] = None,
+        timeout: float = None,
+        deadline: float = None,
+        lane: str = None,
+    ) -> Optional[Dict[str, Any]]:
+        timeout = timeout or self.timeouts.timeout_for(command)
+        lane = lane or lane_for(command)
+        if deadline is not None and deadline <= asyncio.get_running_loop().time():
+            return _deadline_exceeded(command)
+        try:
+            self.breaker.check()
+            started = time.perf_counter()
+            try:
+                async with asyncio.timeout_at(deadline) as scope:
+                    response = await self._request(command, params, timeout, lane)
+            except asyncio.CancelledError:
+                self.breaker.release()
+                raise
+            except Exception as e:
+                if scope.expired():
+                    # The caller ran out of time, which says nothing about Unreal
+                    self.breaker.release()
+                    return _deadline_exceeded(command)
+                if isinstance(e, UnrealTimeout):
+                    self.timeouts.expired(command, timeout)
+                self.breaker.record_failure()
+                raise
+            self.timeouts.observe(command, time.perf_counter() - started)
+            self.breaker.record_success()
+            return _normalize_response(response)
 
+        except CircuitOpenError as e:
+            return {"status": "error", "error": str(e)}
         except Exception as e:
             logger.error(f"Error sending command: {e}")
-            # Always reset connection state on any error
-            self.connected = False
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
             return {"status": "error", "error": str(e)}
 
+    async def stream_actors(
+        self, params: Dict[str, Any] = None, timeout: float = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the actors in the level while the listing is still arriving.
+
+        Takes the same ``params`` as get_actors_in_level. Actors are decoded a
+        chunk at a time as the response is read (see ``JsonArrayItems``), so
+        memory use doesn't grow with the level. The listing always comes from
+        the editor, on a pooled stream held until it has been read or the
+        generator is closed. ``timeout`` bounds the wait for each chunk.
+        Raises if Unreal answers with an error.
+        """
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+        timeout = timeout or self.timeouts.timeout_for("get_actors_in_level")
+        payload = encode_command("get_actors_in_level", params or {})
+
+        self.breaker.check()
+        try:
+            stream, _ = await self._checkout(BULK)
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+
+        reusable = False
+        try:
+            try:
+                stream.writer.write(encode_frame(payload) if stream.framed else payload)
+                await stream.writer.drain()
+                parser = JsonArrayItems("actors")
+                async with aclosing(self._response_chunks(stream, timeout)) as chunks:
+                    async for chunk in chunks:
+                        for actor in parser.feed(chunk):
+                            yield actor
+                        if parser.done:
+                            break
+            except (UnrealConnectionClosed, UnrealTimeout, ConnectionError):
+                self.connected = False
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Includes the consumer closing the generator early
+                self.breaker.release()
+                raise
+            self.breaker.record_success()
+
+            if not parser.done:
+                raise Exception("Response ended before the listing was complete")
+            # Bytes after the message would desync the next response
+            reusable = not parser.trailing
+            response = _normalize_response(parser.envelope())
+            if response.get("status") == "error":
+                raise Exception(response["error"])
+        finally:
+            self._checkin(stream, reusable=reusable, lane=BULK)
+
+    async def _response_chunks(self, stream: _AsyncStream, timeout: float) -> AsyncIterator[bytes]:
+        """Read one response from a stream in chunks, without buffering it whole."""
+        remaining = None
+        try:
+            if stream.framed:
+                header = await asyncio.wait_for(
+                    stream.reader.readexactly(FRAME_HEADER.size), timeout
+                )
+                (remaining,) = FRAME_HEADER.unpack(header)
+                if remaining > MAX_FRAME_SIZE:
+                    raise Exception(f"Frame of {remaining} bytes exceeds the {MAX_FRAME_SIZE} limit")
+
+            while remaining is None or remaining > 0:
+                size = 65536 if remaining is None else min(65536, remaining)
+                chunk = await asyncio.wait_for(stream.reader.read(size), timeout)
+                if not chunk:
+                    raise UnrealConnectionClosed("Connection closed before the response was complete")
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        except asyncio.IncompleteReadError:
+            raise UnrealConnectionClosed("Connection closed before receiving data")
+        except asyncio.TimeoutError:
+            raise UnrealTimeout()
+
+    async def send_batch(
+        self,
+        commands: Sequence[BatchCommand],
+        stop_on_error: bool = False,
+        timeout: float = None,
+        deadline: float = None,
+        lane: str = BULK,
+    ) -> List[Dict[str, Any]]:
+        """Send (command, params) pairs in as few round trips as possible.
+
+        Returns one response per command, in order. With ``stop_on_error``,
+        commands after the first failure are not run and report a "skipped"
+        status. ``timeout`` overrides the timeout for each batch sent, and
+        ``deadline`` and ``lane`` work as for send_command.
+        """
+        if deadline is None:
+            deadline = current_deadline()
+        for command, params in commands:
+            if command not in READ_ONLY_COMMANDS:
+                self._note_write(command, params)
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+        return await self._send_batch(commands, stop_on_error, timeout, deadline, lane)
+
+    async def _send_batch(
+        self,
+        commands: Sequence[BatchCommand],
+        stop_on_error: bool = False,
+        timeout: float = None,
+        deadline: float = None,
+        lane: str = BULK,
+    ) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for chunk in _batch_chunks(commands):
+            if stop_on_error and _batch_failed(results):
+                results.extend({"status": "skipped"} for _ in chunk)
+                continue
+
+            response = await self._send_command(
+                BATCH_COMMAND,
+                batch_params(chunk, stop_on_error),
+                timeout or self.timeouts.timeout_for_batch(command for command, _ in chunk),
+                deadline,
+                lane,
+            )
+            if not _batch_unsupported(response):
+                chunk_results = _batch_results(response, len(chunk))
+                for (command, params), result in zip(chunk, chunk_results):
+                    self.mirror.apply(command, params, result)
+                results.extend(chunk_results)
+                continue
+
+            # Older plugin builds: run the commands one at a time
+            for command, params in chunk:
+                if stop_on_error and _batch_failed(results):
+                    results.append({"status": "skipped"})
+                else:
+                    response = await self._send_followed(
+                        command, params, deadline=deadline, lane=lane
+                    )
+                    results.append(response)
+        return results
+
 
 # Global connection state
 _unreal_connection: UnrealConnection = None
+_async_unreal_connection: AsyncUnrealConnection = None
 
 
 def get_unreal_connection() -> Optional[UnrealConnection]:
-    """Get the connection to Unreal Engine."""
+    """Get the connection to Unreal Engine.
+
+    Sockets are opened by the first command that needs one, so a command
+    that can't reach Unreal is reported to the circuit breaker once. The
+    connection is kept while Unreal is unreachable, so its breaker can make
+    later commands fail fast with a clear error.
+    """
     global _unreal_connection
     try:
         if _unreal_connection is None:
             _unreal_connection = UnrealConnection()
-            if not _unreal_connection.connect():
-                logger.warning("Could not connect to Unreal Engine")
-                _unreal_connection = None
-        else:
-            # Verify connection is still valid with a ping-like test
-            try:
-                # Simple test by sending an empty buffer to check if socket is still connected
-                _unreal_connection.socket.sendall(b"\x00")
-                logger.debug("Connection verified with ping test")
-            except Exception as e:
-                logger.warning(f"Existing connection failed: {e}")
-                _unreal_connection.disconnect()
-                _unreal_connection = None
-                # Try to reconnect
-                _unreal_connection = UnrealConnection()
-                if not _unreal_connection.connect():
-                    logger.warning("Could not reconnect to Unreal Engine")
-                    _unreal_connection = None
-                else:
-                    logger.info("Successfully reconnected to Unreal Engine")
-
         return _unreal_connection
     except Exception as e:
         logger.error(f"Error getting Unreal connection: {e}")
         return None
 
 
+async def get_async_unreal_connection() -> Optional[AsyncUnrealConnection]:
+    """Get the asyncio connection to Unreal Engine used by the MCP tools.
+
+    Like get_unreal_connection, this doesn't connect; the connection is kept
+    when Unreal is unreachable and its circuit breaker decides when to try again.
+    """
+    global _async_unreal_connection
+    try:
+        if _async_unreal_connection is None:
+            _async_unreal_connection = AsyncUnrealConnection()
+        return _async_unreal_connection
+    except Exception as e:
+        logger.error(f"Error getting Unreal connection: {e}")
+        return None
+
+
+async def _connect_on_startup():
+    """Connect to Unreal without holding up server startup.
+
+    Retries on the UNREAL_STARTUP_RETRY_DELAYS schedule; after that the
+    heartbeat keeps trying.
+    """
+    for delay in (0, *UNREAL_STARTUP_RETRY_DELAYS):
+        await asyncio.sleep(delay)
+        try:
+            unreal = await get_async_unreal_connection()
+            if unreal and await unreal.connect():
+                logger.info("Connected to Unreal Engine on startup")
+                return
+        except Exception as e:
+            logger.error(f"Error connecting to Unreal Engine on startup: {e}")
+    logger.warning("Could not connect to Unreal Engine on startup")
+
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
-    """Handle server startup and shutdown."""
-    global _unreal_connection
+    """Handle server startup and shutdown.
+
+    Connecting to Unreal happens in the background, so the MCP handshake,
+    tool list and prompts are served at once even if the editor isn't running.
+    """
+    global _unreal_connection, _async_unreal_connection
     logger.info("UnrealMCP server starting up")
-    try:
-        _unreal_connection = get_unreal_connection()
-        if _unreal_connection:
-            logger.info("Connected to Unreal Engine on startup")
-        else:
-            logger.warning("Could not connect to Unreal Engine on startup")
-    except Exception as e:
-        logger.error(f"Error connecting to Unreal Engine on startup: {e}")
-        _unreal_connection = None
+    background = [asyncio.create_task(_connect_on_startup())]
+    if UNREAL_HEARTBEAT_INTERVAL > 0:
+        background.append(
+            asyncio.create_task(
+                run_heartbeat(get_async_unreal_connection, UNREAL_HEARTBEAT_INTERVAL)
+            )
+        )
+    if UNREAL_SWEEP_INTERVAL > 0:
+        background.append(
+            asyncio.create_task(
+                run_sweeper(
+                    get_async_unreal_connection, UNREAL_SWEEP_INTERVAL, UNREAL_SWEEP_BATCH_SIZE
+                )
+            )
+        )
 
     try:
         yield {}
     finally:
+        for task in background:
+            task.cancel()
+        if _async_unreal_connection:
+            _async_unreal_connection.disconnect()
+            _async_unreal_connection = None
         if _unreal_connection:
             _unreal_connection.disconnect()
             _unreal_connection = None
@@ -0,0 +1,45 @@
+"""
+Deadlines for the Unreal commands sent while handling an MCP request.
+
+An MCP client stops waiting for a tool call after its own timeout, or cancels
+it outright. Unreal work done for the call after that is wasted, and commands
+queued behind it in the editor wait for nothing. Every command sent while
+handling one request therefore shares a deadline, fixed when the first of them
+is sent. A client can choose the budget per call with a numeric ``timeout``
+(seconds) in the request's ``_meta``.
+
+Cancellation needs no bookkeeping here: the MCP server cancels the handler's
+task, and the CancelledError unwinds through the connection, which tells the
+plugin to drop the command if it hasn't started it.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+
+from mcp.server.lowlevel.server import request_ctx
+
+from .constants import UNREAL_TOOL_DEADLINE
+
+# Event loop time by which the current request needs its answer
+_deadline: ContextVar[Optional[float]] = ContextVar("unreal_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    """Loop time by which the MCP request being handled needs its answer.
+
+    None outside a request, e.g. for the heartbeat.
+    """
+    deadline = _deadline.get()
+    if deadline is not None:
+        return deadline
+
+    context = request_ctx.get(None)
+    if context is None:
+        return None
+    budget = getattr(context.meta, "timeout", None)
+    if not isinstance(budget, (int, float)) or budget <= 0:
+        budget = UNREAL_TOOL_DEADLINE
+    deadline = asyncio.get_running_loop().time() + budget
+    _deadline.set(deadline)
+    return deadline
@@ -0,0 +1,47 @@
+"""
+Background heartbeat for the connection to Unreal Engine.
+
+Runs for the lifetime of the MCP server. Every interval it sends a real
+``ping`` command, records the round trip time and, while Unreal is reachable,
+keeps a connection warm so the first tool call after an idle period doesn't
+pay for a connect. When the circuit breaker is open the ping fails fast, and
+once its backoff has passed the heartbeat acts as the recovery probe.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from .metrics import metrics
+
+logger = logging.getLogger("UnrealMCP")
+
+
+async def run_heartbeat(get_connection: Callable[[], Awaitable[Any]], interval: float):
+    """Ping Unreal every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            unreal = await get_connection()
+            if unreal is None:
+                continue
+
+            started = time.perf_counter()
+            response = await unreal.send_command("ping")
+            rtt = time.perf_counter() - started
+
+            if response.get("status") == "success":
+                metrics.increment("heartbeat.ok")
+                metrics.set_gauge("heartbeat.rtt_ms", round(rtt * 1000, 3))
+                metrics.set_gauge("heartbeat.last_ok", time.time())
+                await unreal.warm_up()
+            else:
+                metrics.increment("heartbeat.failed")
+                logger.debug(f"Heartbeat ping failed: {response.get('error')}")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            metrics.increment("heartbeat.failed")
+            logger.warning(f"Heartbeat error: {e}")
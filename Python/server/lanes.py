@@ -0,0 +1,191 @@
+"""
+Priority lanes for commands sent to Unreal.
+
+The editor runs commands one at a time on its game thread, so a bulk job that
+queues thousands of writes would make a user waiting on ``focus_viewport``
+sit behind all of them. Commands are sorted into three lanes, highest priority
+first: interactive, normal and bulk. ``LaneScheduler`` hands out the limited
+send slots (in-flight commands on the pipelined stream, or pooled streams) to
+the highest lane with a command waiting. Each lane may only hold a share of
+the slots, so lower lanes can't crowd out higher ones once they are running,
+and a command that has waited longer than ``max_wait`` goes next whatever its
+lane, so higher lanes can't starve lower ones either.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from .metrics import metrics
+from .protocol import BATCH_COMMAND
+
+# Lanes, highest priority first
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BULK = "bulk"
+LANES = (INTERACTIVE, NORMAL, BULK)
+
+# Commands a user is typically waiting on to see a result
+INTERACTIVE_COMMANDS = frozenset(
+    {
+        "find_actors_by_name",
+        "focus_viewport",
+        "get_actor_properties",
+        "ping",
+        "take_screenshot",
+    }
+)
+
+# Commands that carry many operations at once
+BULK_COMMANDS = frozenset({BATCH_COMMAND, "delete_actors", "set_actor_transforms"})
+
+
+def lane_for(command: str) -> str:
+    """Default lane for a command type."""
+    if command in INTERACTIVE_COMMANDS:
+        return INTERACTIVE
+    if command in BULK_COMMANDS:
+        return BULK
+    return NORMAL
+
+
+class LaneScheduler:
+    """Counting semaphore that admits waiters by lane priority.
+
+    ``shares`` gives the fraction of ``limit`` each lane may hold at once (at
+    least one slot). Per lane, the ``lanes.<name>.<lane>.queued`` and
+    ``.in_flight`` gauges track queue depth and slots held, ``.wait_ms`` is an
+    EWMA of the time spent waiting for a slot, and ``.promoted`` counts
+    commands sent ahead of a higher lane because they had waited too long.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        shares: Dict[str, float],
+        max_wait: float,
+        alpha: float = 0.2,
+    ):
+        self.name = name
+        self.shares = shares
+        self.limit = limit
+        self.lane_limits = self._lane_limits(limit)
+        self.max_wait = max_wait
+        self.alpha = alpha
+        self._active = dict.fromkeys(LANES, 0)
+        self._total = 0
+        # Per lane: (loop time queued, future resolved when a slot is granted)
+        self._waiting: Dict[str, Deque[Tuple[float, asyncio.Future]]] = {
+            lane: deque() for lane in LANES
+        }
+        self._wait_ewma: Dict[str, Optional[float]] = dict.fromkeys(LANES)
+        self._closed: Optional[Exception] = None
+
+    async def acquire(self, lane: str):
+        """Wait for a slot in ``lane``."""
+        if self._closed is not None:
+            raise self._closed
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting[lane].append((loop.time(), future))
+        self._dispatch()
+        if future.done():
+            return
+
+        self._publish(lane)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the caller gave up
+                self.release(lane)
+            else:
+                self._forget(lane, future)
+            raise
+
+    def release(self, lane: str):
+        """Return a slot taken by ``acquire``."""
+        self._active[lane] -= 1
+        self._total -= 1
+        self._publish(lane)
+        self._dispatch()
+
+    def saturated(self) -> bool:
+        """Whether any command is waiting for a slot."""
+        return any(self._waiting.values())
+
+    def resize(self, limit: int):
+        """Change the total number of slots.
+
+        Slots already taken beyond a smaller limit are kept until released.
+        """
+        if limit == self.limit:
+            return
+        self.limit = limit
+        self.lane_limits = self._lane_limits(limit)
+        self._dispatch()
+
+    def close(self, error: Exception):
+        """Fail every waiter, and any later acquire, with ``error``."""
+        self._closed = error
+        for lane in LANES:
+            waiting, self._waiting[lane] = self._waiting[lane], deque()
+            for _, future in waiting:
+                if not future.done():
+                    future.set_exception(error)
+            self._publish(lane)
+
+    def _lane_limits(self, limit: int) -> Dict[str, int]:
+        return {lane: max(1, int(limit * self.shares.get(lane, 1.0))) for lane in LANES}
+
+    def _forget(self, lane: str, future: asyncio.Future):
+        waiting = self._waiting[lane]
+        for entry in waiting:
+            if entry[1] is future:
+                waiting.remove(entry)
+                break
+        self._publish(lane)
+
+    def _next_lane(self, now: float) -> Optional[str]:
+        eligible = [
+            lane
+            for lane in LANES
+            if self._waiting[lane] and self._active[lane] < self.lane_limits[lane]
+        ]
+        if not eligible:
+            return None
+
+        # Whatever has waited too long goes first, oldest first
+        overdue = [lane for lane in eligible if now - self._waiting[lane][0][0] >= self.max_wait]
+        if overdue:
+            lane = min(overdue, key=lambda lane: self._waiting[lane][0][0])
+            if lane != eligible[0]:
+                metrics.increment(f"lanes.{self.name}.{lane}.promoted")
+            return lane
+        return eligible[0]
+
+    def _dispatch(self):
+        """Grant free slots to waiters in priority order."""
+        now = asyncio.get_running_loop().time()
+        while self._total < self.limit:
+            lane = self._next_lane(now)
+            if lane is None:
+                return
+
+            queued_at, future = self._waiting[lane].popleft()
+            self._active[lane] += 1
+            self._total += 1
+            future.set_result(None)
+
+            waited = now - queued_at
+            ewma = self._wait_ewma[lane]
+            ewma = waited if ewma is None else ewma + self.alpha * (waited - ewma)
+            self._wait_ewma[lane] = ewma
+            metrics.set_gauge(f"lanes.{self.name}.{lane}.wait_ms", round(ewma * 1000, 3))
+            self._publish(lane)
+
+    def _publish(self, lane: str):
+        metrics.set_gauge(f"lanes.{self.name}.{lane}.queued", len(self._waiting[lane]))
+        metrics.set_gauge(f"lanes.{self.name}.{lane}.in_flight", self._active[lane])
@@ -0,0 +1,105 @@
+"""
+Adaptive limit on the commands in flight to Unreal.
+
+The plugin hands every command to the editor's game thread and waits for it
+there, one at a time. Up to a point, more commands in flight hide round trips;
+past it they only wait in the editor's queue, adding latency without adding
+throughput. ``AIMDLimiter`` finds that point the way TCP congestion control
+does: additive increase while latencies stay near their baseline,
+multiplicative decrease when they climb or a command times out.
+"""
+
+import time
+from typing import Dict
+
+from .metrics import metrics
+
+
+class AIMDLimiter:
+    """Additive-increase/multiplicative-decrease concurrency limit.
+
+    Command types differ by orders of magnitude in latency, so each keeps its
+    own baseline (its lowest recent latency). The latency gradient is the
+    smoothed ratio of baseline to observed latency: near 1 when nothing
+    queues, falling as commands wait behind each other. While it stays above
+    ``tolerance`` and commands are waiting for a slot, the limit grows by one
+    per limit's worth of responses; below it, or on a timeout, the limit is multiplied by
+    ``backoff``, at most once per ``cooldown`` seconds.
+
+    The limit and gradient are kept in the ``limiter.<name>.limit`` and
+    ``limiter.<name>.gradient`` gauges.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        tolerance: float = 0.5,
+        backoff: float = 0.7,
+        cooldown: float = 1.0,
+        slack: float = 0.005,
+        alpha: float = 0.2,
+        drift: float = 0.001,
+    ):
+        self.name = name
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.cooldown = cooldown
+        # Latency differences below this are jitter, not queueing (seconds)
+        self.slack = slack
+        self.alpha = alpha
+        # How fast a baseline follows latencies above it, so it can recover
+        # from an unusually fast sample or a slower editor
+        self.drift = drift
+        self.gradient = 1.0
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._publish()
+
+    def observe(self, command: str, latency: float, saturated: bool) -> int:
+        """Record a response that took ``latency`` seconds.
+
+        ``saturated`` says whether other commands were waiting for a slot.
+        Returns the new limit.
+        """
+        baseline = self._baselines.get(command, latency)
+        if latency < baseline:
+            baseline = latency
+        else:
+            baseline += self.drift * (latency - baseline)
+        self._baselines[command] = baseline
+
+        sample = (baseline + self.slack) / (latency + self.slack)
+        self.gradient += self.alpha * (sample - self.gradient)
+
+        if self.gradient < self.tolerance:
+            self._decrease()
+        elif saturated:
+            # Only grow a limit that is holding commands back
+            self.limit = min(self.limit + 1 / self.limit, float(self.maximum))
+        self._publish()
+        return int(self.limit)
+
+    def dropped(self) -> int:
+        """Record a command that timed out. Returns the new limit."""
+        self._decrease()
+        self._publish()
+        return int(self.limit)
+
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.limit * self.backoff, float(self.minimum))
+        # Judge the smaller limit on fresh samples
+        self.gradient = 1.0
+
+    def _publish(self):
+        metrics.set_gauge(f"limiter.{self.name}.limit", int(self.limit))
+        metrics.set_gauge(f"limiter.{self.name}.gradient", round(self.gradient, 3))
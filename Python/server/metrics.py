@@ -0,0 +1,37 @@
+"""
+In-process metrics for the Unreal client.
+
+Counters and gauges are kept in one process-wide registry and read back as a
+snapshot, e.g. by the ``get_unreal_metrics`` tool.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict
+
+
+class Metrics:
+    """Thread-safe registry of named counters and gauges."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(int)
+        self._gauges: Dict[str, Any] = {}
+
+    def increment(self, name: str, value: float = 1):
+        """Add to a counter, creating it at zero if needed."""
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: Any):
+        """Record the current value of a gauge."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of every counter and gauge."""
+        with self._lock:
+            return {"counters": dict(self._counters), "gauges": dict(self._gauges)}
+
+
+metrics = Metrics()
@@ -0,0 +1,288 @@
+"""
+Client-side mirror of the actors in the editor's current level.
+
+Listing or searching the level costs a game thread hop and a response that
+grows with the level. ``LevelMirror`` is seeded from a ``get_actors_in_level``
+listing, streamed so the response is never held whole, and then kept current
+from the responses to the actor writes sent through the connection, so
+``get_actors_in_level``, ``find_actors_by_name`` and transform lookups can be
+answered locally.
+
+The mirror also keeps a spatial index of actor locations (see ``spatial``),
+so radius, box and nearest-actor queries don't need the whole level either.
+
+Changes the mirror can't see, such as edits made by hand in the editor, are
+corrected by a resync once the mirror is older than its maximum age. A write
+whose effect on the level is unknown makes the mirror resync before it
+answers again.
+"""
+
+import bisect
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .metrics import metrics
+from .reads import LEVEL, write_tags
+from .spatial import GridIndex
+
+# Fields of an actor as listed by get_actors_in_level
+ACTOR_FIELDS = ("name", "class", "location", "rotation", "scale")
+
+# Writes whose responses carry the affected actor's new state
+ACTOR_STATE_COMMANDS = frozenset({"create_actor", "set_actor_transform", "spawn_blueprint_actor"})
+
+# Writes whose responses carry a list of affected actors' new states
+ACTOR_LIST_COMMANDS = frozenset({"set_actor_transforms"})
+
+# Writes whose effect on the level the mirror follows
+FOLLOWED_WRITES = ACTOR_STATE_COMMANDS | ACTOR_LIST_COMMANDS | {"delete_actor", "delete_actors"}
+
+# Reads the mirror can answer
+MIRRORED_READS = frozenset({"find_actors_by_name", "get_actors_in_level"})
+
+
+def _succeeded(response: Optional[Dict[str, Any]]) -> bool:
+    return bool(response) and response.get("status") == "success"
+
+
+def is_whole_level(command: str, params: Optional[Dict[str, Any]]) -> bool:
+    """Whether a mirrored read asks for every actor in the level.
+
+    Narrower reads (searches, filters, projections and pages) cost the editor
+    less than the listing a resync needs.
+    """
+    return command == "get_actors_in_level" and not any((params or {}).values())
+
+
+def list_actors(actors: Iterable[Dict[str, Any]], params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Answer get_actors_in_level from a list of actors, like the plugin does.
+
+    Supports the same optional parameters: ``class`` and ``name_pattern``
+    filters, a ``fields`` projection, and ``limit``/``cursor`` pages in
+    case-insensitive name order, each cursor being the last name of the
+    previous page.
+    """
+    params = params or {}
+    fields = params.get("fields")
+    unknown = [field for field in fields or () if field not in ACTOR_FIELDS]
+    if unknown:
+        return {"status": "error", "error": f"Unknown actor field: {unknown[0]}"}
+    limit = params.get("limit") or 0
+    if limit < 0:
+        return {"status": "error", "error": "'limit' must not be negative"}
+
+    actor_class = (params.get("class") or "").lower()
+    pattern = (params.get("name_pattern") or "").lower()
+    matching = [
+        actor
+        for actor in actors
+        if (not actor_class or actor.get("class", "").lower() == actor_class)
+        and pattern in actor["name"].lower()
+    ]
+
+    result: Dict[str, Any] = {"total": len(matching)}
+    cursor = params.get("cursor")
+    if limit or cursor:
+        matching.sort(key=lambda actor: actor["name"].lower())
+        start = 0
+        if cursor:
+            start = bisect.bisect_right(
+                matching, cursor.lower(), key=lambda actor: actor["name"].lower()
+            )
+        end = start + limit if limit else len(matching)
+        if end < len(matching):
+            result["next_cursor"] = matching[end - 1]["name"]
+        matching = matching[start:end]
+
+    if fields:
+        result["actors"] = [
+            {field: actor[field] for field in fields if field in actor} for actor in matching
+        ]
+    else:
+        result["actors"] = [dict(actor) for actor in matching]
+    return {"status": "success", "result": result}
+
+
+class LevelMirror:
+    """Actors in the level by name, in the order the editor lists them.
+
+    Reads answered locally are counted in the ``mirror.hits`` metric and
+    resyncs in ``mirror.resyncs``.
+    """
+
+    def __init__(self, max_age: float, cell_size: float):
+        self.max_age = max_age
+        self._actors: Dict[str, Dict[str, Any]] = {}
+        self.index = GridIndex(cell_size)
+        self._synced_at: Optional[float] = None
+        # Set by a write the mirror couldn't follow
+        self._stale = True
+        # Bumped by every update, so a listing sent before one isn't used to seed after it
+        self.generation = 0
+        self._updates_since_sync = 0
+
+    def needs_sync(self) -> bool:
+        return (
+            self._stale
+            or self._synced_at is None
+            or time.monotonic() - self._synced_at > self.max_age
+        )
+
+    def seed(self, actors: Iterable[Dict[str, Any]], generation: int) -> bool:
+        """Replace the mirror with the actors of a get_actors_in_level listing.
+
+        Ignored, returning False, if the mirror was updated since the listing
+        was requested at ``generation``.
+        """
+        if generation != self.generation:
+            return False
+
+        self._load(actors)
+        self._synced_at = time.monotonic()
+        self._stale = False
+        self._updates_since_sync = 0
+        metrics.increment("mirror.resyncs")
+        metrics.set_gauge("mirror.actors", len(self._actors))
+        return True
+
+    @classmethod
+    def snapshot(cls, actors: Iterable[Dict[str, Any]], cell_size: float) -> "LevelMirror":
+        """One-off copy of the actors of a get_actors_in_level listing.
+
+        Isn't kept current, and doesn't touch the mirror metrics.
+        """
+        level = cls(0.0, cell_size)
+        level._load(actors)
+        return level
+
+    def invalidate(self):
+        """Make the next read resync first."""
+        self._stale = True
+        self.generation += 1
+
+    def note_write(self, command: str, params: Optional[Dict[str, Any]]):
+        """Record that a write is being sent, before its response arrives."""
+        if command in FOLLOWED_WRITES:
+            self.generation += 1
+            return
+        tags = write_tags(command, params or {})
+        if tags is None or LEVEL in tags:
+            self.invalidate()
+
+    def apply(self, command: str, params: Optional[Dict[str, Any]], response: Dict[str, Any]):
+        """Update the mirror from the response to a followed write."""
+        if command not in FOLLOWED_WRITES:
+            return
+        self.generation += 1
+        if not _succeeded(response):
+            # A timed out write may still have run in the editor
+            self._stale = True
+            return
+
+        params = params or {}
+        result = response.get("result") or {}
+        if command in ACTOR_STATE_COMMANDS and "name" in result:
+            self._store(result)
+        elif command in ACTOR_LIST_COMMANDS:
+            # Actors that failed (e.g. weren't found) are listed with an error instead
+            for actor in result.get("results", []):
+                if "error" not in actor and "name" in actor:
+                    self._store(actor)
+        elif command == "delete_actor":
+            deleted = result.get("deleted_actor") or {}
+            name = deleted.get("name", params.get("name"))
+            self._actors.pop(name, None)
+            self.index.remove(name)
+        elif command == "delete_actors":
+            for name in result.get("deleted", []):
+                self._actors.pop(name, None)
+                self.index.remove(name)
+        else:
+            return
+        self._updates_since_sync += 1
+        metrics.set_gauge("mirror.actors", len(self._actors))
+
+    def answer(self, command: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Response to a mirrored read, in the plugin's format."""
+        metrics.increment("mirror.hits")
+        if command == "find_actors_by_name":
+            # Same as the plugin: case-insensitive substring match
+            pattern = (params or {}).get("pattern", "").lower()
+            actors = [actor for name, actor in self._actors.items() if pattern in name.lower()]
+            return {"status": "success", "result": {"actors": [dict(actor) for actor in actors]}}
+        return list_actors(self._actors.values(), params)
+
+    def get_actor(self, name: str) -> Optional[Dict[str, Any]]:
+        """Mirrored state of one actor, or None if it isn't in the level."""
+        actor = self._actors.get(name)
+        return dict(actor) if actor is not None else None
+
+    def in_radius(
+        self, center: Sequence[float], radius: float, actor_class: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Actors within ``radius`` of ``center``, nearest first, with their distance."""
+        return self._with_distances(
+            (distance, name)
+            for distance, name in self.index.in_radius(center, radius)
+            if self._is_class(name, actor_class)
+        )
+
+    def in_box(
+        self, low: Sequence[float], high: Sequence[float], actor_class: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Actors inside the axis-aligned box from ``low`` to ``high``, in name order."""
+        names = sorted(
+            name for name in self.index.in_box(low, high) if self._is_class(name, actor_class)
+        )
+        return [dict(self._actors[name]) for name in names]
+
+    def nearest(
+        self,
+        center: Sequence[float],
+        k: int,
+        actor_class: Optional[str] = None,
+        exclude: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """The ``k`` actors nearest ``center``, nearest first, with their distance."""
+        return self._with_distances(
+            self.index.nearest(
+                center,
+                k,
+                lambda name: name != exclude and self._is_class(name, actor_class),
+            )
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """How current the mirror is."""
+        age = None if self._synced_at is None else time.monotonic() - self._synced_at
+        return {
+            "seeded": self._synced_at is not None,
+            "stale": self.needs_sync(),
+            "age_seconds": None if age is None else round(age, 3),
+            "max_age_seconds": self.max_age,
+            "actors": len(self._actors),
+            "updates_since_sync": self._updates_since_sync,
+        }
+
+    def _load(self, actors: Iterable[Dict[str, Any]]):
+        self._actors = {}
+        self.index.clear()
+        for actor in actors:
+            self._store(actor)
+
+    def _store(self, actor: Dict[str, Any]):
+        name = actor["name"]
+        self._actors[name] = {field: actor[field] for field in ACTOR_FIELDS if field in actor}
+        if "location" in actor:
+            self.index.update(name, actor["location"])
+        else:
+            self.index.remove(name)
+
+    def _is_class(self, name: str, actor_class: Optional[str]) -> bool:
+        # Class names compare case-insensitively, like the plugin's create_actor types
+        return actor_class is None or self._actors[name].get("class", "").lower() == actor_class.lower()
+
+    def _with_distances(self, found) -> List[Dict[str, Any]]:
+        return [
+            dict(self._actors[name], distance=round(distance, 3)) for distance, name in found
+        ]
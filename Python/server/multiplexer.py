@@ -0,0 +1,214 @@
+"""
+Multiplexing concurrent commands over one pipelined Unreal connection.
+
+Tool handlers run concurrently, but a stream must only ever be written by one
+task at a time. ``Multiplexer`` owns a stream negotiated for pipelining: callers
+submit commands to a queue and get a future back, a single writer task frames
+and sends queued commands, and a single reader task resolves futures by the
+request id the plugin echoes, in whatever order responses arrive. Callers
+take an in-flight slot from a ``LaneScheduler`` before their command is
+queued, so commands are sent in priority order. With an ``AIMDLimiter``, the
+number of slots follows the limit it learns from response latencies.
+
+When a caller gives up on a command that was already sent, and the plugin
+negotiated cancellation, a ``cancel`` message for its request id is written
+straight away so the editor can drop it if it hasn't started running it yet.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .lanes import LaneScheduler
+from .limiter import AIMDLimiter
+from .metrics import metrics
+from .protocol import (
+    CANCEL_COMMAND,
+    CANCELLED_ERROR,
+    UnrealConnectionClosed,
+    UnrealTimeout,
+    encode_command,
+    encode_frame,
+    read_frame,
+)
+
+logger = logging.getLogger("UnrealMCP")
+
+# Queued command: (command, params, future for its response, lane)
+QueuedCommand = Tuple[str, Optional[Dict[str, Any]], asyncio.Future, str]
+
+
+class Multiplexer:
+    """Single owner of one pipelined stream, shared by every caller.
+
+    At most ``slots.limit`` commands are sent before their responses come
+    back, so a burst of calls queues here instead of piling up in the editor.
+    A command whose caller gave up keeps its slot until the editor answers,
+    since the editor may still be working on it; ``on_late_response`` is told
+    how long it really took. With ``cancellation``, the editor is asked to
+    drop such commands, and answers the ones it had not started with an error.
+    """
+
+    def __init__(
+        self,
+        stream,
+        slots: LaneScheduler,
+        on_close: Callable[["Multiplexer"], None] = None,
+        on_late_response: Callable[[str, float], None] = None,
+        cancellation: bool = False,
+        limiter: Optional[AIMDLimiter] = None,
+    ):
+        self.stream = stream
+        self.closed = False
+        self.cancellation = cancellation
+        self._on_close = on_close
+        self._on_late_response = on_late_response
+        self._queue: "asyncio.Queue[QueuedCommand]" = asyncio.Queue()
+        # Request id -> (future, command, time sent, lane)
+        self._in_flight: Dict[int, Tuple[asyncio.Future, str, float, str]] = {}
+        self._slots = slots
+        self._limiter = limiter
+        if limiter is not None:
+            slots.resize(int(limiter.limit))
+        self._request_ids = itertools.count(1)
+        self._writer_task = asyncio.create_task(self._write_loop())
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    def is_alive(self) -> bool:
+        return not self.closed and self.stream.is_alive()
+
+    async def submit(
+        self, command: str, params: Optional[Dict[str, Any]], timeout: float, lane: str
+    ) -> Dict[str, Any]:
+        """Queue a command in ``lane`` and wait up to ``timeout`` seconds for its response."""
+        if self.closed:
+            raise UnrealConnectionClosed("Connection closed by Unreal")
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            async with asyncio.timeout(timeout):
+                await self._slots.acquire(lane)
+                self._queue.put_nowait((command, params, future, lane))
+                return await future
+        except asyncio.TimeoutError:
+            self._cancel(future)
+            if self._limiter is not None:
+                self._slots.resize(self._limiter.dropped())
+            raise UnrealTimeout()
+        except asyncio.CancelledError:
+            self._cancel(future)
+            raise
+
+    def _cancel(self, future: asyncio.Future):
+        """Ask the editor to drop an abandoned command that was already sent.
+
+        Commands still queued here are skipped by the writer instead.
+        """
+        if not self.cancellation or self.closed:
+            return
+        for request_id, (pending, command, _, _) in self._in_flight.items():
+            if pending is future:
+                break
+        else:
+            return
+
+        logger.debug(f"Cancelling {command} (request {request_id})")
+        metrics.increment("pipeline.cancels_sent")
+        try:
+            # A single synchronous write can't interleave with the writer task's frames
+            self.stream.writer.write(
+                encode_frame(encode_command(CANCEL_COMMAND, {"id": request_id}))
+            )
+        except Exception as e:
+            logger.debug(f"Could not send cancel for request {request_id}: {e}")
+
+    async def _write_loop(self):
+        """Send queued commands in order, the only task that writes the stream."""
+        writer = self.stream.writer
+        try:
+            while True:
+                command, params, future, lane = await self._queue.get()
+                if future.done():
+                    # The caller gave up while the command was still queued
+                    self._slots.release(lane)
+                    continue
+
+                request_id = next(self._request_ids)
+                self._in_flight[request_id] = (future, command, time.perf_counter(), lane)
+
+                payload = encode_command(command, params, request_id)
+                logger.info(f"Sending command: {payload.decode('utf-8')}")
+                writer.write(encode_frame(payload))
+                # Let frames for a burst of commands go out together
+                if self._queue.empty():
+                    await writer.drain()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error writing to Unreal: {e}")
+            self._shutdown(ConnectionError(f"Lost connection to Unreal: {e}"))
+
+    async def _read_loop(self):
+        """Resolve in-flight commands as their responses arrive, in any order."""
+        error: Exception = UnrealConnectionClosed("Connection closed by Unreal")
+        try:
+            while True:
+                response = json.loads(await read_frame(self.stream.reader))
+                request_id = response.pop("id", None)
+                entry = self._in_flight.pop(request_id, None)
+                if entry is None:
+                    logger.warning(f"Dropping response to unknown request {request_id}")
+                    continue
+
+                future, command, sent_at, lane = entry
+                latency = time.perf_counter() - sent_at
+                if self._limiter is not None:
+                    saturated = self._slots.saturated()
+                    self._slots.resize(self._limiter.observe(command, latency, saturated))
+                self._slots.release(lane)
+                if not future.done():
+                    future.set_result(response)
+                    continue
+                logger.debug(f"Dropping response to abandoned request {request_id}")
+                if response.get("error") == CANCELLED_ERROR:
+                    # Dropped before it ran, so its latency says nothing
+                    continue
+                if self._on_late_response is not None:
+                    self._on_late_response(command, latency)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+            if not isinstance(e, UnrealConnectionClosed):
+                logger.error(f"Pipelined connection to Unreal failed: {e}")
+        finally:
+            self._shutdown(ConnectionError(f"Lost connection to Unreal: {error}"))
+
+    def _shutdown(self, error: Exception):
+        if self.closed:
+            return
+        self.closed = True
+        current = asyncio.current_task()
+        for task in (self._writer_task, self._reader_task):
+            if task is not current:
+                task.cancel()
+        self.stream.close()
+
+        self._slots.close(error)
+        waiting = [entry[0] for entry in self._in_flight.values()]
+        self._in_flight.clear()
+        while not self._queue.empty():
+            waiting.append(self._queue.get_nowait()[2])
+        for future in waiting:
+            if not future.done():
+                future.set_exception(error)
+
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def close(self):
+        """Close the stream, failing every queued and in-flight command."""
+        self._shutdown(UnrealConnectionClosed("Disconnected from Unreal"))
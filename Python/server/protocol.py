@@ -0,0 +1,397 @@
+"""
+Wire protocol helpers for talking to the UnrealMCP plugin.
+
+Commands are JSON objects. Older plugin builds exchange bare JSON with no
+framing, so the end of a message can only be found by parsing it. Newer builds
+support length-prefixed frames: a 4-byte big-endian payload length followed by
+the UTF-8 JSON payload. Framing is negotiated per socket with the
+``negotiate_protocol`` command, which is always sent unframed. The same
+negotiation tells the client whether the plugin echoes the optional request
+``id``, which allows many commands to be in flight on one socket, and whether
+it accepts ``cancel`` messages naming the id of a command that hasn't started
+running yet; the plugin answers a cancelled command with ``CANCELLED_ERROR``.
+
+A ``batch`` command carries an ordered list of sub-commands that the plugin
+runs in one game thread task, replying with an ordered list of responses.
+
+For legacy messages, ``JsonMessageScanner`` finds the end of the message in a
+single pass over the received bytes so the payload only has to be parsed once.
+``JsonArrayItems`` goes further for large listings, decoding the items of one
+array as they arrive instead of parsing the message whole.
+"""
+
+import asyncio
+import json
+import re
+import socket
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Framing modes
+FRAMING_LEGACY = "legacy"
+FRAMING_LENGTH_PREFIXED = "length_prefixed"
+
+NEGOTIATE_COMMAND = "negotiate_protocol"
+BATCH_COMMAND = "batch"
+CANCEL_COMMAND = "cancel"
+
+# Error the plugin answers a cancelled command with
+CANCELLED_ERROR = "Cancelled before execution"
+
+FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 256 * 1024 * 1024  # Refuse absurd lengths from a desynced stream
+
+
+class UnrealConnectionClosed(Exception):
+    """Raised when Unreal closes a socket before sending any response data."""
+
+
+class UnrealTimeout(Exception):
+    """Raised when a response doesn't arrive within the command's timeout."""
+
+    def __init__(self, message: str = "Timeout receiving Unreal response"):
+        super().__init__(message)
+
+
+def encode_command(
+    command: str, params: Dict[str, Any] = None, request_id: Optional[int] = None
+) -> bytes:
+    """Encode a command in the plugin's {"type", "params"} envelope.
+
+    Plugins that support pipelining echo ``id`` back in the response.
+    """
+    command_obj = {"type": command, "params": params or {}}
+    if request_id is not None:
+        command_obj["id"] = request_id
+    return json.dumps(command_obj).encode("utf-8")
+
+
+def batch_params(
+    commands: Iterable[Tuple[str, Optional[Dict[str, Any]]]], stop_on_error: bool = False
+) -> Dict[str, Any]:
+    """Build the params of a batch command from (command, params) pairs."""
+    return {
+        "commands": [{"type": command, "params": params or {}} for command, params in commands],
+        "stop_on_error": stop_on_error,
+    }
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """Prefix a payload with its length."""
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def recv_exactly(sock: socket.socket, size: int) -> bytearray:
+    """Read exactly ``size`` bytes into a preallocated buffer."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            if received == 0:
+                raise UnrealConnectionClosed("Connection closed before receiving data")
+            raise Exception(f"Connection closed after {received} of {size} bytes")
+        received += count
+    return buffer
+
+
+def recv_frame(sock: socket.socket) -> bytearray:
+    """Read one length-prefixed frame and return its payload."""
+    (size,) = FRAME_HEADER.unpack(recv_exactly(sock, FRAME_HEADER.size))
+    if size > MAX_FRAME_SIZE:
+        raise Exception(f"Frame of {size} bytes exceeds the {MAX_FRAME_SIZE} limit")
+    try:
+        return recv_exactly(sock, size)
+    except UnrealConnectionClosed:
+        raise Exception("Connection closed after frame header")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one length-prefixed frame from an asyncio stream and return its payload."""
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            raise UnrealConnectionClosed("Connection closed before receiving data")
+        raise Exception("Connection closed inside frame header")
+
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise Exception(f"Frame of {size} bytes exceeds the {MAX_FRAME_SIZE} limit")
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as e:
+        raise Exception(f"Connection closed after {len(e.partial)} of {size} bytes")
+
+
+# Building blocks for skipping bytes that can't end a message. Quantifiers are
+# possessive so a group cut off at the end of a chunk fails without backtracking.
+_TEXT = rb'[^"{}\[\]]++'
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_FLAT_GROUP = rb"[{\[](?:" + _TEXT + rb"|" + _STRING + rb")*+[}\]]"
+_NESTED_GROUP = rb"[{\[](?:" + _TEXT + rb"|" + _STRING + rb"|" + _FLAT_GROUP + rb")*+[}\]]"
+
+# Before the message starts: skip text and whole strings up to the first bracket
+_SKIP_OUTSIDE = re.compile(rb"(?:" + _TEXT + rb"|" + _STRING + rb")*+", re.DOTALL)
+# Inside the message: balanced groups up to two levels deep (e.g. each actor in
+# a level listing) can't bring the depth to zero, so skip them whole too
+_SKIP_INSIDE = re.compile(
+    rb"(?:" + _TEXT + rb"|" + _STRING + rb"|" + _NESTED_GROUP + rb")*+", re.DOTALL
+)
+# The rest of a string body, stopping at its closing quote
+_STRING_REST = re.compile(rb'[^"\\]*+(?:\\.[^"\\]*+)*+', re.DOTALL)
+
+_QUOTE = ord('"')
+_OPENERS = (ord("{"), ord("["))
+
+
+class JsonMessageScanner:
+    """Incrementally finds the end of a bare JSON message.
+
+    Tracks bracket depth, string state and escapes across chunks in one linear
+    pass. Text, whole strings and small balanced groups are skipped by a regex,
+    so Python only steps over the outermost brackets.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: bytes) -> int:
+        """Add received bytes.
+
+        Returns the length of the complete message once its closing bracket
+        has arrived, or -1 if more data is needed.
+        """
+        self.buffer += chunk
+        buffer = self.buffer
+        size = len(buffer)
+        pos = self._pos
+
+        while pos < size:
+            if self._in_string:
+                pos = _STRING_REST.match(buffer, pos).end()
+                # Stopped at the end of the data or on a trailing backslash
+                # whose escaped character hasn't arrived yet
+                if pos >= size or buffer[pos] != _QUOTE:
+                    break
+                pos += 1
+                self._in_string = False
+                continue
+
+            skip = _SKIP_INSIDE if self._depth else _SKIP_OUTSIDE
+            pos = skip.match(buffer, pos).end()
+            if pos >= size:
+                break
+
+            char = buffer[pos]
+            pos += 1
+            if char == _QUOTE:
+                # A string that continues past the data received so far
+                self._in_string = True
+            elif char in _OPENERS:
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pos = pos
+                    return pos
+
+        self._pos = pos
+        return -1
+
+
+_STRING_TOKEN = re.compile(_STRING, re.DOTALL)
+_ENVELOPE_TEXT = re.compile(rb'[^"{}\[\]]*+')
+_WHITESPACE = re.compile(rb"[ \t\r\n]*+")
+_SEPARATORS = re.compile(rb"[ \t\r\n,]*+")
+_COLON = ord(":")
+_ARRAY_OPEN = ord("[")
+_ARRAY_CLOSE = ord("]")
+
+# JsonArrayItems states: before the array, inside it, after it, message complete
+_BEFORE, _ITEMS, _AFTER, _DONE = range(4)
+
+
+class JsonArrayItems:
+    """Incrementally decodes the items of one array in a JSON message.
+
+    Fed a message's bytes as they arrive, returns each item of the array
+    under ``key`` (e.g. the ``actors`` of a level listing) as soon as it is
+    complete. Only the item being received is buffered, so the array is never
+    held in memory whole, as bytes or decoded. Items must be objects or
+    arrays.
+
+    Everything outside the array is kept, and once ``done`` can be decoded
+    with ``envelope()``, with the array empty. A message without the array
+    (e.g. an error response) yields no items and is all envelope.
+    """
+
+    def __init__(self, key: str):
+        self._key = json.dumps(key).encode("utf-8")
+        self._state = _BEFORE
+        self._buffer = bytearray()
+        self._pos = 0
+        self._envelope = bytearray()
+        self._depth = 0
+        # Where the item being received starts in the buffer, or -1 between items
+        self._item_start = -1
+        self._item_depth = 0
+        self._in_string = False
+        # Bytes received after the end of the message
+        self.trailing = 0
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add received bytes and return the array items they complete."""
+        self._buffer += chunk
+        items: List[Any] = []
+        while self._pos < len(self._buffer) and self._state != _DONE:
+            if self._state == _ITEMS:
+                progressed = self._scan_items(items)
+            else:
+                progressed = self._scan_envelope()
+            if not progressed:
+                break
+
+        if self._state == _DONE:
+            self.trailing = len(self._buffer) - self._pos
+        self._compact()
+        return items
+
+    def envelope(self) -> Any:
+        """The message with the array left empty; only valid once ``done``."""
+        return json.loads(self._envelope)
+
+    def _scan_envelope(self) -> bool:
+        """Copy message bytes outside the array to the envelope.
+
+        Returns False if it needs more data to continue.
+        """
+        buffer, pos, size = self._buffer, self._pos, len(self._buffer)
+        start = pos
+        try:
+            while pos < size:
+                pos = _ENVELOPE_TEXT.match(buffer, pos).end()
+                if pos >= size:
+                    break
+                char = buffer[pos]
+                if char == _QUOTE:
+                    # Envelope strings are short; wait for each to arrive whole
+                    string = _STRING_TOKEN.match(buffer, pos)
+                    if string is None:
+                        return False
+                    if self._state == _BEFORE and string.group() == self._key:
+                        array = self._array_after_key(string.end())
+                        if array is None:
+                            return False
+                        if array >= 0:
+                            self._envelope += buffer[start:array] + b"[]"
+                            start = pos = array + 1
+                            self._state = _ITEMS
+                            break
+                    pos = string.end()
+                elif char in _OPENERS:
+                    self._depth += 1
+                    pos += 1
+                else:
+                    self._depth -= 1
+                    pos += 1
+                    if self._depth == 0:
+                        self._state = _DONE
+                        break
+            return True
+        finally:
+            self._envelope += buffer[start:pos]
+            self._pos = pos
+
+    def _array_after_key(self, pos: int) -> Optional[int]:
+        """Position of the array a key string at ``pos`` names.
+
+        Returns -1 if the key's value isn't an array (so it's a string
+        value, not the key), or None if more data is needed to tell.
+        """
+        buffer, size = self._buffer, len(self._buffer)
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos >= size:
+            return None
+        if buffer[pos] != _COLON:
+            return -1
+        pos = _WHITESPACE.match(buffer, pos + 1).end()
+        if pos >= size:
+            return None
+        return pos if buffer[pos] == _ARRAY_OPEN else -1
+
+    def _scan_items(self, items: List[Any]) -> bool:
+        """Decode the array items received so far.
+
+        Returns False if it needs more data to continue.
+        """
+        buffer, pos, size = self._buffer, self._pos, len(self._buffer)
+        try:
+            while pos < size:
+                if self._item_start < 0:
+                    # Whole items up to two levels deep, and the separators
+                    # between them, are skipped in one match and decoded together
+                    end = _SKIP_INSIDE.match(buffer, pos).end()
+                    if end > pos:
+                        run = bytes(buffer[pos:end]).strip(b", \t\r\n")
+                        if run:
+                            items.extend(json.loads(b"[" + run + b"]"))
+                        pos = end
+                    if pos >= size:
+                        return True
+                    char = buffer[pos]
+                    if char == _ARRAY_CLOSE:
+                        pos += 1
+                        self._state = _AFTER
+                        return True
+                    if char not in _OPENERS:
+                        raise ValueError(f"Expected an object or array in {self._key.decode()}")
+                    # An item that is deeper, or hasn't arrived whole
+                    self._item_start = pos
+                    self._item_depth = 1
+                    pos += 1
+                    continue
+
+                # Same stepping as JsonMessageScanner, relative to the item
+                if self._in_string:
+                    pos = _STRING_REST.match(buffer, pos).end()
+                    if pos >= size or buffer[pos] != _QUOTE:
+                        return False
+                    pos += 1
+                    self._in_string = False
+                    continue
+
+                pos = _SKIP_INSIDE.match(buffer, pos).end()
+                if pos >= size:
+                    return False
+                char = buffer[pos]
+                pos += 1
+                if char == _QUOTE:
+                    self._in_string = True
+                elif char in _OPENERS:
+                    self._item_depth += 1
+                else:
+                    self._item_depth -= 1
+                    if self._item_depth == 0:
+                        items.append(json.loads(buffer[self._item_start : pos]))
+                        self._item_start = -1
+            return True
+        finally:
+            self._pos = pos
+
+    def _compact(self):
+        """Drop bytes that are fully processed."""
+        keep = self._item_start if self._item_start >= 0 else self._pos
+        if keep:
+            del self._buffer[:keep]
+            self._pos -= keep
+            if self._item_start >= 0:
+                self._item_start = 0
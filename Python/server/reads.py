@@ -0,0 +1,230 @@
+"""
+Sharing responses to read-only Unreal commands.
+
+Concurrent tool calls often ask the editor the same question at once, for
+example several ``get_actors_in_level`` calls while an agent plans its next
+steps. ``SingleFlight`` sends one request for identical in-flight reads and
+hands every caller the same response. Only commands in ``SHARED_READS`` are
+shared; their identity is the command type plus canonicalized parameters.
+
+A read must not answer a caller who made a write after it was sent, so any
+command not in ``READ_ONLY_COMMANDS`` bumps a generation counter and later
+reads start a new request instead of joining one from before the write.
+
+Agents also repeat the same reads turn after turn. ``ResponseCache`` keeps
+successful responses to the commands in ``UNREAL_CACHE_TTLS`` for a short
+time, and drops them as soon as a write that could change them is sent, e.g.
+``delete_actor`` drops that actor's properties and every level listing. The
+TTL bounds staleness from changes made in the editor by hand.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, Optional, Set, Tuple
+
+from .metrics import metrics
+
+logger = logging.getLogger("UnrealMCP")
+
+# Read-only commands whose responses depend only on their parameters
+SHARED_READS = frozenset(
+    {
+        "find_actors_by_name",
+        "find_blueprint_nodes",
+        "get_actor_properties",
+        "get_actors_in_level",
+    }
+)
+
+# Commands that change nothing in the level or assets
+READ_ONLY_COMMANDS = SHARED_READS | {"ping", "take_screenshot"}
+
+# Writes that change nothing a cached read returns
+UNCACHED_EFFECT_COMMANDS = frozenset({"create_input_mapping", "focus_viewport"})
+
+# Tag of every cached read listing or searching the level's actors
+LEVEL = "level"
+
+# Tag of every cached read of one actor, for writes to actors not known by name
+ACTORS = "actors"
+
+
+def read_key(command: str, params: Optional[Dict[str, Any]]) -> Optional[Hashable]:
+    """Identity of a shareable read, or None if the command isn't one."""
+    if command not in SHARED_READS:
+        return None
+    return (command, json.dumps(params or {}, sort_keys=True, separators=(",", ":")))
+
+
+class SingleFlight:
+    """Lets identical concurrent reads share one request.
+
+    The first caller's request is sent as its own task, so a caller giving up
+    doesn't fail the others. Callers that joined are counted in the
+    ``single_flight.<command>.shared`` metric.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        # Key -> (generation when sent, future for the response)
+        self._flights: Dict[Hashable, Tuple[int, asyncio.Future]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def invalidate(self):
+        """Stop later reads from joining requests sent before now."""
+        self.generation += 1
+
+    async def submit(
+        self,
+        key: Hashable,
+        send: Callable[[], Awaitable[Dict[str, Any]]],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Return the response to the read ``key``, calling ``send`` unless
+        an identical read is already in flight."""
+        flight = self._flights.get(key)
+        if flight is not None and flight[0] == self.generation:
+            metrics.increment(f"single_flight.{key[0]}.shared")
+            future = flight[1]
+        else:
+            future = asyncio.get_running_loop().create_future()
+            flight = self._flights[key] = (self.generation, future)
+            task = asyncio.create_task(self._fly(key, flight, send))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        # Shielded, since other callers may share the response
+        async with asyncio.timeout_at(deadline):
+            return await asyncio.shield(future)
+
+    async def _fly(self, key: Hashable, flight: Tuple[int, asyncio.Future], send):
+        future = flight[1]
+        try:
+            future.set_result(await send())
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Error sending {key[0]}: {e}")
+            future.set_result({"status": "error", "error": str(e)})
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+def _read_tags(command: str, params: Dict[str, Any]) -> FrozenSet[Hashable]:
+    """What a cached read depends on."""
+    if command == "get_actor_properties":
+        return frozenset({("actor", params.get("name")), ACTORS})
+    if command == "find_blueprint_nodes":
+        return frozenset({("blueprint", params.get("blueprint_name"))})
+    return frozenset({LEVEL})
+
+
+def write_tags(command: str, params: Dict[str, Any]) -> Optional[FrozenSet[Hashable]]:
+    """What a write may change, or None if it could be anything."""
+    if command in UNCACHED_EFFECT_COMMANDS:
+        return frozenset()
+    if command in ("create_actor", "delete_actor", "set_actor_property", "set_actor_transform"):
+        return frozenset({("actor", params.get("name")), LEVEL})
+    if command == "spawn_blueprint_actor":
+        return frozenset({("actor", params.get("actor_name")), LEVEL})
+    if command == "set_actor_transforms":
+        return frozenset({("actor", name) for name in params.get("names", [])} | {LEVEL})
+    if command == "delete_actors":
+        if "pattern" in params or "tag" in params:
+            # Which actors match isn't known until the editor answers
+            return frozenset({ACTORS, LEVEL})
+        return frozenset({("actor", name) for name in params.get("names", [])} | {LEVEL})
+    if command == "create_blueprint":
+        return frozenset({("blueprint", params.get("name"))})
+    if "blueprint_name" in params:
+        return frozenset({("blueprint", params["blueprint_name"])})
+    return None
+
+
+class ResponseCache:
+    """Bounded LRU cache of read responses with per-command TTLs.
+
+    Only commands with an entry in ``ttls`` are cached. Hits, misses, LRU
+    evictions, expirations and invalidations are counted in the
+    ``cache.hits``, ``cache.misses``, ``cache.evictions``, ``cache.expired``
+    and ``cache.invalidated`` metrics, and the ``cache.entries`` gauge holds
+    the current size.
+    """
+
+    def __init__(self, max_entries: int, ttls: Dict[str, float]):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        # Bumped by every invalidation, so a read sent before a write isn't cached after it
+        self.generation = 0
+        # Key -> (monotonic expiry time, response, tags)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any], FrozenSet[Hashable]]]" = (
+            OrderedDict()
+        )
+
+    def cacheable(self, command: str) -> bool:
+        return command in self.ttls
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Cached response for a read key, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            metrics.increment("cache.expired")
+            entry = None
+        if entry is None:
+            metrics.increment("cache.misses")
+            self._publish()
+            return None
+
+        self._entries.move_to_end(key)
+        metrics.increment("cache.hits")
+        return entry[1]
+
+    def put(
+        self,
+        key: Hashable,
+        command: str,
+        params: Optional[Dict[str, Any]],
+        response: Dict[str, Any],
+        generation: int,
+    ):
+        """Cache a response to a read sent when ``generation`` was current."""
+        if generation != self.generation or response.get("status") == "error":
+            return
+        expires = time.monotonic() + self.ttls[command]
+        self._entries[key] = (expires, response, _read_tags(command, params or {}))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            metrics.increment("cache.evictions")
+        self._publish()
+
+    def invalidate(self, command: str, params: Optional[Dict[str, Any]]):
+        """Drop the cached reads a write could change."""
+        tags = write_tags(command, params or {})
+        if tags is not None and not tags:
+            return
+
+        self.generation += 1
+        if tags is None:
+            stale = list(self._entries)
+        else:
+            stale = [key for key, entry in self._entries.items() if entry[2] & tags]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            metrics.increment("cache.invalidated", len(stale))
+            self._publish()
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+        self._publish()
+
+    def _publish(self):
+        metrics.set_gauge("cache.entries", len(self._entries))
@@ -0,0 +1,236 @@
+"""
+Spatial index over actor locations.
+
+"What's near X" questions would otherwise mean listing the whole level and
+filtering it in the model's context. ``GridIndex`` buckets actor locations in
+a uniform 3D grid of cubic cells, so a radius or box query only looks at the
+cells it overlaps, and a nearest-neighbour query at rings of cells growing
+outward from the query point.
+
+Levels are sparse at the scale of a cell, so only occupied cells are stored,
+searches are clipped to the range of cells ever occupied (levels are mostly
+flat, so that range is usually a few cells deep), and a query spanning more
+cells than are occupied scans the occupied cells instead of the empty ones in
+its range.
+"""
+
+import heapq
+import math
+from itertools import product
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+Point = Tuple[float, float, float]
+Cell = Tuple[int, int, int]
+
+
+def as_point(location: Sequence[float]) -> Point:
+    """A location as an (x, y, z) tuple of floats."""
+    x, y, z = location
+    return (float(x), float(y), float(z))
+
+
+def _squared_distance(a: Point, b: Point) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+class GridIndex:
+    """Names of located things, bucketed by grid cell.
+
+    ``cell_size`` should be around the radius of a typical query: smaller
+    cells mean more dictionary lookups per query, larger ones more points
+    tested against it.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self._points: Dict[str, Point] = {}
+        self._cells: Dict[Cell, Set[str]] = {}
+        # Lowest and highest cell coordinates occupied since the last clear
+        self._low: Optional[List[int]] = None
+        self._high: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def clear(self):
+        self._points.clear()
+        self._cells.clear()
+        self._low = self._high = None
+
+    def update(self, name: str, location: Sequence[float]):
+        """Add ``name`` at ``location``, or move it there."""
+        point = as_point(location)
+        old = self._points.get(name)
+        if old is not None:
+            old_cell, cell = self._cell(old), self._cell(point)
+            self._points[name] = point
+            if old_cell != cell:
+                self._discard(old_cell, name)
+                self._add(cell, name)
+            return
+
+        self._points[name] = point
+        self._add(self._cell(point), name)
+
+    def remove(self, name: str):
+        point = self._points.pop(name, None)
+        if point is not None:
+            self._discard(self._cell(point), name)
+
+    def in_box(self, low: Sequence[float], high: Sequence[float]) -> List[str]:
+        """Names inside the axis-aligned box from ``low`` to ``high``, edges included."""
+        low, high = as_point(low), as_point(high)
+        names = []
+        for members in self._cells_between(low, high):
+            for name in members:
+                x, y, z = self._points[name]
+                if (
+                    low[0] <= x <= high[0]
+                    and low[1] <= y <= high[1]
+                    and low[2] <= z <= high[2]
+                ):
+                    names.append(name)
+        return names
+
+    def in_radius(self, center: Sequence[float], radius: float) -> List[Tuple[float, str]]:
+        """(distance, name) of everything within ``radius`` of ``center``, nearest first."""
+        center = as_point(center)
+        low = tuple(c - radius for c in center)
+        high = tuple(c + radius for c in center)
+        limit = radius * radius
+        found = []
+        for members in self._cells_between(low, high):
+            for name in members:
+                squared = _squared_distance(center, self._points[name])
+                if squared <= limit:
+                    found.append((math.sqrt(squared), name))
+        found.sort()
+        return found
+
+    def nearest(
+        self,
+        center: Sequence[float],
+        k: int,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[float, str]]:
+        """(distance, name) of the ``k`` names nearest ``center``, nearest first.
+
+        Only names for which ``accept`` returns True are considered.
+        """
+        center = as_point(center)
+        if k <= 0 or not self._points:
+            return []
+
+        origin = self._cell(center)
+        # Max-heap of the best k so far, as (-squared distance, name)
+        best: List[Tuple[float, str]] = []
+        ring = 0
+        while True:
+            spans = self._clip(origin, ring)
+            if len(spans[0]) * len(spans[1]) * len(spans[2]) > len(self._cells):
+                # The rings now cover more cells than are occupied
+                return self._nearest_by_scan(center, k, accept)
+
+            for cell in self._ring(origin, ring, spans):
+                for name in self._cells.get(cell, ()):
+                    if accept is not None and not accept(name):
+                        continue
+                    entry = (-_squared_distance(center, self._points[name]), name)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+
+            # Anything outside the rings searched is at least this far away
+            reach = ring * self.cell_size
+            covered = all(
+                span.start <= low and span.stop > high
+                for span, low, high in zip(spans, self._low, self._high)
+            )
+            if covered or (len(best) == k and -best[0][0] <= reach * reach):
+                return sorted((math.sqrt(-squared), name) for squared, name in best)
+            ring += 1
+
+    def _nearest_by_scan(self, center: Point, k: int, accept) -> List[Tuple[float, str]]:
+        return [
+            (math.sqrt(squared), name)
+            for squared, name in heapq.nsmallest(
+                k,
+                (
+                    (_squared_distance(center, point), name)
+                    for name, point in self._points.items()
+                    if accept is None or accept(name)
+                ),
+            )
+        ]
+
+    def _cell(self, point: Point) -> Cell:
+        size = self.cell_size
+        return (
+            math.floor(point[0] / size),
+            math.floor(point[1] / size),
+            math.floor(point[2] / size),
+        )
+
+    def _add(self, cell: Cell, name: str):
+        members = self._cells.get(cell)
+        if members is None:
+            members = self._cells[cell] = set()
+            if self._low is None:
+                self._low, self._high = list(cell), list(cell)
+            else:
+                for axis in range(3):
+                    self._low[axis] = min(self._low[axis], cell[axis])
+                    self._high[axis] = max(self._high[axis], cell[axis])
+        members.add(name)
+
+    def _clip(self, origin: Cell, ring: int) -> List[range]:
+        """Per axis, the cell coordinates within ``ring`` of ``origin`` ever occupied."""
+        return [
+            range(
+                max(origin[axis] - ring, self._low[axis]),
+                min(origin[axis] + ring, self._high[axis]) + 1,
+            )
+            for axis in range(3)
+        ]
+
+    def _discard(self, cell: Cell, name: str):
+        members = self._cells[cell]
+        members.discard(name)
+        if not members:
+            del self._cells[cell]
+
+    def _cells_between(self, low: Point, high: Point) -> Iterator[Set[str]]:
+        """Members of the occupied cells overlapping a box."""
+        if not self._cells:
+            return
+        first, last = self._cell(low), self._cell(high)
+        spans = [
+            range(max(first[axis], self._low[axis]), min(last[axis], self._high[axis]) + 1)
+            for axis in range(3)
+        ]
+        if len(spans[0]) * len(spans[1]) * len(spans[2]) > len(self._cells):
+            for cell, members in self._cells.items():
+                if all(first[axis] <= cell[axis] <= last[axis] for axis in range(3)):
+                    yield members
+            return
+
+        for cell in product(*spans):
+            members = self._cells.get(cell)
+            if members:
+                yield members
+
+    @staticmethod
+    def _ring(origin: Cell, ring: int, spans: List[range]) -> Iterator[Cell]:
+        """Cells in ``spans`` whose largest offset from ``origin`` along any axis is ``ring``."""
+        ox, oy, oz = origin
+        ends = [z for z in (oz - ring, oz + ring) if z in spans[2]]
+        for x in spans[0]:
+            x_edge = abs(x - ox) == ring
+            for y in spans[1]:
+                if x_edge or abs(y - oy) == ring:
+                    for z in spans[2]:
+                        yield (x, y, z)
+                else:
+                    for z in ends:
+                        yield (x, y, z)
@@ -0,0 +1,85 @@
+"""
+Background sweeper for temporary actors.
+
+Actors created with a TTL (see ``ttl_tags``) carry the ``mcp_temporary`` tag
+and a tag recording when they expire, ``mcp_expires_at:<unix seconds>``.
+Every interval the sweeper asks the editor to delete the temporary actors
+that have expired, ``batch_size`` at a time so a large backlog doesn't hold
+the game thread, until none are left. Only the tags are needed, so actors
+left behind by an earlier server, or a script that tags its own actors, are
+reaped too. Against a plugin without ``delete_actors`` the sweeper stops.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List
+
+from .metrics import metrics
+
+logger = logging.getLogger("UnrealMCP")
+
+# Tag of every actor created with a TTL
+TEMPORARY_TAG = "mcp_temporary"
+
+# Prefix of the tag holding a temporary actor's expiry time
+EXPIRES_TAG_PREFIX = "mcp_expires_at:"
+
+
+class SweepUnsupported(RuntimeError):
+    """Raised when the plugin has no delete_actors command to sweep with."""
+
+
+def ttl_tags(ttl: float) -> List[str]:
+    """Tags marking an actor for deletion ``ttl`` seconds from now."""
+    return [TEMPORARY_TAG, f"{EXPIRES_TAG_PREFIX}{time.time() + ttl:.0f}"]
+
+
+async def sweep_expired(unreal, batch_size: int) -> int:
+    """Delete every expired temporary actor, returning how many were deleted."""
+    reaped = 0
+    while True:
+        response = await unreal.delete_expired(
+            {"tag": TEMPORARY_TAG, "expired_before": time.time(), "limit": batch_size}
+        )
+        if response.get("status") != "success":
+            error = response.get("error", "Unknown error")
+            if error == "Unknown command: delete_actors":
+                raise SweepUnsupported(error)
+            raise RuntimeError(error)
+
+        result = response.get("result") or {}
+        deleted = result.get("deleted", [])
+        reaped += len(deleted)
+        # Stop if nothing could be deleted, rather than asking forever
+        if not deleted or not result.get("remaining"):
+            return reaped
+
+
+async def run_sweeper(
+    get_connection: Callable[[], Awaitable[Any]], interval: float, batch_size: int
+):
+    """Reap expired temporary actors every ``interval`` seconds until cancelled.
+
+    Stops early if the plugin doesn't support sweeping.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            unreal = await get_connection()
+            if unreal is None:
+                continue
+
+            reaped = await sweep_expired(unreal, batch_size)
+            if reaped:
+                metrics.increment("sweeper.reaped", reaped)
+                logger.info(f"Deleted {reaped} expired temporary actors")
+
+        except asyncio.CancelledError:
+            raise
+        except SweepUnsupported:
+            logger.info("Unreal plugin can't delete actors in bulk; temporary actors won't expire")
+            return
+        except Exception as e:
+            metrics.increment("sweeper.failed")
+            logger.debug(f"Temporary actor sweep failed: {e}")
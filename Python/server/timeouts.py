@@ -0,0 +1,97 @@
+"""
+Per-command response timeouts learned from observed latency.
+
+Commands differ by orders of magnitude: ``ping`` answers in a millisecond while
+``compile_blueprint`` on a large graph can take many seconds. One fixed timeout
+is either too slow to notice a hung editor or too short for heavy commands.
+``TimeoutPolicy`` tracks an EWMA and a window of recent latencies per command
+type and derives each timeout from them, starting from configured defaults
+until enough samples have been seen.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional
+
+from .metrics import metrics
+
+
+class _LatencyStats:
+    __slots__ = ("ewma", "samples")
+
+    def __init__(self, window: int):
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=window)
+
+
+class TimeoutPolicy:
+    """Chooses response timeouts per command type from recent latencies.
+
+    Once ``min_samples`` latencies are known for a command, its timeout is the
+    larger of the EWMA and the p99 latency times ``headroom``, clamped to
+    [minimum, maximum]. Before that the command's entry in ``initial`` is
+    used, falling back to ``default``.
+    """
+
+    def __init__(
+        self,
+        default: float,
+        minimum: float,
+        maximum: float,
+        initial: Dict[str, float] = None,
+        headroom: float = 3.0,
+        alpha: float = 0.2,
+        window: int = 100,
+        min_samples: int = 10,
+    ):
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = initial or {}
+        self.headroom = headroom
+        self.alpha = alpha
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _LatencyStats] = {}
+
+    def observe(self, command: str, latency: float):
+        """Record how long a command took to get its response, in seconds."""
+        with self._lock:
+            stats = self._stats.get(command)
+            if stats is None:
+                stats = self._stats[command] = _LatencyStats(self.window)
+            stats.samples.append(latency)
+            if stats.ewma is None:
+                stats.ewma = latency
+            else:
+                stats.ewma += self.alpha * (latency - stats.ewma)
+            ewma = stats.ewma
+
+        metrics.set_gauge(f"latency.{command}.ewma_ms", round(ewma * 1000, 3))
+
+    def expired(self, command: str, timeout: float):
+        """Record a command that got no response within ``timeout``.
+
+        Its real latency is at least the timeout, which pushes the next
+        estimate up.
+        """
+        metrics.increment(f"latency.{command}.timeouts")
+        self.observe(command, timeout)
+
+    def timeout_for(self, command: str) -> float:
+        """Seconds to wait for the response to a command."""
+        with self._lock:
+            stats = self._stats.get(command)
+            if stats is None or len(stats.samples) < self.min_samples:
+                return self.initial.get(command, self.default)
+            ordered = sorted(stats.samples)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            estimate = max(p99, stats.ewma) * self.headroom
+
+        return min(max(estimate, self.minimum), self.maximum)
+
+    def timeout_for_batch(self, commands: Iterable[str]) -> float:
+        """Seconds to wait for a batch, which runs its commands one after another."""
+        total = sum(self.timeout_for(command) for command in commands)
+        return min(max(total, self.minimum), self.maximum)
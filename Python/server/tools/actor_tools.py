@@ -4,76 +4,329 @@ Actor Tools for Unreal MCP.
 This module provides tools for creating, manipulating, and inspecting actors in Unreal Engine.
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import math
+from collections import Counter
+from typing import Dict, List, Any, Optional, Union
 from mcp.server.fastmcp import FastMCP, Context
 
+from ..constants import UNREAL_MAX_TRANSFORMS_PER_COMMAND
+from ..sweeper import ttl_tags
+
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
 
+def _is_vector(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == 3
+        and all(isinstance(v, (int, float)) for v in value)
+    )
+
+
+def _packed_vectors(values: Any, count: int, field: str) -> List[float]:
+    """Validate a column of ``count`` [x, y, z] vectors in one pass.
+
+    Accepts a list of ``count`` 3-element lists, or the same numbers packed
+    into one flat list of 3 * ``count``. Returns them packed, as floats, or
+    raises ValueError naming ``field``.
+    """
+    if not isinstance(values, list):
+        raise ValueError(f"'{field}' must be a list")
+    if len(values) == count and all(isinstance(row, list) and len(row) == 3 for row in values):
+        flat = [v for row in values for v in row]
+    elif len(values) == 3 * count and not any(isinstance(v, list) for v in values):
+        flat = values
+    else:
+        raise ValueError(
+            f"'{field}' must hold one [x, y, z] list per actor ({count}), "
+            f"or {3 * count} packed values"
+        )
+    if not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v) for v in flat
+    ):
+        raise ValueError(f"'{field}' must only hold finite numbers")
+    return list(map(float, flat))
+
+
+def _name_errors(names: Any, field: str = "names") -> List[Dict[str, Any]]:
+    """Per-index errors for a list of actor names that must be set and distinct."""
+    if not isinstance(names, list):
+        return [{"error": f"'{field}' must be a list"}]
+    errors = []
+    seen = set()
+    for index, name in enumerate(names):
+        if not isinstance(name, str) or not name:
+            errors.append({"index": index, "error": "Name must be a non-empty string"})
+        elif name.lower() in seen:
+            # The editor compares actor names case-insensitively
+            errors.append({"index": index, "name": name, "error": "Duplicate name"})
+        else:
+            seen.add(name.lower())
+    return errors
+
+
+def _bulk_results(
+    names: List[str], responses: List[Dict[str, Any]], done: str
+) -> Dict[str, Any]:
+    """Summarize send_batch responses as one status (and error) per actor.
+
+    ``done`` names the count of actors the commands succeeded for.
+    """
+    results = []
+    for name, response in zip(names, responses):
+        item = {"name": name, "status": response.get("status", "error")}
+        if item["status"] == "error":
+            item["error"] = response.get("error", "Unknown error")
+        results.append(item)
+    counts = Counter(item["status"] for item in results)
+    return {
+        "success": counts["success"] == len(results),
+        done: counts["success"],
+        "failed": counts["error"],
+        "skipped": counts["skipped"],
+        "results": results,
+    }
+
+
+async def _send_transforms(
+    unreal, names: List[str], packed: Dict[str, List[float]]
+) -> List[Dict[str, Any]]:
+    """Move actors with set_actor_transforms, returning one response per name.
+
+    ``packed`` maps "locations", "rotations" and/or "scales" to 3 values per
+    name. Names are split across commands of UNREAL_MAX_TRANSFORMS_PER_COMMAND,
+    sent concurrently. Plugins that predate the command get one batched
+    set_actor_transform per name instead.
+    """
+    size = UNREAL_MAX_TRANSFORMS_PER_COMMAND
+    chunks = []
+    for start in range(0, len(names), size):
+        params: Dict[str, Any] = {"names": names[start:start + size]}
+        for field, values in packed.items():
+            params[field] = values[3 * start:3 * (start + size)]
+        chunks.append(params)
+
+    responses = await asyncio.gather(
+        *(unreal.send_command("set_actor_transforms", params) for params in chunks)
+    )
+
+    results: List[Dict[str, Any]] = []
+    for params, response in zip(chunks, responses):
+        response = response or {"status": "error", "error": "No response from Unreal Engine"}
+        count = len(params["names"])
+        if response.get("error") == "Unknown command: set_actor_transforms":
+            commands = []
+            for index, name in enumerate(params["names"]):
+                single = {"name": name}
+                for field, values in packed.items():
+                    # "locations" -> "location"
+                    single[field[:-1]] = params[field][3 * index:3 * index + 3]
+                commands.append(("set_actor_transform", single))
+            results.extend(await unreal.send_batch(commands))
+            continue
+        if response.get("status") == "error":
+            results.extend(dict(response) for _ in range(count))
+            continue
+
+        items = (response.get("result") or {}).get("results") or []
+        if len(items) != count:
+            error = f"set_actor_transforms returned {len(items)} results for {count} actors"
+            results.extend({"status": "error", "error": error} for _ in range(count))
+            continue
+        results.extend(
+            {"status": "error", "error": item["error"]}
+            if "error" in item
+            else {"status": "success", "result": item}
+            for item in items
+        )
+    return results
+
+
+def _center_error(location: Optional[List[float]], actor: Optional[str]) -> Optional[str]:
+    """Why a spatial query has nothing to be centred on, if it hasn't."""
+    if actor is None and not _is_vector(location):
+        return "Give either an actor name or a location as a list of 3 float values."
+    return None
+
+
+def _query_center(level, location: Optional[List[float]], actor: Optional[str]) -> List[float]:
+    """The point a spatial query is centred on, looking ``actor`` up in ``level``.
+
+    Raises ValueError if the actor isn't in the level or has no location.
+    """
+    if actor is None:
+        return location
+    found = level.get_actor(actor)
+    if found is None:
+        raise ValueError(f"Actor not found: {actor}")
+    if not _is_vector(found.get("location")):
+        raise ValueError(f"Actor has no location: {actor}")
+    return found["location"]
+
+
+def _tool_result(response: Dict[str, Any]) -> Dict[str, Any]:
+    """The result of a plugin-format response, or the tools' error format."""
+    if response.get("status") == "error":
+        return {"success": False, "message": response.get("error", "Unknown error")}
+    return response.get("result", response)
+
+
 def register_actor_tools(mcp: FastMCP):
     """Register actor tools with the MCP server."""
 
     @mcp.tool()
-    def get_actors_in_level(ctx: Context) -> List[Dict[str, Any]]:
-        """Get a list of all actors in the current level."""
-        from Python.unreal_mcp_server import get_unreal_connection
+    async def get_actors_in_level(
+        ctx: Context,
+        limit: int = 0,
+        cursor: str = None,
+        fields: List[str] = None,
+        actor_class: str = None,
+        name_pattern: str = None,
+    ) -> Dict[str, Any]:
+        """Get the actors in the current level, optionally filtered and a page at a time.
+
+        Args:
+            ctx: The MCP context
+            limit: Most actors to return; 0 returns every match
+            cursor: The next_cursor of the previous page, to get the page after it
+            fields: Actor fields to include, from "name", "class", "location",
+                "rotation" and "scale" (e.g. ["name"] or ["name", "class",
+                "location"]); all of them by default
+            actor_class: Only return actors of this class (e.g. PointLight)
+            name_pattern: Only return actors whose name contains this text
+
+        Returns:
+            Dict containing the actors, the total number matching, and a
+            next_cursor if there are more pages. Pages are in name order.
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
-            response = unreal.send_command("get_actors_in_level", {})
+            unreal = await get_async_unreal_connection()
+            params: Dict[str, Any] = {}
+            if limit:
+                params["limit"] = limit
+            if cursor:
+                params["cursor"] = cursor
+            if fields:
+                params["fields"] = fields
+            if actor_class:
+                params["class"] = actor_class
+            if name_pattern:
+                params["name_pattern"] = name_pattern
+
+            response = await unreal.send_command("get_actors_in_level", params)
 
             if not response:
                 logger.warning("No response from Unreal Engine")
-                return []
+                return {"success": False, "message": "No response from Unreal Engine"}
 
-            # Log the complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
-
-            # Check response format
-            if "result" in response and "actors" in response["result"]:
-                actors = response["result"]["actors"]
-                logger.info(f"Found {len(actors)} actors in level")
-                return actors
-            elif "actors" in response:
-                actors = response["actors"]
-                logger.info(f"Found {len(actors)} actors in level")
-                return actors
-
-            logger.warning(f"Unexpected response format: {response}")
-            return []
+            if response.get("status") == "error":
+                return {"success": False, "message": response.get("error", "Unknown error")}
+
+            result = response.get("result", response)
+            if "actors" in result:
+                logger.info(f"Found {len(result['actors'])} actors in level")
+                return result
+
+            logger.warning("Unexpected response format from get_actors_in_level")
+            return {"success": False, "message": "Unexpected response format"}
 
         except Exception as e:
             logger.error(f"Error getting actors: {e}")
-            return []
+            return {"success": False, "message": str(e)}
 
     @mcp.tool()
-    def find_actors_by_name(ctx: Context, pattern: str) -> List[str]:
+    async def export_level_snapshot(
+        ctx: Context,
+        path: str,
+        fields: List[str] = None,
+        actor_class: str = None,
+        name_pattern: str = None,
+    ) -> Dict[str, Any]:
+        """Write the actors in the current level to a JSON Lines file, one actor per line.
+
+        Actors are written as the listing arrives from Unreal, so this works on
+        levels too large to list in one response.
+
+        Args:
+            ctx: The MCP context
+            path: The file to write, on the machine running this server
+            fields: Actor fields to include, from "name", "class", "location",
+                "rotation" and "scale"; all of them by default
+            actor_class: Only export actors of this class (e.g. PointLight)
+            name_pattern: Only export actors whose name contains this text
+
+        Returns:
+            Dict containing the number of actors written and a count per class
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            unreal = await get_async_unreal_connection()
+            params: Dict[str, Any] = {}
+            if fields:
+                params["fields"] = fields
+            if actor_class:
+                params["class"] = actor_class
+            if name_pattern:
+                params["name_pattern"] = name_pattern
+
+            classes: Counter = Counter()
+            count = 0
+            with open(path, "w", encoding="utf-8") as snapshot:
+                async for actor in unreal.stream_actors(params):
+                    snapshot.write(json.dumps(actor) + "\n")
+                    classes[actor.get("class", "")] += 1
+                    count += 1
+
+            logger.info(f"Exported {count} actors to {path}")
+            result = {"success": True, "path": path, "count": count}
+            if "class" in (fields or ["class"]):
+                result["classes"] = dict(classes.most_common())
+            return result
+
+        except Exception as e:
+            logger.error(f"Error exporting level snapshot: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def find_actors_by_name(ctx: Context, pattern: str) -> List[str]:
         """Find actors by name pattern."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
-            response = unreal.send_command("find_actors_by_name", {"pattern": pattern})
+            unreal = await get_async_unreal_connection()
+            response = await unreal.send_command("find_actors_by_name", {"pattern": pattern})
 
             if not response:
+                logger.warning("No response from Unreal Engine")
+                return []
+
+            if response.get("status") == "error":
+                logger.error(f"Error finding actors: {response.get('error', 'Unknown error')}")
                 return []
 
-            return response.get("actors", [])
+            result = response.get("result", response)
+            return [actor["name"] for actor in result.get("actors", [])]
 
         except Exception as e:
             logger.error(f"Error finding actors: {e}")
             return []
 
     @mcp.tool()
-    def create_actor(
+    async def create_actor(
         ctx: Context,
         name: str,
         type: str,
         location: List[float] = [0.0, 0.0, 0.0],
         rotation: List[float] = [0.0, 0.0, 0.0],
         scale: List[float] = [1.0, 1.0, 1.0],
+        ttl: float = None,
     ) -> Dict[str, Any]:
         """Create a new actor in the current level.
 
@@ -84,14 +337,16 @@ def register_actor_tools(mcp: FastMCP):
             location: The [x, y, z] world location to spawn at
             rotation: The [pitch, yaw, roll] rotation in degrees
             scale: The [x, y, z] scale to apply
+            ttl: Seconds after which the actor is deleted automatically, for
+                temporary actors; kept until deleted if not given
 
         Returns:
             Dict containing the created actor's properties
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
 
             # Ensure all parameters are properly formatted
             params = {
@@ -116,10 +371,15 @@ def register_actor_tools(mcp: FastMCP):
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
 
+            if ttl is not None:
+                if ttl <= 0:
+                    return {"success": False, "message": "'ttl' must be positive"}
+                params["tags"] = ttl_tags(ttl)
+
             logger.info(
                 f"Creating actor '{name}' of type '{type}' with params: {params}"
             )
-            response = unreal.send_command("create_actor", params)
+            response = await unreal.send_command("create_actor", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -142,13 +402,128 @@ def register_actor_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def delete_actor(ctx: Context, name: str) -> Dict[str, Any]:
+    async def create_actors(
+        ctx: Context,
+        actors: List[Dict[str, Any]] = None,
+        names: List[str] = None,
+        types: Union[str, List[str]] = None,
+        locations: List[Any] = None,
+        rotations: List[Any] = None,
+        scales: List[Any] = None,
+        stop_on_error: bool = False,
+        ttl: float = None,
+    ) -> Dict[str, Any]:
+        """Create many actors in the current level, in as few round trips as possible.
+
+        Give either ``actors``, a list of create_actor style dicts (name, type
+        and optional location, rotation and scale), or the same data as
+        columns: ``names`` plus ``types`` and optional ``locations``,
+        ``rotations`` and ``scales``. Each transform column is a list of one
+        [x, y, z] per actor, or those numbers packed into one flat list.
+
+        Everything is validated before anything is created; if any actor is
+        invalid, nothing is sent and the errors are returned.
+
+        Args:
+            ctx: The MCP context
+            actors: The actors to create, as dicts
+            names: The names to give the new actors (must be unique)
+            types: One actor type per name, or a single type for all of them
+                (e.g. StaticMeshActor, PointLight)
+            locations: The [x, y, z] world locations to spawn at
+            rotations: The [pitch, yaw, roll] rotations in degrees
+            scales: The [x, y, z] scales to apply
+            stop_on_error: Stop creating actors after the first failure
+            ttl: Seconds after which the actors are deleted automatically, for
+                temporary actors; kept until deleted if not given
+
+        Returns:
+            Dict containing counts of actors created, failed and skipped, and
+            each actor's name and status, with an error for failures
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            if actors is not None:
+                if names is not None or types is not None:
+                    return {
+                        "success": False,
+                        "message": "Give either 'actors' or 'names' and 'types', not both",
+                    }
+                if not all(isinstance(actor, dict) for actor in actors):
+                    return {"success": False, "message": "Each actor must be a dict"}
+                names = [actor.get("name") for actor in actors]
+                types = [actor.get("type") for actor in actors]
+                columns = {
+                    field: [actor.get(field, default) for actor in actors]
+                    for field, default in (
+                        ("location", [0.0, 0.0, 0.0]),
+                        ("rotation", [0.0, 0.0, 0.0]),
+                        ("scale", [1.0, 1.0, 1.0]),
+                    )
+                }
+            else:
+                columns = {"location": locations, "rotation": rotations, "scale": scales}
+
+            if names is None or types is None:
+                return {"success": False, "message": "Give 'actors', or 'names' and 'types'"}
+            if ttl is not None and ttl <= 0:
+                return {"success": False, "message": "'ttl' must be positive"}
+
+            errors = _name_errors(names)
+            if errors:
+                return {"success": False, "message": "Invalid actor names", "errors": errors}
+            count = len(names)
+            if isinstance(types, str):
+                types = [types] * count
+            if not isinstance(types, list) or len(types) != count:
+                return {"success": False, "message": f"'types' must hold one type per name ({count})"}
+            errors = [
+                {"index": index, "name": names[index], "error": "Type must be a non-empty string"}
+                for index, actor_type in enumerate(types)
+                if not isinstance(actor_type, str) or not actor_type
+            ]
+            if errors:
+                return {"success": False, "message": "Invalid actor types", "errors": errors}
+
+            packed = {}
+            for field, values in columns.items():
+                if values is not None:
+                    packed[field] = _packed_vectors(
+                        values, count, field if actors is not None else f"{field}s"
+                    )
+
+            tags = ttl_tags(ttl) if ttl is not None else None
+            commands = []
+            for index, name in enumerate(names):
+                params = {"name": name, "type": types[index].upper()}
+                for field, values in packed.items():
+                    params[field] = values[3 * index:3 * index + 3]
+                if tags:
+                    params["tags"] = tags
+                commands.append(("create_actor", params))
+
+            unreal = await get_async_unreal_connection()
+            logger.info(f"Creating {count} actors")
+            responses = await unreal.send_batch(commands, stop_on_error=stop_on_error)
+            result = _bulk_results(names, responses, "created")
+            logger.info(f"Created {result['created']} of {count} actors")
+            return result
+
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            logger.error(f"Error creating actors: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def delete_actor(ctx: Context, name: str) -> Dict[str, Any]:
         """Delete an actor by name."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
-            response = unreal.send_command("delete_actor", {"name": name})
+            unreal = await get_async_unreal_connection()
+            response = await unreal.send_command("delete_actor", {"name": name})
             return response or {}
 
         except Exception as e:
@@ -156,7 +531,67 @@ def register_actor_tools(mcp: FastMCP):
             return {}
 
     @mcp.tool()
-    def set_actor_transform(
+    async def delete_actors(
+        ctx: Context,
+        names: List[str] = None,
+        pattern: str = None,
+        tag: str = None,
+    ) -> Dict[str, Any]:
+        """Delete every actor matching the filters given, in one editor operation.
+
+        At least one filter is needed; actors must match all of those given.
+
+        Args:
+            ctx: The MCP context
+            names: Only delete actors with these names
+            pattern: Only delete actors whose name contains this text
+                (case-insensitive, like find_actors_by_name)
+            tag: Only delete actors with this actor tag, e.g. "mcp_temporary"
+                for every actor created with a TTL
+
+        Returns:
+            Dict containing the number of actors deleted and their names, and
+            any of ``names`` that weren't deleted
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            if names is None and not pattern and not tag:
+                return {
+                    "success": False,
+                    "message": "Give 'names', 'pattern' or 'tag' to choose the actors to delete",
+                }
+            params: Dict[str, Any] = {}
+            if names is not None:
+                params["names"] = names
+            if pattern:
+                params["pattern"] = pattern
+            if tag:
+                params["tag"] = tag
+
+            unreal = await get_async_unreal_connection()
+            response = await unreal.send_command("delete_actors", params)
+
+            if not response:
+                return {"success": False, "message": "No response from Unreal Engine"}
+            if response.get("status") == "error":
+                return {"success": False, "message": response.get("error", "Unknown error")}
+
+            deleted = (response.get("result") or {}).get("deleted", [])
+            logger.info(f"Deleted {len(deleted)} actors")
+            result: Dict[str, Any] = {"success": True, "deleted": len(deleted), "names": deleted}
+            if names is not None:
+                # The editor compares actor names case-insensitively
+                found = {name.lower() for name in deleted}
+                result["not_deleted"] = [name for name in names if name.lower() not in found]
+            return result
+
+        except Exception as e:
+            logger.error(f"Error deleting actors: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def set_actor_transform(
         ctx: Context,
         name: str,
         location: List[float] = None,
@@ -164,10 +599,10 @@ def register_actor_tools(mcp: FastMCP):
         scale: List[float] = None,
     ) -> Dict[str, Any]:
         """Set the transform of an actor."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             params = {"name": name}
             if location is not None:
                 params["location"] = location
@@ -176,7 +611,7 @@ def register_actor_tools(mcp: FastMCP):
             if scale is not None:
                 params["scale"] = scale
 
-            response = unreal.send_command("set_actor_transform", params)
+            response = await unreal.send_command("set_actor_transform", params)
             return response or {}
 
         except Exception as e:
@@ -184,17 +619,218 @@ def register_actor_tools(mcp: FastMCP):
             return {}
 
     @mcp.tool()
-    def get_actor_properties(ctx: Context, name: str) -> Dict[str, Any]:
+    async def set_actor_transforms(
+        ctx: Context,
+        names: List[str],
+        locations: List[Any] = None,
+        rotations: List[Any] = None,
+        scales: List[Any] = None,
+    ) -> Dict[str, Any]:
+        """Set the transforms of many actors, in as few round trips as possible.
+
+        Each of ``locations``, ``rotations`` and ``scales`` holds one [x, y, z]
+        per name, or those numbers packed into one flat list (e.g. [x1, y1,
+        z1, x2, y2, z2]). Only the components given are changed.
+
+        Args:
+            ctx: The MCP context
+            names: The actors to move
+            locations: The new [x, y, z] world locations
+            rotations: The new [pitch, yaw, roll] rotations in degrees
+            scales: The new [x, y, z] scales
+
+        Returns:
+            Dict containing counts of actors moved and failed, and each
+            actor's name and status, with an error for failures
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            errors = _name_errors(names)
+            if errors:
+                return {"success": False, "message": "Invalid actor names", "errors": errors}
+
+            packed = {}
+            for field, values in (
+                ("locations", locations),
+                ("rotations", rotations),
+                ("scales", scales),
+            ):
+                if values is not None:
+                    packed[field] = _packed_vectors(values, len(names), field)
+            if not packed:
+                return {
+                    "success": False,
+                    "message": "Give at least one of 'locations', 'rotations' or 'scales'",
+                }
+
+            unreal = await get_async_unreal_connection()
+            logger.info(f"Setting the transforms of {len(names)} actors")
+            responses = await _send_transforms(unreal, names, packed)
+            return _bulk_results(names, responses, "moved")
+
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            logger.error(f"Error setting transforms: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def get_actor_properties(ctx: Context, name: str) -> Dict[str, Any]:
         """Get all properties of an actor."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
-            response = unreal.send_command("get_actor_properties", {"name": name})
+            unreal = await get_async_unreal_connection()
+            response = await unreal.send_command("get_actor_properties", {"name": name})
             return response or {}
 
         except Exception as e:
             logger.error(f"Error getting properties: {e}")
             return {}
 
+    @mcp.tool()
+    async def get_actor_transform(ctx: Context, name: str) -> Dict[str, Any]:
+        """Get the location, rotation and scale of an actor.
+
+        Answered from the server's copy of the level when it is current, so
+        it usually doesn't wait on the editor.
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            unreal = await get_async_unreal_connection()
+            return _tool_result(await unreal.get_actor_transform(name))
+
+        except Exception as e:
+            logger.error(f"Error getting transform: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def find_actors_in_radius(
+        ctx: Context,
+        radius: float,
+        location: List[float] = None,
+        actor: str = None,
+        actor_class: str = None,
+    ) -> Dict[str, Any]:
+        """Find the actors within a distance of a point or of another actor.
+
+        Args:
+            ctx: The MCP context
+            radius: The distance to search within, in Unreal units
+            location: The [x, y, z] point to search around
+            actor: Name of an actor to search around instead of a location
+            actor_class: Only return actors of this class (e.g. PointLight)
+
+        Returns:
+            Dict containing the matching actors, nearest first, each with its
+            distance
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            error = _center_error(location, actor)
+            if error is not None:
+                return {"success": False, "message": error}
+
+            unreal = await get_async_unreal_connection()
+            # The centre is looked up in the same copy of the level the query runs on
+            response = await unreal.query_level(
+                lambda level: {
+                    "actors": [
+                        found
+                        for found in level.in_radius(
+                            _query_center(level, location, actor), radius, actor_class
+                        )
+                        if found["name"] != actor
+                    ]
+                }
+            )
+            return _tool_result(response)
+
+        except Exception as e:
+            logger.error(f"Error finding actors in radius: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def find_actors_in_box(
+        ctx: Context,
+        min_corner: List[float],
+        max_corner: List[float],
+        actor_class: str = None,
+    ) -> Dict[str, Any]:
+        """Find the actors inside an axis-aligned box.
+
+        Args:
+            ctx: The MCP context
+            min_corner: The [x, y, z] corner of the box with the lowest coordinates
+            max_corner: The [x, y, z] corner of the box with the highest coordinates
+            actor_class: Only return actors of this class (e.g. PointLight)
+
+        Returns:
+            Dict containing the matching actors, in name order
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            if not _is_vector(min_corner) or not _is_vector(max_corner):
+                return {
+                    "success": False,
+                    "message": "Box corners must be lists of 3 float values.",
+                }
+
+            unreal = await get_async_unreal_connection()
+            response = await unreal.query_level(
+                lambda level: {"actors": level.in_box(min_corner, max_corner, actor_class)}
+            )
+            return _tool_result(response)
+
+        except Exception as e:
+            logger.error(f"Error finding actors in box: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def nearest_actors(
+        ctx: Context,
+        k: int = 5,
+        actor_class: str = None,
+        location: List[float] = None,
+        actor: str = None,
+    ) -> Dict[str, Any]:
+        """Find the actors nearest a point or another actor.
+
+        Args:
+            ctx: The MCP context
+            k: How many actors to return
+            actor_class: Only return actors of this class (e.g. PointLight)
+            location: The [x, y, z] point to search from
+            actor: Name of an actor to search from instead of a location; it
+                isn't included in the results
+
+        Returns:
+            Dict containing up to k actors, nearest first, each with its
+            distance
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            error = _center_error(location, actor)
+            if error is not None:
+                return {"success": False, "message": error}
+
+            unreal = await get_async_unreal_connection()
+            response = await unreal.query_level(
+                lambda level: {
+                    "actors": level.nearest(
+                        _query_center(level, location, actor), k, actor_class, exclude=actor
+                    )
+                }
+            )
+            return _tool_result(response)
+
+        except Exception as e:
+            logger.error(f"Error finding nearest actors: {e}")
+            return {"success": False, "message": str(e)}
+
     logger.info("Actor tools registered successfully")
@@ -8,6 +8,8 @@ import logging
 from typing import Dict, List, Any
 from mcp.server.fastmcp import FastMCP, Context
 
+from ..sweeper import ttl_tags
+
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
@@ -16,13 +18,13 @@ def register_blueprint_tools(mcp: FastMCP):
     """Register Blueprint tools with the MCP server."""
 
     @mcp.tool()
-    def create_blueprint(ctx: Context, name: str, parent_class: str) -> Dict[str, Any]:
+    async def create_blueprint(ctx: Context, name: str, parent_class: str) -> Dict[str, Any]:
         """Create a new Blueprint class."""
         # Import inside function to avoid circular imports
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -30,7 +32,7 @@ def register_blueprint_tools(mcp: FastMCP):
                     "message": "Failed to connect to Unreal Engine",
                 }
 
-            response = unreal.send_command(
+            response = await unreal.send_command(
                 "create_blueprint", {"name": name, "parent_class": parent_class}
             )
 
@@ -47,7 +49,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_component_to_blueprint(
+    async def add_component_to_blueprint(
         ctx: Context,
         blueprint_name: str,
         component_type: str,
@@ -72,7 +74,7 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Information about the added component
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             # Ensure all parameters are properly formatted
@@ -103,7 +105,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -112,7 +114,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 }
 
             logger.info(f"Adding component to blueprint with params: {params}")
-            response = unreal.send_command("add_component_to_blueprint", params)
+            response = await unreal.send_command("add_component_to_blueprint", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -127,7 +129,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def set_static_mesh_properties(
+    async def set_static_mesh_properties(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -144,10 +146,10 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -162,7 +164,7 @@ def register_blueprint_tools(mcp: FastMCP):
             }
 
             logger.info(f"Setting static mesh properties with params: {params}")
-            response = unreal.send_command("set_static_mesh_properties", params)
+            response = await unreal.send_command("set_static_mesh_properties", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -176,7 +178,7 @@ def register_blueprint_tools(mcp: FastMCP):
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
 
-    def set_component_property(
+    async def set_component_property(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -184,10 +186,10 @@ def register_blueprint_tools(mcp: FastMCP):
         property_value: Any,
     ) -> Dict[str, Any]:
         """Set a property on a component in a Blueprint."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -203,7 +205,7 @@ def register_blueprint_tools(mcp: FastMCP):
             }
 
             logger.info(f"Setting component property with params: {params}")
-            response = unreal.send_command("set_component_property", params)
+            response = await unreal.send_command("set_component_property", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -218,7 +220,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def set_physics_properties(
+    async def set_physics_properties(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -229,10 +231,10 @@ def register_blueprint_tools(mcp: FastMCP):
         angular_damping: float = 0.0,
     ) -> Dict[str, Any]:
         """Set physics properties on a component."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -251,7 +253,7 @@ def register_blueprint_tools(mcp: FastMCP):
             }
 
             logger.info(f"Setting physics properties with params: {params}")
-            response = unreal.send_command("set_physics_properties", params)
+            response = await unreal.send_command("set_physics_properties", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -266,12 +268,12 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def compile_blueprint(ctx: Context, blueprint_name: str) -> Dict[str, Any]:
+    async def compile_blueprint(ctx: Context, blueprint_name: str) -> Dict[str, Any]:
         """Compile a Blueprint."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -282,7 +284,7 @@ def register_blueprint_tools(mcp: FastMCP):
             params = {"blueprint_name": blueprint_name}
 
             logger.info(f"Compiling blueprint: {blueprint_name}")
-            response = unreal.send_command("compile_blueprint", params)
+            response = await unreal.send_command("compile_blueprint", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -297,7 +299,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def set_blueprint_property(
+    async def set_blueprint_property(
         ctx: Context, blueprint_name: str, property_name: str, property_value: object
     ) -> Dict[str, Any]:
         """
@@ -311,10 +313,10 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -329,7 +331,7 @@ def register_blueprint_tools(mcp: FastMCP):
             }
 
             logger.info(f"Setting blueprint property with params: {params}")
-            response = unreal.send_command("set_blueprint_property", params)
+            response = await unreal.send_command("set_blueprint_property", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -344,7 +346,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def set_pawn_properties(
+    async def set_pawn_properties(
         ctx: Context,
         blueprint_name: str,
         auto_possess_player: str = "",
@@ -368,10 +370,10 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure with detailed results for each property
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -416,7 +418,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 }
 
                 logger.info(f"Setting pawn property {prop_name} to {prop_value}")
-                response = unreal.send_command("set_blueprint_property", params)
+                response = await unreal.send_command("set_blueprint_property", params)
 
                 if not response:
                     logger.error(
@@ -449,16 +451,21 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def spawn_blueprint_actor(
+    async def spawn_blueprint_actor(
         ctx: Context,
         blueprint_name: str,
         actor_name: str,
         location: List[float] = [],
         rotation: List[float] = [],
         scale: List[float] = [],
+        ttl: float = None,
     ) -> Dict[str, Any]:
-        """Spawn an actor from a Blueprint."""
-        from Python.unreal_mcp_server import get_unreal_connection
+        """Spawn an actor from a Blueprint.
+
+        Pass ``ttl`` (seconds) for a temporary actor that is deleted
+        automatically once it expires.
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             # Ensure all parameters are properly formatted
@@ -484,7 +491,12 @@ def register_blueprint_tools(mcp: FastMCP):
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
 
-            unreal = get_unreal_connection()
+            if ttl is not None:
+                if ttl <= 0:
+                    return {"success": False, "message": "'ttl' must be positive"}
+                params["tags"] = ttl_tags(ttl)
+
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -493,7 +505,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 }
 
             logger.info(f"Spawning blueprint actor with params: {params}")
-            response = unreal.send_command("spawn_blueprint_actor", params)
+            response = await unreal.send_command("spawn_blueprint_actor", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -0,0 +1,84 @@
+"""
+Diagnostics Tools for Unreal MCP.
+
+This module provides tools for inspecting the health of the connection to Unreal Engine.
+"""
+
+import logging
+from typing import Dict, Any
+from mcp.server.fastmcp import FastMCP, Context
+
+from ..metrics import metrics
+
+# Get logger
+logger = logging.getLogger("UnrealMCP")
+
+
+def _cache_summary(snapshot: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    counters = snapshot["counters"]
+    summary = {
+        name: counters.get(f"cache.{name}", 0)
+        for name in ("hits", "misses", "evictions", "expired", "invalidated")
+    }
+    summary["entries"] = snapshot["gauges"].get("cache.entries", 0)
+    lookups = summary["hits"] + summary["misses"]
+    summary["hit_rate"] = round(summary["hits"] / lookups, 3) if lookups else None
+    return summary
+
+
+def register_diagnostics_tools(mcp: FastMCP):
+    """Register diagnostics tools with the MCP server."""
+
+    @mcp.tool()
+    async def get_unreal_metrics(ctx: Context) -> Dict[str, Any]:
+        """
+        Get connection metrics for the Unreal Engine client.
+
+        Doesn't contact Unreal, so it also works while the editor is down.
+
+        Returns:
+            Every counter and gauge recorded so far, e.g. circuit breaker
+            state ("breaker.async.state") and state transition counts, plus a
+            summary of the read response cache: hits, misses, evictions,
+            expirations, invalidations, entries and hit rate
+        """
+        try:
+            snapshot = metrics.snapshot()
+            return {"success": True, **snapshot, "cache": _cache_summary(snapshot)}
+
+        except Exception as e:
+            logger.error(f"Error getting metrics: {e}")
+            return {"success": False, "message": str(e)}
+
+    @mcp.tool()
+    async def get_level_mirror_status(ctx: Context, resync: bool = False) -> Dict[str, Any]:
+        """
+        Report how current the server's copy of the level's actors is.
+
+        Spatial queries and transform lookups are answered from this copy, as
+        are actor listings and searches unless UNREAL_MIRROR_LEVEL is off. It
+        is refreshed from the editor once it is older than its maximum age.
+
+        Args:
+            resync: Refresh the copy from the editor first, e.g. after moving
+                actors by hand
+
+        Returns:
+            Whether the copy has been seeded, whether it is stale, its age
+            and maximum age in seconds, how many actors it holds, how many
+            writes it has followed since it was last refreshed and whether it
+            answers listings
+        """
+        from Python.unreal_mcp_server import get_async_unreal_connection
+
+        try:
+            unreal = await get_async_unreal_connection()
+            result: Dict[str, Any] = {"success": True, "answers_listings": unreal.mirror_reads}
+            if resync:
+                result["resynced"] = await unreal.resync_mirror(force=True)
+            result.update(unreal.mirror.status())
+            return result
+
+        except Exception as e:
+            logger.error(f"Error getting level mirror status: {e}")
+            return {"success": False, "message": str(e)}
@@ -16,7 +16,7 @@ def register_editor_tools(mcp: FastMCP):
     """Register editor tools with the MCP server."""
 
     @mcp.tool()
-    def focus_viewport(
+    async def focus_viewport(
         ctx: Context,
         target: str = None,
         location: List[float] = None,
@@ -35,7 +35,7 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             Response from Unreal Engine
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             params = {}
@@ -50,8 +50,8 @@ def register_editor_tools(mcp: FastMCP):
             if orientation:
                 params["orientation"] = orientation
 
-            unreal = get_unreal_connection()
-            response = unreal.send_command("focus_viewport", params)
+            unreal = await get_async_unreal_connection()
+            response = await unreal.send_command("focus_viewport", params)
             return response or {}
 
         except Exception as e:
@@ -16,7 +16,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
     """Register Blueprint node manipulation tools with the MCP server."""
 
     @mcp.tool()
-    def add_blueprint_event_node(
+    async def add_blueprint_event_node(
         ctx: Context, blueprint_name: str, event_name: str, node_position=None
     ) -> Dict[str, Any]:
         """
@@ -30,7 +30,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             # Handle default value within the method body
@@ -43,7 +43,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -54,7 +54,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             logger.info(
                 f"Adding event node '{event_name}' to blueprint '{blueprint_name}'"
             )
-            response = unreal.send_command("add_blueprint_event_node", params)
+            response = await unreal.send_command("add_blueprint_event_node", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -69,7 +69,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_blueprint_input_action_node(
+    async def add_blueprint_input_action_node(
         ctx: Context, blueprint_name: str, action_name: str, node_position=None
     ) -> Dict[str, Any]:
         """
@@ -83,7 +83,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             # Handle default value within the method body
@@ -96,7 +96,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -107,7 +107,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             logger.info(
                 f"Adding input action node for '{action_name}' to blueprint '{blueprint_name}'"
             )
-            response = unreal.send_command("add_blueprint_input_action_node", params)
+            response = await unreal.send_command("add_blueprint_input_action_node", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -122,7 +122,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_blueprint_function_node(
+    async def add_blueprint_function_node(
         ctx: Context,
         blueprint_name: str,
         target: str,
@@ -143,7 +143,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             # Handle default values within the method body
@@ -160,7 +160,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -171,7 +171,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             logger.info(
                 f"Adding function node '{function_name}' to blueprint '{blueprint_name}'"
             )
-            response = unreal.send_command(
+            response = await unreal.send_command(
                 "add_blueprint_function_node", command_params
             )
 
@@ -188,7 +188,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def connect_blueprint_nodes(
+    async def connect_blueprint_nodes(
         ctx: Context,
         blueprint_name: str,
         source_node_id: str,
@@ -209,7 +209,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             params = {
@@ -220,7 +220,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "target_pin": target_pin,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -229,7 +229,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 }
 
             logger.info(f"Connecting nodes in blueprint '{blueprint_name}'")
-            response = unreal.send_command("connect_blueprint_nodes", params)
+            response = await unreal.send_command("connect_blueprint_nodes", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -244,7 +244,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_blueprint_variable(
+    async def add_blueprint_variable(
         ctx: Context,
         blueprint_name: str,
         variable_name: str,
@@ -265,7 +265,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             params = {
@@ -276,7 +276,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "is_exposed": is_exposed,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -287,7 +287,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             logger.info(
                 f"Adding variable '{variable_name}' to blueprint '{blueprint_name}'"
             )
-            response = unreal.send_command("add_blueprint_variable", params)
+            response = await unreal.send_command("add_blueprint_variable", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -302,7 +302,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def create_input_mapping(
+    async def create_input_mapping(
         ctx: Context, action_name: str, key: str, input_type: str = "Action"
     ) -> Dict[str, Any]:
         """
@@ -316,12 +316,12 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             params = {"action_name": action_name, "key": key, "input_type": input_type}
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -330,7 +330,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 }
 
             logger.info(f"Creating input mapping '{action_name}' with key '{key}'")
-            response = unreal.send_command("create_input_mapping", params)
+            response = await unreal.send_command("create_input_mapping", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -345,7 +345,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_blueprint_get_self_component_reference(
+    async def add_blueprint_get_self_component_reference(
         ctx: Context, blueprint_name: str, component_name: str, node_position=None
     ) -> Dict[str, Any]:
         """
@@ -360,7 +360,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             # Handle None case explicitly in the function
@@ -373,7 +373,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -384,7 +384,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             logger.info(
                 f"Adding self component reference node for '{component_name}' to blueprint '{blueprint_name}'"
             )
-            response = unreal.send_command(
+            response = await unreal.send_command(
                 "add_blueprint_get_self_component_reference", params
             )
 
@@ -401,7 +401,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_blueprint_self_reference(
+    async def add_blueprint_self_reference(
         ctx: Context, blueprint_name: str, node_position=None
     ) -> Dict[str, Any]:
         """
@@ -414,7 +414,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             if node_position is None:
@@ -422,7 +422,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
 
             params = {"blueprint_name": blueprint_name, "node_position": node_position}
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -431,7 +431,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 }
 
             logger.info(f"Adding self reference node to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_self_reference", params)
+            response = await unreal.send_command("add_blueprint_self_reference", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -446,7 +446,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def find_blueprint_nodes(
+    async def find_blueprint_nodes(
         ctx: Context, blueprint_name: str, node_type=None, event_type=None
     ) -> Dict[str, Any]:
         """
@@ -460,7 +460,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing array of found node IDs and success status
         """
-        from Python.unreal_mcp_server import get_unreal_connection
+        from Python.unreal_mcp_server import get_async_unreal_connection
 
         try:
             params = {
@@ -469,7 +469,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "event_type": event_type,
             }
 
-            unreal = get_unreal_connection()
+            unreal = await get_async_unreal_connection()
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {
@@ -478,7 +478,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 }
 
             logger.info(f"Finding nodes in blueprint '{blueprint_name}'")
-            response = unreal.send_command("find_blueprint_nodes", params)
+            response = await unreal.send_command("find_blueprint_nodes", params)
 
             if not response:
                 logger.error("No response from Unreal Engine")
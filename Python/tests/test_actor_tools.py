@@ -0,0 +1,379 @@
+"""Tests for the actor tools' handling of Unreal responses."""
+
+import asyncio
+import json
+import re
+import sys
+import types
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from server.mirror import LevelMirror
+from server.tools import actor_tools
+from server.tools.actor_tools import _packed_vectors, register_actor_tools
+
+ACTORS = [
+    {"name": "Lamp1", "class": "PointLight", "location": [0.0, 0.0, 0.0]},
+    {"name": "Lamp2", "class": "PointLight", "location": [100.0, 0.0, 0.0]},
+    {"name": "Floor", "class": "StaticMeshActor", "location": [0.0, 0.0, -10.0]},
+]
+
+
+class FakeUnreal:
+    """Answers commands with canned responses, or from a seeded level mirror."""
+
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.sent = []
+        self.batches = []
+        self.mirror = LevelMirror(max_age=60.0, cell_size=1000.0)
+        self.mirror.seed(ACTORS, self.mirror.generation)
+
+    async def send_command(self, command, params=None, timeout=None):
+        self.sent.append((command, params))
+        if command in self.responses:
+            response = self.responses[command]
+            return response(params) if callable(response) else response
+        return self.mirror.answer(command, params)
+
+    async def send_batch(self, commands, stop_on_error=False, timeout=None):
+        commands = list(commands)
+        self.batches.append(commands)
+        if "send_batch" in self.responses:
+            return self.responses["send_batch"]
+        return [{"status": "success", "result": dict(params)} for _, params in commands]
+
+    async def query_level(self, query):
+        if "query_level" in self.responses:
+            return self.responses["query_level"]
+        try:
+            return {"status": "success", "result": query(self.mirror)}
+        except ValueError as e:
+            return {"status": "error", "error": str(e)}
+
+    async def stream_actors(self, params=None, timeout=None):
+        self.streamed = params
+        for actor in self.mirror.answer("get_actors_in_level", params)["result"]["actors"]:
+            yield actor
+
+    async def get_actor_transform(self, name):
+        actor = self.mirror.get_actor(name)
+        if actor is None:
+            return {"status": "error", "error": f"Actor not found: {name}"}
+        return {"status": "success", "result": actor}
+
+
+@pytest.fixture
+def tools(monkeypatch):
+    """Register the actor tools against a FakeUnreal; returns (tools, fake)."""
+    unreal = FakeUnreal()
+
+    async def get_async_unreal_connection():
+        return unreal
+
+    server = types.ModuleType("Python.unreal_mcp_server")
+    server.get_async_unreal_connection = get_async_unreal_connection
+    monkeypatch.setitem(sys.modules, "Python", types.ModuleType("Python"))
+    monkeypatch.setitem(sys.modules, "Python.unreal_mcp_server", server)
+
+    mcp = FastMCP("test")
+    register_actor_tools(mcp)
+    found = {tool.name: tool.fn for tool in mcp._tool_manager.list_tools()}
+    return found, unreal
+
+
+def test_find_actors_by_name_returns_matching_names(tools):
+    found, _ = tools
+
+    assert sorted(asyncio.run(found["find_actors_by_name"](None, "lamp"))) == ["Lamp1", "Lamp2"]
+    assert asyncio.run(found["find_actors_by_name"](None, "missing")) == []
+
+
+def test_find_actors_by_name_error_returns_no_names(tools):
+    found, unreal = tools
+    unreal.responses["find_actors_by_name"] = {"status": "error", "error": "No world"}
+
+    assert asyncio.run(found["find_actors_by_name"](None, "lamp")) == []
+
+
+def test_get_actor_transform_returns_the_actor(tools):
+    found, _ = tools
+
+    assert asyncio.run(found["get_actor_transform"](None, "Lamp2")) == ACTORS[1]
+    assert asyncio.run(found["get_actor_transform"](None, "Missing")) == {
+        "success": False,
+        "message": "Actor not found: Missing",
+    }
+
+
+def test_spatial_queries_return_the_actors(tools):
+    found, _ = tools
+
+    radius = asyncio.run(found["find_actors_in_radius"](None, 50.0, actor="Lamp1"))
+    box = asyncio.run(found["find_actors_in_box"](None, [-1, -1, -1], [101, 1, 1]))
+    nearest = asyncio.run(found["nearest_actors"](None, 2, location=[90.0, 0.0, 0.0]))
+
+    assert [actor["name"] for actor in radius["actors"]] == ["Floor"]
+    assert [actor["name"] for actor in box["actors"]] == ["Lamp1", "Lamp2"]
+    assert [actor["name"] for actor in nearest["actors"]] == ["Lamp2", "Lamp1"]
+    assert nearest["actors"][0]["distance"] == 10.0
+
+
+def test_spatial_query_errors_use_the_tool_error_format(tools):
+    found, unreal = tools
+    unreal.responses["query_level"] = {"status": "error", "error": "Unreal is unreachable"}
+    expected = {"success": False, "message": "Unreal is unreachable"}
+
+    assert asyncio.run(found["find_actors_in_radius"](None, 50.0, location=[0, 0, 0])) == expected
+    assert asyncio.run(found["find_actors_in_box"](None, [0, 0, 0], [1, 1, 1])) == expected
+    assert asyncio.run(found["nearest_actors"](None, 1, location=[0, 0, 0])) == expected
+
+
+def test_spatial_query_around_a_missing_actor(tools):
+    found, _ = tools
+
+    assert asyncio.run(found["nearest_actors"](None, 1, actor="Missing")) == {
+        "success": False,
+        "message": "Actor not found: Missing",
+    }
+
+
+def test_export_level_snapshot_writes_one_actor_per_line(tools, tmp_path):
+    found, unreal = tools
+    path = tmp_path / "level.jsonl"
+
+    result = asyncio.run(found["export_level_snapshot"](None, str(path)))
+
+    assert result == {
+        "success": True,
+        "path": str(path),
+        "count": 3,
+        "classes": {"PointLight": 2, "StaticMeshActor": 1},
+    }
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == ACTORS
+    assert unreal.streamed == {}
+
+
+def test_export_level_snapshot_passes_filters_and_fields(tools, tmp_path):
+    found, unreal = tools
+    path = tmp_path / "lights.jsonl"
+
+    result = asyncio.run(
+        found["export_level_snapshot"](None, str(path), fields=["name"], actor_class="PointLight")
+    )
+
+    # Without the class field there is nothing to count classes by
+    assert result == {"success": True, "path": str(path), "count": 2}
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        '{"name": "Lamp1"}',
+        '{"name": "Lamp2"}',
+    ]
+    assert unreal.streamed == {"fields": ["name"], "class": "PointLight"}
+
+
+def test_packed_vectors_accepts_nested_or_flat_columns():
+    nested = _packed_vectors([[1, 2, 3], [4.5, 5, 6]], 2, "locations")
+    flat = _packed_vectors([1, 2, 3, 4.5, 5, 6], 2, "locations")
+
+    assert nested == flat == [1.0, 2.0, 3.0, 4.5, 5.0, 6.0]
+    assert all(isinstance(v, float) for v in flat)
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ([[1, 2, 3], [4, 5]], "one [x, y, z] list per actor (2), or 6 packed values"),
+        ([1, 2, 3, 4, 5], "one [x, y, z] list per actor (2), or 6 packed values"),
+        ([[1, 2, 3], [4, 5, float("nan")]], "must only hold finite numbers"),
+        ([1, 2, 3, 4, True, 6], "must only hold finite numbers"),
+        ("1, 2, 3", "must be a list"),
+    ],
+)
+def test_packed_vectors_rejects_bad_columns(values, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        _packed_vectors(values, 2, "locations")
+
+
+def test_create_actors_list_and_columnar_forms_send_the_same_commands(tools):
+    found, unreal = tools
+
+    listed = asyncio.run(
+        found["create_actors"](
+            None,
+            actors=[
+                {"name": "A", "type": "PointLight", "location": [1, 2, 3]},
+                {"name": "B", "type": "StaticMeshActor", "scale": [2, 2, 2]},
+            ],
+        )
+    )
+    columnar = asyncio.run(
+        found["create_actors"](
+            None,
+            names=["A", "B"],
+            types=["PointLight", "StaticMeshActor"],
+            locations=[1, 2, 3, 0, 0, 0],
+            rotations=[[0, 0, 0], [0, 0, 0]],
+            scales=[[1, 1, 1], [2, 2, 2]],
+        )
+    )
+
+    assert listed == columnar
+    assert listed["success"] and listed["created"] == 2
+    assert unreal.batches[0] == unreal.batches[1]
+    assert unreal.batches[0][0] == (
+        "create_actor",
+        {
+            "name": "A",
+            "type": "POINTLIGHT",
+            "location": [1.0, 2.0, 3.0],
+            "rotation": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0],
+        },
+    )
+
+
+def test_create_actors_omits_transform_columns_not_given(tools):
+    found, unreal = tools
+
+    asyncio.run(found["create_actors"](None, names=["A"], types="PointLight"))
+
+    assert unreal.batches == [[("create_actor", {"name": "A", "type": "POINTLIGHT"})]]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"locations": [[0, 0, 0], [0, 0, 0], [0, 0]]}, "'locations' must hold"),
+        ({"rotations": [0, 0, 0, 0, 0, 0, 0, 0, float("inf")]}, "'rotations' must only hold"),
+        ({"types": ["PointLight", "", "PointLight"]}, "Invalid actor types"),
+        ({"names": ["A", "B", "a"]}, "Invalid actor names"),
+    ],
+)
+def test_create_actors_one_bad_row_rejects_the_whole_request(tools, kwargs, message):
+    found, unreal = tools
+    request = {"names": ["A", "B", "C"], "types": "PointLight", **kwargs}
+
+    result = asyncio.run(found["create_actors"](None, **request))
+
+    assert result["success"] is False
+    assert result["message"].startswith(message)
+    assert unreal.batches == []
+    assert unreal.sent == []
+
+
+def test_create_actors_reports_each_actor(tools):
+    found, unreal = tools
+    unreal.responses["send_batch"] = [
+        {"status": "success", "result": {"name": "A"}},
+        {"status": "error", "error": "Actor with name 'B' already exists"},
+        {"status": "skipped", "error": "Skipped after an earlier command failed"},
+    ]
+
+    result = asyncio.run(
+        found["create_actors"](None, names=["A", "B", "C"], types="PointLight", stop_on_error=True)
+    )
+
+    assert result == {
+        "success": False,
+        "created": 1,
+        "failed": 1,
+        "skipped": 1,
+        "results": [
+            {"name": "A", "status": "success"},
+            {"name": "B", "status": "error", "error": "Actor with name 'B' already exists"},
+            {"name": "C", "status": "skipped"},
+        ],
+    }
+
+
+def moved(params):
+    """A set_actor_transforms response moving the known actors in ``params``."""
+    results = []
+    for index, name in enumerate(params["names"]):
+        if name.startswith("Missing"):
+            results.append({"name": name, "error": f"Actor not found: {name}"})
+        else:
+            results.append({"name": name, "location": params["locations"][3 * index:3 * index + 3]})
+    return {"status": "success", "result": {"results": results}}
+
+
+def test_set_actor_transforms_splits_names_into_commands(tools, monkeypatch):
+    found, unreal = tools
+    monkeypatch.setattr(actor_tools, "UNREAL_MAX_TRANSFORMS_PER_COMMAND", 2)
+    unreal.responses["set_actor_transforms"] = moved
+    names = ["A", "B", "C", "D", "E"]
+
+    result = asyncio.run(
+        found["set_actor_transforms"](None, names, locations=[[i, 0, 0] for i in range(5)])
+    )
+
+    assert result["success"] and result["moved"] == 5
+    assert unreal.sent == [
+        ("set_actor_transforms", {"names": ["A", "B"], "locations": [0.0, 0.0, 0.0, 1.0, 0.0, 0.0]}),
+        ("set_actor_transforms", {"names": ["C", "D"], "locations": [2.0, 0.0, 0.0, 3.0, 0.0, 0.0]}),
+        ("set_actor_transforms", {"names": ["E"], "locations": [4.0, 0.0, 0.0]}),
+    ]
+    assert unreal.batches == []
+
+
+def test_set_actor_transforms_reports_errors_per_name(tools):
+    found, unreal = tools
+    unreal.responses["set_actor_transforms"] = moved
+
+    result = asyncio.run(
+        found["set_actor_transforms"](None, ["A", "Missing1"], locations=[0, 0, 0, 1, 1, 1])
+    )
+
+    assert result == {
+        "success": False,
+        "moved": 1,
+        "failed": 1,
+        "skipped": 0,
+        "results": [
+            {"name": "A", "status": "success"},
+            {"name": "Missing1", "status": "error", "error": "Actor not found: Missing1"},
+        ],
+    }
+
+
+def test_set_actor_transforms_falls_back_on_older_plugins(tools, monkeypatch):
+    found, unreal = tools
+    monkeypatch.setattr(actor_tools, "UNREAL_MAX_TRANSFORMS_PER_COMMAND", 2)
+    unreal.responses["set_actor_transforms"] = {
+        "status": "error",
+        "error": "Unknown command: set_actor_transforms",
+    }
+
+    result = asyncio.run(
+        found["set_actor_transforms"](
+            None, ["A", "B", "C"], locations=[[1, 0, 0], [2, 0, 0], [3, 0, 0]], scales=[2] * 9
+        )
+    )
+
+    assert result["success"] and result["moved"] == 3
+    assert unreal.batches == [
+        [
+            ("set_actor_transform", {"name": "A", "location": [1.0, 0.0, 0.0], "scale": [2.0] * 3}),
+            ("set_actor_transform", {"name": "B", "location": [2.0, 0.0, 0.0], "scale": [2.0] * 3}),
+        ],
+        [("set_actor_transform", {"name": "C", "location": [3.0, 0.0, 0.0], "scale": [2.0] * 3})],
+    ]
+
+
+def test_set_actor_transforms_error_response_fails_every_name_in_its_command(tools, monkeypatch):
+    found, unreal = tools
+    monkeypatch.setattr(actor_tools, "UNREAL_MAX_TRANSFORMS_PER_COMMAND", 2)
+    responses = iter(
+        [
+            {"status": "success", "result": {"results": [{"name": "A"}, {"name": "B"}]}},
+            {"status": "error", "error": "Timed out"},
+        ]
+    )
+    unreal.responses["set_actor_transforms"] = lambda params: next(responses)
+
+    result = asyncio.run(found["set_actor_transforms"](None, ["A", "B", "C"], scales=[1] * 9))
+
+    assert [item["status"] for item in result["results"]] == ["success", "success", "error"]
+    assert result["results"][2]["error"] == "Timed out"
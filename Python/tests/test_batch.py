@@ -0,0 +1,119 @@
+"""Tests for sending commands in batches through both connections."""
+
+import asyncio
+
+import pytest
+
+from server import core
+from server.core import AsyncUnrealConnection, UnrealConnection
+
+
+class FakePlugin:
+    """Runs commands like the plugin, failing those whose params ask it to."""
+
+    def __init__(self, batches=True):
+        self.batches = batches
+        self.sent = []
+
+    def run(self, command, params):
+        if (params or {}).get("fail"):
+            return {"status": "error", "error": f"{command} failed"}
+        return {"status": "success", "result": {"command": command, **(params or {})}}
+
+    def __call__(self, command, params=None, *args, **kwargs):
+        self.sent.append(command)
+        if command != "batch":
+            return self.run(command, params)
+        if not self.batches:
+            return {"status": "error", "error": "Unknown command: batch"}
+
+        results, failed = [], False
+        for sub in params["commands"]:
+            if failed and params["stop_on_error"]:
+                results.append({"status": "skipped"})
+                continue
+            result = self.run(sub["type"], sub["params"])
+            failed = failed or result["status"] == "error"
+            results.append(result)
+        return {"status": "success", "result": {"results": results}}
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setattr(core, "UNREAL_MAX_BATCH_SIZE", 2)
+
+
+def async_batch(plugin, commands, stop_on_error=False):
+    async def send():
+        unreal = AsyncUnrealConnection()
+
+        async def send_command(command, params=None, *args, **kwargs):
+            return plugin(command, params)
+
+        unreal._send_command = send_command
+        return await unreal.send_batch(commands, stop_on_error)
+
+    return asyncio.run(send())
+
+
+def sync_batch(plugin, commands, stop_on_error=False):
+    unreal = UnrealConnection()
+    unreal.send_command = plugin
+    return unreal.send_batch(commands, stop_on_error)
+
+
+COMMANDS = [("ping", {"n": n}) for n in range(5)]
+
+
+@pytest.mark.parametrize("send_batch", [async_batch, sync_batch])
+def test_commands_are_chunked_and_answered_in_order(small_batches, send_batch):
+    plugin = FakePlugin()
+
+    results = send_batch(plugin, COMMANDS)
+
+    assert plugin.sent == ["batch"] * 3
+    assert [result["result"]["n"] for result in results] == list(range(5))
+
+
+@pytest.mark.parametrize("send_batch", [async_batch, sync_batch])
+def test_older_plugin_runs_commands_one_at_a_time(small_batches, send_batch):
+    plugin = FakePlugin(batches=False)
+
+    results = send_batch(plugin, COMMANDS)
+
+    # One rejected batch per chunk, then each of its commands
+    assert plugin.sent == ["batch", "ping", "ping"] * 2 + ["batch", "ping"]
+    assert [result["result"]["n"] for result in results] == list(range(5))
+
+
+@pytest.mark.parametrize("batches", [True, False])
+@pytest.mark.parametrize("send_batch", [async_batch, sync_batch])
+def test_stop_on_error_skips_the_rest(small_batches, send_batch, batches):
+    plugin = FakePlugin(batches)
+    commands = [("ping", {}), ("ping", {"fail": True}), ("ping", {}), ("ping", {}), ("ping", {})]
+
+    results = send_batch(plugin, commands, stop_on_error=True)
+
+    assert [result["status"] for result in results] == [
+        "success", "error", "skipped", "skipped", "skipped"
+    ]
+    # Chunks after the failure are never sent
+    assert plugin.sent.count("batch") == 1
+
+
+def test_without_stop_on_error_every_command_runs(small_batches):
+    plugin = FakePlugin()
+    commands = [("ping", {"fail": True}), ("ping", {}), ("ping", {})]
+
+    results = async_batch(plugin, commands)
+
+    assert [result["status"] for result in results] == ["error", "success", "success"]
+
+
+def test_failed_batch_fails_each_command(small_batches):
+    def unreachable(command, params=None, *args, **kwargs):
+        return {"status": "error", "error": "Connection refused"}
+
+    results = async_batch(unreachable, COMMANDS[:3])
+
+    assert results == [{"status": "error", "error": "Connection refused"}] * 3
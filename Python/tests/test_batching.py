@@ -0,0 +1,171 @@
+"""Tests for the write coalescing in server.batching."""
+
+import asyncio
+
+from server.batching import LatestWinsWrites, WriteCoalescer, latest_wins_key
+from server.core import AsyncUnrealConnection
+
+
+class FakeBatches:
+    """Records each batch and answers every command with its own params."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, commands):
+        self.batches.append([command for command, _ in commands])
+        return [{"status": "success", "result": params} for _, params in commands]
+
+
+def test_window_flush_sends_one_batch_with_a_response_per_caller():
+    async def run():
+        send = FakeBatches()
+        coalescer = WriteCoalescer(send, window=0.01, max_size=50)
+        results = await asyncio.gather(
+            *(coalescer.submit("set_component_property", {"n": n}) for n in range(3))
+        )
+        return send, results
+
+    send, results = asyncio.run(run())
+
+    assert send.batches == [["set_component_property"] * 3]
+    assert [result["result"]["n"] for result in results] == [0, 1, 2]
+
+
+def test_size_cap_flushes_without_waiting_for_the_window():
+    async def run():
+        send = FakeBatches()
+        coalescer = WriteCoalescer(send, window=60.0, max_size=2)
+        started = asyncio.get_running_loop().time()
+        await asyncio.wait_for(
+            asyncio.gather(*(coalescer.submit("add_blueprint_variable", {}) for _ in range(2))),
+            1.0,
+        )
+        return send, asyncio.get_running_loop().time() - started
+
+    send, elapsed = asyncio.run(run())
+
+    assert send.batches == [["add_blueprint_variable"] * 2]
+    assert elapsed < 1.0
+
+
+def test_caller_that_gave_up_is_not_sent():
+    async def run():
+        send = FakeBatches()
+        coalescer = WriteCoalescer(send, window=0.01, max_size=50)
+        abandoned = asyncio.create_task(coalescer.submit("add_blueprint_variable", {"n": 0}))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        result = await coalescer.submit("add_blueprint_variable", {"n": 1})
+        return send, result
+
+    send, result = asyncio.run(run())
+
+    assert send.batches == [["add_blueprint_variable"]]
+    assert result["result"] == {"n": 1}
+
+
+def test_other_commands_flush_the_buffer_first():
+    async def run():
+        unreal = AsyncUnrealConnection(coalesce_writes=True, mirror_level=False)
+        sent = []
+
+        async def send_command(command, params=None, *args, **kwargs):
+            sent.append(command)
+            if command == "batch":
+                return {
+                    "status": "success",
+                    "result": {"results": [{"status": "success"} for _ in params["commands"]]},
+                }
+            return {"status": "success", "result": {}}
+
+        unreal._send_command = send_command
+        buffered = asyncio.create_task(
+            unreal.send_command("set_component_property", {"blueprint_name": "BP"})
+        )
+        await asyncio.sleep(0)
+        await unreal.send_command("compile_blueprint", {"blueprint_name": "BP"})
+        return sent, await buffered
+
+    sent, buffered = asyncio.run(run())
+
+    # The buffered write reaches Unreal before the command sent after it
+    assert sent == ["batch", "compile_blueprint"]
+    assert buffered["status"] == "success"
+
+
+class HeldWrites:
+    """Records each write sent, holding them until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, command, params, deadline):
+        self.sent.append(params)
+        await self.release.wait()
+        return {"status": "success", "result": {"sent": len(self.sent)}}
+
+
+def submit_transform(writes, **params):
+    params = {"name": "Cube", **params}
+    key = latest_wins_key("set_actor_transform", params)
+    return asyncio.create_task(writes.submit(key, "set_actor_transform", params))
+
+
+def test_waiting_write_is_replaced_and_fields_merged():
+    async def run():
+        send = HeldWrites()
+        writes = LatestWinsWrites(send)
+        in_flight = submit_transform(writes, location=[0, 0, 0])
+        await asyncio.sleep(0)
+        replaced = submit_transform(writes, location=[1, 2, 3], scale=[2, 2, 2])
+        newest = submit_transform(writes, rotation=[0, 90, 0], scale=[3, 3, 3])
+        await asyncio.sleep(0)
+        send.release.set()
+        results = await asyncio.gather(in_flight, replaced, newest)
+        return send.sent, results
+
+    sent, (in_flight, replaced, newest) = asyncio.run(run())
+
+    # The rotation-only write keeps the location it replaced
+    assert sent == [
+        {"name": "Cube", "location": [0, 0, 0]},
+        {"name": "Cube", "location": [1, 2, 3], "rotation": [0, 90, 0], "scale": [3, 3, 3]},
+    ]
+    assert in_flight["result"] == {"sent": 1}
+    # Replaced callers get the response to the write that was sent
+    assert replaced == newest == {"status": "success", "result": {"sent": 2}}
+
+
+def test_unmerged_commands_replace_params_whole():
+    async def run():
+        send = HeldWrites()
+        writes = LatestWinsWrites(send)
+        key = latest_wins_key("focus_viewport", {"target": None})
+        first = asyncio.create_task(writes.submit(key, "focus_viewport", {"location": [0, 0, 0]}))
+        await asyncio.sleep(0)
+        waiting = [
+            asyncio.create_task(writes.submit(key, "focus_viewport", params))
+            for params in ({"location": [1, 1, 1], "distance": 500}, {"location": [2, 2, 2]})
+        ]
+        await asyncio.sleep(0)
+        send.release.set()
+        await asyncio.gather(first, *waiting)
+        return send.sent
+
+    assert asyncio.run(run()) == [{"location": [0, 0, 0]}, {"location": [2, 2, 2]}]
+
+
+def test_different_targets_are_not_collapsed():
+    async def run():
+        send = HeldWrites()
+        send.release.set()
+        writes = LatestWinsWrites(send)
+        await asyncio.gather(
+            submit_transform(writes, location=[0, 0, 0]),
+            submit_transform(writes, name="Other", location=[1, 1, 1]),
+        )
+        return send.sent
+
+    assert len(asyncio.run(run())) == 2
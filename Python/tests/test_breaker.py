@@ -0,0 +1,91 @@
+"""Tests for server.breaker.CircuitBreaker state transitions."""
+
+import pytest
+
+from server import breaker as breaker_module
+from server.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(breaker_module.time, "monotonic", fake)
+    return fake
+
+
+def make_breaker():
+    return CircuitBreaker("test", failure_threshold=3, base_backoff=1.0, max_backoff=4.0)
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.check()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_one_probe_after_backoff_then_closes_on_success(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 1.0
+    breaker.check()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.check()
+
+
+def test_failed_probe_reopens_with_doubled_backoff_up_to_max(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    for backoff in (2.0, 4.0, 4.0):
+        clock.now += 10.0
+        breaker.check()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.status()["retry_in"] == backoff
+
+
+def test_released_probe_lets_another_through(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 1.0
+    breaker.check()
+
+    breaker.release()
+
+    breaker.check()
+    assert breaker.state == HALF_OPEN
@@ -0,0 +1,52 @@
+"""Tests for how server.core reports failed commands to the circuit breaker."""
+
+import asyncio
+import socket
+
+import pytest
+
+from server import core
+from server.breaker import CLOSED, OPEN
+from server.constants import UNREAL_BREAKER_FAILURE_THRESHOLD
+
+
+@pytest.fixture
+def unreachable(monkeypatch):
+    """Point the connections at a local port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setattr(core, "UNREAL_PORT", port)
+    monkeypatch.setattr(core, "_async_unreal_connection", None)
+    monkeypatch.setattr(core, "_unreal_connection", None)
+
+
+async def failed_tool_calls(count):
+    """Make ``count`` calls the way the tools do, returning the breaker."""
+    for _ in range(count):
+        unreal = await core.get_async_unreal_connection()
+        response = await unreal.send_command("ping")
+        assert response["status"] == "error"
+    return unreal.breaker
+
+
+def test_failed_calls_below_threshold_keep_breaker_closed(unreachable):
+    breaker = asyncio.run(failed_tool_calls(UNREAL_BREAKER_FAILURE_THRESHOLD - 1))
+
+    assert breaker.state == CLOSED
+    assert breaker.status()["consecutive_failures"] == UNREAL_BREAKER_FAILURE_THRESHOLD - 1
+
+
+def test_breaker_opens_at_threshold_failed_calls(unreachable):
+    breaker = asyncio.run(failed_tool_calls(UNREAL_BREAKER_FAILURE_THRESHOLD))
+
+    assert breaker.state == OPEN
+
+
+def test_failed_sync_calls_count_once_each(unreachable):
+    for _ in range(UNREAL_BREAKER_FAILURE_THRESHOLD - 1):
+        unreal = core.get_unreal_connection()
+        assert unreal.send_command("ping")["status"] == "error"
+
+    assert unreal.breaker.state == CLOSED
+    assert unreal.breaker.status()["consecutive_failures"] == UNREAL_BREAKER_FAILURE_THRESHOLD - 1
@@ -0,0 +1,74 @@
+"""Tests for request deadlines in server.deadlines and how the connection applies them."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+
+from server.breaker import CLOSED
+from server.constants import UNREAL_BREAKER_FAILURE_THRESHOLD, UNREAL_TOOL_DEADLINE
+from server.core import AsyncUnrealConnection
+from server.deadlines import current_deadline
+
+
+def in_request(meta, check):
+    """Run ``check`` in a task handling an MCP request with ``meta``."""
+
+    async def handle():
+        request_ctx.set(SimpleNamespace(meta=meta))
+        return await check()
+
+    return asyncio.run(handle())
+
+
+def test_meta_timeout_becomes_the_shared_deadline():
+    async def check():
+        now = asyncio.get_running_loop().time()
+        first = current_deadline()
+        await asyncio.sleep(0.02)
+        return now, first, current_deadline()
+
+    now, first, later = in_request(SimpleNamespace(timeout=3), check)
+
+    assert first == pytest.approx(now + 3, abs=0.01)
+    # Fixed by the first command, not restarted by later ones
+    assert later == first
+
+
+@pytest.mark.parametrize("meta", [None, SimpleNamespace(timeout=-1), SimpleNamespace(timeout="5")])
+def test_default_deadline_without_a_usable_meta_timeout(meta):
+    async def check():
+        return asyncio.get_running_loop().time(), current_deadline()
+
+    now, deadline = in_request(meta, check)
+
+    assert deadline == pytest.approx(now + UNREAL_TOOL_DEADLINE, abs=0.01)
+
+
+def test_no_deadline_outside_a_request():
+    async def check():
+        return current_deadline()
+
+    assert asyncio.run(check()) is None
+
+
+def test_running_out_of_time_does_not_trip_the_breaker():
+    async def run():
+        unreal = AsyncUnrealConnection()
+
+        async def slow_request(*args):
+            await asyncio.sleep(10)
+
+        unreal._request = slow_request
+        responses = []
+        for _ in range(UNREAL_BREAKER_FAILURE_THRESHOLD + 1):
+            deadline = asyncio.get_running_loop().time() + 0.01
+            responses.append(await unreal.send_command("create_actor", {}, deadline=deadline))
+        return unreal, responses
+
+    unreal, responses = asyncio.run(run())
+
+    assert all(response["error"].startswith("Deadline exceeded") for response in responses)
+    assert unreal.breaker.state == CLOSED
+    assert unreal.breaker.status()["consecutive_failures"] == 0
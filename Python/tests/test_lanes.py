@@ -0,0 +1,103 @@
+"""Tests for server.lanes.LaneScheduler."""
+
+import asyncio
+
+from server.constants import UNREAL_LANE_SHARES
+from server.lanes import BULK, INTERACTIVE, NORMAL, LaneScheduler, lane_for
+from server.metrics import metrics
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def waiter(scheduler, lane, granted):
+    """Task that takes a slot in ``lane`` and records the order it got it."""
+
+    async def acquire():
+        await scheduler.acquire(lane)
+        granted.append(lane)
+
+    return asyncio.create_task(acquire())
+
+
+def test_commands_are_sorted_into_lanes():
+    assert lane_for("focus_viewport") == INTERACTIVE
+    assert lane_for("create_actor") == NORMAL
+    assert lane_for("batch") == BULK
+
+
+def test_lane_shares_are_enforced():
+    async def run():
+        scheduler = LaneScheduler("test", 4, UNREAL_LANE_SHARES, max_wait=60.0)
+        granted = []
+        tasks = [waiter(scheduler, BULK, granted) for _ in range(2)]
+        tasks += [waiter(scheduler, NORMAL, granted) for _ in range(3)]
+        await settle()
+        # Bulk may hold a quarter of the slots and normal half, leaving room
+        # for interactive commands
+        first = list(granted)
+        await asyncio.wait_for(scheduler.acquire(INTERACTIVE), 1.0)
+        for task in tasks:
+            task.cancel()
+        return first
+
+    assert sorted(asyncio.run(run())) == [BULK, NORMAL, NORMAL]
+
+
+def test_interactive_commands_jump_bulk():
+    async def run():
+        scheduler = LaneScheduler("test", 1, UNREAL_LANE_SHARES, max_wait=60.0)
+        granted = []
+        await scheduler.acquire(NORMAL)
+        tasks = [waiter(scheduler, lane, granted) for lane in (BULK, NORMAL, INTERACTIVE)]
+        await settle()
+        scheduler.release(NORMAL)
+        await settle()
+        for _ in range(2):
+            # Each command finishes before the next is let through
+            scheduler.release(granted[-1])
+            await settle()
+        return granted
+
+    assert asyncio.run(run()) == [INTERACTIVE, NORMAL, BULK]
+
+
+def test_command_waiting_past_max_wait_is_promoted():
+    async def run():
+        scheduler = LaneScheduler("promote", 1, UNREAL_LANE_SHARES, max_wait=0.02)
+        granted = []
+        await scheduler.acquire(NORMAL)
+        waiter(scheduler, BULK, granted)
+        await asyncio.sleep(0.03)
+        waiter(scheduler, INTERACTIVE, granted)
+        await settle()
+        scheduler.release(NORMAL)
+        await settle()
+        return granted
+
+    promoted = metrics.snapshot()["counters"].get("lanes.promote.bulk.promoted", 0)
+    assert asyncio.run(run()) == [BULK]
+    assert metrics.snapshot()["counters"]["lanes.promote.bulk.promoted"] == promoted + 1
+
+
+def test_cancelled_waiter_already_granted_releases_its_slot():
+    async def run():
+        scheduler = LaneScheduler("test", 1, UNREAL_LANE_SHARES, max_wait=60.0)
+        granted = []
+        await scheduler.acquire(NORMAL)
+        cancelled = waiter(scheduler, NORMAL, granted)
+        await settle()
+        # Granted, then cancelled before it could run
+        scheduler.release(NORMAL)
+        cancelled.cancel()
+        following = waiter(scheduler, NORMAL, granted)
+        await settle()
+        return cancelled, following, granted
+
+    cancelled, following, granted = asyncio.run(run())
+
+    assert cancelled.cancelled()
+    assert following.done()
+    assert granted == [NORMAL]
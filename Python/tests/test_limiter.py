@@ -0,0 +1,78 @@
+"""Tests for server.limiter.AIMDLimiter."""
+
+import pytest
+
+from server import limiter as limiter_module
+from server.limiter import AIMDLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_limiter(**kwargs):
+    return AIMDLimiter("test", initial=4, minimum=1, maximum=16, **kwargs)
+
+
+def test_initial_limit_is_clamped():
+    assert AIMDLimiter("test", initial=100, minimum=1, maximum=8).limit == 8
+    assert AIMDLimiter("test", initial=0, minimum=2, maximum=8).limit == 2
+
+
+def test_grows_additively_only_while_saturated(clock):
+    limiter = make_limiter()
+    for _ in range(4):
+        limiter.observe("ping", 0.01, saturated=False)
+    assert limiter.limit == 4
+
+    # One more slot per limit's worth of responses
+    for _ in range(4):
+        limiter.observe("ping", 0.01, saturated=True)
+    assert int(limiter.limit) == 4
+    limiter.observe("ping", 0.01, saturated=True)
+    assert int(limiter.limit) == 5
+
+
+def test_never_grows_past_maximum(clock):
+    limiter = make_limiter()
+    for _ in range(1000):
+        limiter.observe("ping", 0.01, saturated=True)
+
+    assert limiter.limit == 16
+
+
+def test_backs_off_when_latency_climbs_above_baseline(clock):
+    limiter = make_limiter()
+    limiter.observe("ping", 0.01, saturated=True)
+    limits = [limiter.observe("ping", 0.5, saturated=True) for _ in range(10)]
+
+    # Cut multiplicatively once; the cooldown holds off a second cut
+    assert min(limits) == 3
+    assert limiter.gradient < limiter.tolerance
+
+    clock[0] += 1.0
+    assert limiter.observe("ping", 0.5, saturated=True) == 2
+
+
+def test_baselines_are_per_command(clock):
+    limiter = make_limiter()
+    limiter.observe("ping", 0.001, saturated=True)
+    for _ in range(10):
+        # Slow, but normal for this command
+        limiter.observe("compile_blueprint", 2.0, saturated=True)
+
+    assert limiter.limit > 4
+
+
+def test_timeouts_decrease_at_most_once_per_cooldown(clock):
+    limiter = make_limiter()
+    assert limiter.dropped() == 2
+    assert limiter.dropped() == 2
+
+    clock[0] += 1.0
+    assert limiter.dropped() == 1
+    clock[0] += 1.0
+    assert limiter.dropped() == 1
@@ -0,0 +1,99 @@
+"""Tests for server.mirror.LevelMirror seeding and the reads it answers."""
+
+import asyncio
+
+from server.core import AsyncUnrealConnection
+from server.mirror import LevelMirror, is_whole_level
+
+ACTORS = [
+    {"name": "Lamp", "class": "PointLight", "location": [0.0, 0.0, 0.0]},
+    {"name": "Floor", "class": "StaticMeshActor", "location": [500.0, 0.0, 0.0]},
+]
+
+
+def test_seed_loads_streamed_actors():
+    mirror = LevelMirror(max_age=60.0, cell_size=1000.0)
+
+    assert mirror.seed(iter(ACTORS), mirror.generation)
+    assert not mirror.needs_sync()
+    assert mirror.answer("get_actors_in_level", {})["result"]["actors"] == ACTORS
+    assert [actor["name"] for actor in mirror.nearest([400.0, 0.0, 0.0], 1)] == ["Floor"]
+
+
+def test_seed_overtaken_by_a_write_is_ignored():
+    mirror = LevelMirror(max_age=60.0, cell_size=1000.0)
+    generation = mirror.generation
+    mirror.note_write("delete_actor", {"name": "Lamp"})
+
+    assert not mirror.seed(ACTORS, generation)
+    assert mirror.needs_sync()
+
+
+def test_only_unfiltered_listings_read_the_whole_level():
+    assert is_whole_level("get_actors_in_level", None)
+    assert is_whole_level("get_actors_in_level", {"limit": 0})
+    assert not is_whole_level("get_actors_in_level", {"limit": 10})
+    assert not is_whole_level("get_actors_in_level", {"fields": ["name"]})
+    assert not is_whole_level("find_actors_by_name", {"pattern": "Lamp"})
+
+
+def test_default_connection_answers_reads_from_a_streamed_mirror():
+    async def run():
+        unreal = AsyncUnrealConnection()
+        sent = []
+
+        async def stream_actors(params=None, timeout=None):
+            sent.append("stream")
+            for actor in ACTORS:
+                yield actor
+
+        async def send_command(command, params=None, *args, **kwargs):
+            sent.append(command)
+            return {"status": "success", "result": {"actors": []}}
+
+        unreal.stream_actors = stream_actors
+        unreal._send_command = send_command
+        # A stale mirror sends narrow reads to the editor
+        await unreal.send_command("find_actors_by_name", {"pattern": "lamp"})
+        listing = await unreal.send_command("get_actors_in_level", {})
+        found = await unreal.send_command("find_actors_by_name", {"pattern": "lamp"})
+        transform = await unreal.get_actor_transform("Floor")
+        return sent, listing, found, transform
+
+    sent, listing, found, transform = asyncio.run(run())
+
+    assert sent == ["find_actors_by_name", "stream"]
+    assert listing["result"]["actors"] == ACTORS
+    assert [actor["name"] for actor in found["result"]["actors"]] == ["Lamp"]
+    assert transform["result"] == ACTORS[1]
+
+
+def test_spatial_queries_use_the_mirror_when_listings_do_not():
+    async def run():
+        unreal = AsyncUnrealConnection(mirror_level=False)
+        streamed = []
+
+        async def stream_actors(params=None, timeout=None):
+            streamed.append(params)
+            for actor in ACTORS:
+                yield actor
+
+        async def send_command(command, params=None, *args, **kwargs):
+            return {"status": "success", "result": {"actors": []}}
+
+        unreal.stream_actors = stream_actors
+        unreal._send_command = send_command
+        listing = await unreal.send_command("get_actors_in_level", {})
+        # Centred on an actor, looked up in the same listing as the query
+        first = await unreal.query_level(
+            lambda level: level.nearest(level.get_actor("Floor")["location"], 1, exclude="Floor")
+        )
+        second = await unreal.query_level(lambda level: level.in_radius([0.0, 0.0, 0.0], 10.0))
+        return streamed, listing, first, second
+
+    streamed, listing, first, second = asyncio.run(run())
+
+    assert len(streamed) == 1
+    assert listing["result"]["actors"] == []
+    assert [actor["name"] for actor in first["result"]] == ["Lamp"]
+    assert [actor["name"] for actor in second["result"]] == ["Lamp"]
@@ -0,0 +1,169 @@
+"""Tests for server.multiplexer.Multiplexer against a stub stream."""
+
+import asyncio
+import json
+
+import pytest
+
+from server.lanes import NORMAL, LaneScheduler
+from server.multiplexer import Multiplexer
+from server.protocol import FRAME_HEADER, UnrealTimeout, encode_frame
+
+
+class StubStream:
+    """Stands in for a pipelined stream; the test plays the plugin."""
+
+    def __init__(self):
+        self.reader = asyncio.StreamReader()
+        self.writer = self
+        self.written = bytearray()
+        self.closed = False
+        # Cleared to hold the writer task in drain()
+        self.drained = asyncio.Event()
+        self.drained.set()
+
+    def write(self, data: bytes):
+        self.written += data
+
+    async def drain(self):
+        await self.drained.wait()
+
+    def is_alive(self) -> bool:
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+    def sent(self):
+        """Commands written so far, decoded."""
+        messages, pos = [], 0
+        while pos < len(self.written):
+            (size,) = FRAME_HEADER.unpack_from(self.written, pos)
+            pos += FRAME_HEADER.size
+            messages.append(json.loads(self.written[pos : pos + size]))
+            pos += size
+        return messages
+
+    def respond(self, request_id: int, **response):
+        self.reader.feed_data(encode_frame(json.dumps({"id": request_id, **response}).encode()))
+
+
+async def settle():
+    """Let the writer and reader tasks catch up."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def multiplexer(stream, limit=4, **kwargs):
+    slots = LaneScheduler("test", limit, {}, max_wait=60.0)
+    return Multiplexer(stream, slots, **kwargs)
+
+
+def test_out_of_order_responses_are_matched_by_id():
+    async def run():
+        stream = StubStream()
+        mux = multiplexer(stream)
+        first = asyncio.create_task(mux.submit("first", {}, 5.0, NORMAL))
+        second = asyncio.create_task(mux.submit("second", {}, 5.0, NORMAL))
+        await settle()
+        ids = {message["type"]: message["id"] for message in stream.sent()}
+
+        stream.respond(ids["second"], status="success", result="2")
+        stream.respond(ids["first"], status="success", result="1")
+        return await first, await second
+
+    first, second = asyncio.run(run())
+
+    assert first == {"status": "success", "result": "1"}
+    assert second == {"status": "success", "result": "2"}
+
+
+def test_late_response_is_dropped_and_holds_its_slot_until_then():
+    late = []
+
+    async def run():
+        stream = StubStream()
+        mux = multiplexer(stream, limit=1, on_late_response=lambda command, _: late.append(command))
+        with pytest.raises(UnrealTimeout):
+            await mux.submit("slow", {}, 0.01, NORMAL)
+
+        # The editor may still be running it, so the next command waits
+        following = asyncio.create_task(mux.submit("next", {}, 5.0, NORMAL))
+        await settle()
+        assert [message["type"] for message in stream.sent()] == ["slow"]
+
+        stream.respond(1, status="success", result="late")
+        await settle()
+        assert [message["type"] for message in stream.sent()] == ["slow", "next"]
+        stream.respond(2, status="success", result="next")
+        return await following
+
+    assert asyncio.run(run()) == {"status": "success", "result": "next"}
+    assert late == ["slow"]
+
+
+def test_command_abandoned_while_queued_is_never_written():
+    async def run():
+        stream = StubStream()
+        mux = multiplexer(stream)
+        stream.drained.clear()
+        first = asyncio.create_task(mux.submit("first", {}, 5.0, NORMAL))
+        await settle()
+        # The writer is held in drain(), so this one stays queued
+        abandoned = asyncio.create_task(mux.submit("abandoned", {}, 5.0, NORMAL))
+        await settle()
+        abandoned.cancel()
+        third = asyncio.create_task(mux.submit("third", {}, 5.0, NORMAL))
+        await settle()
+        stream.drained.set()
+        await settle()
+
+        sent = stream.sent()
+        for message in sent:
+            stream.respond(message["id"], status="success")
+        await first, await third
+        return [message["type"] for message in sent]
+
+    assert asyncio.run(run()) == ["first", "third"]
+
+
+def test_every_command_fails_when_the_stream_ends():
+    closed = []
+
+    async def run():
+        stream = StubStream()
+        mux = multiplexer(stream, limit=1, on_close=closed.append)
+        in_flight = asyncio.create_task(mux.submit("first", {}, 5.0, NORMAL))
+        waiting = asyncio.create_task(mux.submit("second", {}, 5.0, NORMAL))
+        await settle()
+
+        stream.reader.feed_eof()
+        results = await asyncio.gather(in_flight, waiting, return_exceptions=True)
+        return mux, stream, results
+
+    mux, stream, results = asyncio.run(run())
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert mux.closed and stream.closed
+    assert closed == [mux]
+
+
+@pytest.mark.parametrize("cancellation", [True, False])
+def test_cancelled_caller_sends_cancel_with_its_request_id(cancellation):
+    async def run():
+        stream = StubStream()
+        mux = multiplexer(stream, cancellation=cancellation)
+        kept = asyncio.create_task(mux.submit("kept", {}, 5.0, NORMAL))
+        abandoned = asyncio.create_task(mux.submit("abandoned", {}, 5.0, NORMAL))
+        await settle()
+        abandoned.cancel()
+        await settle()
+        sent = stream.sent()
+        kept.cancel()
+        return sent
+
+    sent = asyncio.run(run())
+
+    abandoned_id = sent[1]["id"]
+    cancels = [message for message in sent if message["type"] == "cancel"]
+    assert cancels == ([{"type": "cancel", "params": {"id": abandoned_id}}] if cancellation else [])
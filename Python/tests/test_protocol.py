@@ -0,0 +1,191 @@
+"""Tests for the wire protocol helpers in server.protocol."""
+
+import asyncio
+import json
+import socket
+
+import pytest
+
+from server import protocol
+from server.protocol import (
+    FRAME_HEADER,
+    JsonArrayItems,
+    JsonMessageScanner,
+    UnrealConnectionClosed,
+    encode_command,
+    encode_frame,
+    read_frame,
+    recv_frame,
+)
+
+
+def test_frame_round_trip_over_a_socket():
+    payload = encode_command("ping", {"text": "café"}, request_id=7)
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(encode_frame(payload) + encode_frame(b"{}"))
+
+        assert recv_frame(right) == payload
+        assert recv_frame(right) == b"{}"
+    assert json.loads(payload) == {"type": "ping", "params": {"text": "café"}, "id": 7}
+
+
+def test_oversized_frame_header_is_rejected(monkeypatch):
+    monkeypatch.setattr(protocol, "MAX_FRAME_SIZE", 16)
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(FRAME_HEADER.pack(0xFFFFFFFF))
+
+        with pytest.raises(Exception, match="exceeds"):
+            recv_frame(right)
+
+
+def test_closed_before_and_inside_a_frame():
+    left, right = socket.socketpair()
+    with right:
+        left.close()
+        with pytest.raises(UnrealConnectionClosed):
+            recv_frame(right)
+
+    left, right = socket.socketpair()
+    with right:
+        left.sendall(FRAME_HEADER.pack(10) + b"abc")
+        left.close()
+        with pytest.raises(Exception, match="3 of 10 bytes"):
+            recv_frame(right)
+
+
+def feed_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def test_async_read_frame():
+    async def read():
+        reader = feed_reader(encode_frame(b'{"a": 1}') + FRAME_HEADER.pack(5) + b"ab")
+        first = await read_frame(reader)
+        with pytest.raises(Exception, match="2 of 5 bytes"):
+            await read_frame(reader)
+        return first
+
+    assert asyncio.run(read()) == b'{"a": 1}'
+
+
+def test_async_read_frame_rejects_oversized_header(monkeypatch):
+    monkeypatch.setattr(protocol, "MAX_FRAME_SIZE", 16)
+
+    async def read():
+        with pytest.raises(Exception, match="exceeds"):
+            await read_frame(feed_reader(FRAME_HEADER.pack(17)))
+        with pytest.raises(UnrealConnectionClosed):
+            await read_frame(feed_reader(b""))
+
+    asyncio.run(read())
+
+
+MESSAGE = json.dumps(
+    {
+        "status": "success",
+        "result": {
+            "text": 'brackets } ] { [ and "quotes" and \\ backslashes',
+            "nested": [[1, [2, [3, [4]]]], {"a": {"b": {"c": {}}}}],
+            "unicode": "café",
+        },
+    }
+).encode("utf-8")
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(MESSAGE)])
+def test_scanner_finds_message_end_across_chunks(size):
+    scanner = JsonMessageScanner()
+    ends = [scanner.feed(chunk) for chunk in chunked(MESSAGE, size)]
+
+    assert ends[:-1] == [-1] * (len(ends) - 1)
+    assert ends[-1] == len(MESSAGE)
+    assert json.loads(bytes(scanner.buffer)) == json.loads(MESSAGE)
+
+
+def test_scanner_reports_end_before_trailing_bytes():
+    scanner = JsonMessageScanner()
+    assert scanner.feed(MESSAGE + b'{"next"') == len(MESSAGE)
+
+
+def test_scanner_waits_for_escaped_character():
+    scanner = JsonMessageScanner()
+    assert scanner.feed(b'{"a": "x\\') == -1
+    assert scanner.feed(b'"}') == -1
+    assert scanner.feed(b'"}') == len(b'{"a": "x\\"}"}')
+
+
+ACTORS = [
+    {"name": f"Actor{i}", "class": "PointLight", "location": [i, -i, 0.5], "tags": ["]", "{"]}
+    for i in range(50)
+]
+# One item nested deeper than the fast path decodes whole
+ACTORS.append({"name": "Deep", "extra": {"a": {"b": {"c": [1, {"d": "}"}]}}}})
+LISTING = json.dumps(
+    {"status": "success", "result": {"actors": ACTORS, "total": len(ACTORS), "note": "actors"}}
+).encode("utf-8")
+
+
+def decode(data: bytes, size: int):
+    parser = JsonArrayItems("actors")
+    items = []
+    for chunk in chunked(data, size):
+        items.extend(parser.feed(chunk))
+    return parser, items
+
+
+@pytest.mark.parametrize("size", [1, 5, 13, 256, len(LISTING)])
+def test_array_items_decoded_across_chunks(size):
+    parser, items = decode(LISTING, size)
+
+    assert parser.done
+    assert items == ACTORS
+    assert parser.envelope() == {
+        "status": "success",
+        "result": {"actors": [], "total": len(ACTORS), "note": "actors"},
+    }
+    assert parser.trailing == 0
+
+
+def test_array_items_yields_items_before_message_ends():
+    parser = JsonArrayItems("actors")
+    head = LISTING[: LISTING.index(b'"Actor3"')]
+
+    items = parser.feed(head)
+
+    assert not parser.done
+    assert [item["name"] for item in items] == ["Actor0", "Actor1", "Actor2"]
+
+
+def test_array_items_key_as_string_value_is_not_the_array():
+    data = json.dumps({"label": "actors", "actors": [{"name": "A"}]}).encode("utf-8")
+    parser, items = decode(data, 1)
+
+    assert items == [{"name": "A"}]
+    assert parser.envelope() == {"label": "actors", "actors": []}
+
+
+def test_array_items_error_response_is_all_envelope():
+    data = json.dumps({"status": "error", "error": "No world"}).encode("utf-8")
+    parser, items = decode(data, 3)
+
+    assert parser.done
+    assert items == []
+    assert parser.envelope() == {"status": "error", "error": "No world"}
+
+
+def test_array_items_counts_trailing_bytes():
+    parser = JsonArrayItems("actors")
+    parser.feed(LISTING + b"{}")
+
+    assert parser.done
+    assert parser.trailing == 2
+
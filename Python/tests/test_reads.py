@@ -0,0 +1,139 @@
+"""Tests for the read sharing and caching in server.reads."""
+
+import asyncio
+
+from server.core import AsyncUnrealConnection
+from server.reads import ResponseCache, read_key
+
+
+def test_shared_read_answers_each_caller_by_its_own_deadline():
+    async def run():
+        unreal = AsyncUnrealConnection(cache_reads=False, mirror_level=False)
+        requests = []
+
+        async def request(command, params, timeout, lane):
+            requests.append(command)
+            await asyncio.sleep(0.05)
+            return {"status": "success", "result": {"name": params["name"]}}
+
+        unreal._request = request
+        now = asyncio.get_running_loop().time()
+        params = {"name": "Cube"}
+        hurried, patient = await asyncio.gather(
+            unreal.send_command("get_actor_properties", params, deadline=now + 0.01),
+            unreal.send_command("get_actor_properties", params, deadline=now + 5.0),
+        )
+        return requests, hurried, patient
+
+    requests, hurried, patient = asyncio.run(run())
+
+    assert requests == ["get_actor_properties"]
+    assert hurried["error"].startswith("Deadline exceeded")
+    # The first caller running out of time doesn't cut the request short
+    assert patient == {"status": "success", "result": {"name": "Cube"}}
+
+
+OK = {"status": "success", "result": {}}
+
+
+def cached(cache, command, params, response=OK):
+    key = read_key(command, params)
+    cache.put(key, command, params, response, cache.generation)
+    return key
+
+
+def make_cache(max_entries=10, ttl=60.0):
+    return ResponseCache(
+        max_entries,
+        {
+            "get_actors_in_level": ttl,
+            "get_actor_properties": ttl,
+            "find_blueprint_nodes": ttl,
+        },
+    )
+
+
+def test_hit_after_put_and_only_configured_commands_cacheable():
+    cache = make_cache()
+    key = cached(cache, "get_actors_in_level", {})
+
+    assert cache.get(key) == OK
+    assert cache.cacheable("get_actor_properties")
+    assert not cache.cacheable("take_screenshot")
+
+
+def test_errors_are_not_cached():
+    cache = make_cache()
+    key = cached(cache, "get_actors_in_level", {}, {"status": "error", "error": "x"})
+
+    assert cache.get(key) is None
+
+
+def test_entries_expire_after_ttl():
+    cache = make_cache(ttl=0.0)
+    key = cached(cache, "get_actors_in_level", {})
+
+    assert cache.get(key) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = make_cache(max_entries=2)
+    first = cached(cache, "get_actor_properties", {"name": "A"})
+    second = cached(cache, "get_actor_properties", {"name": "B"})
+    cache.get(first)
+    third = cached(cache, "get_actor_properties", {"name": "C"})
+
+    assert cache.get(second) is None
+    assert cache.get(first) == OK
+    assert cache.get(third) == OK
+
+
+def test_response_to_read_sent_before_a_write_is_not_cached():
+    cache = make_cache()
+    key = read_key("get_actors_in_level", {})
+    generation = cache.generation
+    cache.invalidate("create_actor", {"name": "A"})
+    cache.put(key, "get_actors_in_level", {}, OK, generation)
+
+    assert cache.get(key) is None
+
+
+def test_actor_write_drops_that_actor_and_level_reads_only():
+    cache = make_cache()
+    level = cached(cache, "get_actors_in_level", {})
+    actor_a = cached(cache, "get_actor_properties", {"name": "A"})
+    actor_b = cached(cache, "get_actor_properties", {"name": "B"})
+    nodes = cached(cache, "find_blueprint_nodes", {"blueprint_name": "BP"})
+
+    cache.invalidate("set_actor_transform", {"name": "A"})
+
+    assert cache.get(level) is None
+    assert cache.get(actor_a) is None
+    assert cache.get(actor_b) == OK
+    assert cache.get(nodes) == OK
+
+
+def test_blueprint_write_drops_only_that_blueprint():
+    cache = make_cache()
+    level = cached(cache, "get_actors_in_level", {})
+    nodes = cached(cache, "find_blueprint_nodes", {"blueprint_name": "BP"})
+    other = cached(cache, "find_blueprint_nodes", {"blueprint_name": "Other"})
+
+    cache.invalidate("compile_blueprint", {"blueprint_name": "BP"})
+
+    assert cache.get(nodes) is None
+    assert cache.get(other) == OK
+    assert cache.get(level) == OK
+
+
+def test_unknown_write_drops_everything_and_uncached_effect_nothing():
+    cache = make_cache()
+    level = cached(cache, "get_actors_in_level", {})
+    generation = cache.generation
+
+    cache.invalidate("focus_viewport", {"target": "A"})
+    assert cache.get(level) == OK
+    assert cache.generation == generation
+
+    cache.invalidate("some_new_command", {})
+    assert cache.get(level) is None
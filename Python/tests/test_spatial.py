@@ -0,0 +1,99 @@
+"""Tests for server.spatial.GridIndex, checked against brute force."""
+
+import math
+import random
+
+import pytest
+
+from server.spatial import GridIndex
+
+
+def squared(a, b):
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(7)
+    # Mostly flat, with a few outliers far from the rest
+    found = {
+        f"P{i}": (rng.uniform(-5000, 5000), rng.uniform(-5000, 5000), rng.uniform(0, 300))
+        for i in range(400)
+    }
+    found["Far"] = (90000.0, -90000.0, 5000.0)
+    found["Edge"] = (1000.0, 1000.0, 0.0)
+    return found
+
+
+@pytest.fixture
+def index(points):
+    grid = GridIndex(1000.0)
+    for name, point in points.items():
+        grid.update(name, point)
+    return grid
+
+
+def test_in_radius_matches_brute_force(index, points):
+    rng = random.Random(1)
+    for _ in range(50):
+        center = (rng.uniform(-6000, 6000), rng.uniform(-6000, 6000), 0.0)
+        radius = rng.uniform(0, 3000)
+        expected = sorted(
+            (math.sqrt(squared(center, point)), name)
+            for name, point in points.items()
+            if squared(center, point) <= radius * radius
+        )
+        assert index.in_radius(center, radius) == expected
+
+
+def test_in_box_includes_edges(index, points):
+    low, high = (0.0, 0.0, 0.0), (1000.0, 1000.0, 300.0)
+    expected = {
+        name
+        for name, point in points.items()
+        if all(l <= c <= h for l, c, h in zip(low, point, high))
+    }
+
+    found = index.in_box(low, high)
+
+    assert "Edge" in found
+    assert set(found) == expected
+
+
+def test_nearest_matches_brute_force(index, points):
+    rng = random.Random(2)
+    for k in (1, 5, 25):
+        center = (rng.uniform(-6000, 6000), rng.uniform(-6000, 6000), 100.0)
+        expected = sorted((squared(center, point), name) for name, point in points.items())[:k]
+        found = index.nearest(center, k)
+        assert [name for _, name in found] == [name for _, name in expected]
+
+
+def test_nearest_far_from_everything_and_filtered(index, points):
+    found = index.nearest((90000.0, -90000.0, 0.0), 2, lambda name: name != "Far")
+
+    assert len(found) == 2
+    assert "Far" not in [name for _, name in found]
+    assert index.nearest((0.0, 0.0, 0.0), 3, lambda name: False) == []
+
+
+def test_nearest_with_more_requested_than_indexed():
+    grid = GridIndex(10.0)
+    grid.update("A", (0, 0, 0))
+    grid.update("B", (100, 0, 0))
+
+    assert grid.nearest((1, 0, 0), 5) == [(1.0, "A"), (99.0, "B")]
+
+
+def test_update_moves_and_remove_forgets():
+    grid = GridIndex(100.0)
+    grid.update("A", (0, 0, 0))
+    grid.update("A", (1000, 0, 0))
+
+    assert grid.in_radius((0, 0, 0), 50) == []
+    assert grid.in_radius((1000, 0, 0), 50) == [(0.0, "A")]
+
+    grid.remove("A")
+    grid.remove("Missing")
+    assert len(grid) == 0
+    assert grid.nearest((0, 0, 0), 1) == []
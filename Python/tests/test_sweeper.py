@@ -0,0 +1,82 @@
+"""Tests for the temporary actor sweeper and what its sweeps invalidate."""
+
+import asyncio
+
+from server.core import AsyncUnrealConnection
+from server.reads import read_key
+from server.sweeper import TEMPORARY_TAG, run_sweeper, sweep_expired
+
+OK = {"status": "success", "result": {}}
+ACTORS = [{"name": "Temp", "location": [0.0, 0.0, 0.0]}, {"name": "Kept", "location": [1.0, 0.0, 0.0]}]
+
+
+def connection(responses):
+    """A connection whose commands are answered from ``responses`` in order."""
+    unreal = AsyncUnrealConnection(mirror_level=True)
+    sent = []
+
+    async def send_command(command, params=None, timeout=None, deadline=None, lane=None):
+        sent.append((command, params))
+        return responses.pop(0)
+
+    unreal._send_command = send_command
+    unreal.sent = sent
+    unreal.mirror.seed(ACTORS, unreal.mirror.generation)
+    for name in ("Temp", "Kept"):
+        key = read_key("get_actor_properties", {"name": name})
+        unreal.cache.put(key, "get_actor_properties", {"name": name}, OK, unreal.cache.generation)
+    return unreal
+
+
+def deleted(names, remaining=0):
+    return {"status": "success", "result": {"deleted": names, "remaining": remaining}}
+
+
+def cached(unreal, name):
+    return unreal.cache.get(read_key("get_actor_properties", {"name": name})) is not None
+
+
+def test_sweep_that_deletes_nothing_invalidates_nothing():
+    async def sweep():
+        unreal = connection([deleted([])])
+        generation = unreal.mirror.generation
+        assert await sweep_expired(unreal, 10) == 0
+        return unreal, generation
+
+    unreal, generation = asyncio.run(sweep())
+
+    assert unreal.sent[0][1]["tag"] == TEMPORARY_TAG
+    assert cached(unreal, "Temp") and cached(unreal, "Kept")
+    assert unreal.mirror.generation == generation
+    assert not unreal.mirror.needs_sync()
+
+
+def test_sweep_invalidates_only_the_deleted_actors():
+    async def sweep():
+        unreal = connection([deleted(["Temp"], remaining=1), deleted([])])
+        assert await sweep_expired(unreal, 1) == 1
+        return unreal
+
+    unreal = asyncio.run(sweep())
+
+    assert len(unreal.sent) == 2
+    assert not cached(unreal, "Temp")
+    assert cached(unreal, "Kept")
+    assert unreal.mirror.get_actor("Temp") is None
+    assert unreal.mirror.get_actor("Kept") is not None
+    assert not unreal.mirror.needs_sync()
+
+
+def test_sweeper_stops_on_plugin_without_delete_actors():
+    unsupported = {"status": "error", "error": "Unknown command: delete_actors"}
+
+    async def sweep():
+        unreal = connection([unsupported, unsupported])
+
+        async def get_connection():
+            return unreal
+
+        await asyncio.wait_for(run_sweeper(get_connection, 0, 10), 1.0)
+        return unreal
+
+    assert len(asyncio.run(sweep()).sent) == 1
@@ -0,0 +1,61 @@
+"""Tests for server.timeouts.TimeoutPolicy."""
+
+import pytest
+
+from server.constants import (
+    UNREAL_COMMAND_TIMEOUTS,
+    UNREAL_MAX_TIMEOUT,
+    UNREAL_MIN_TIMEOUT,
+    UNREAL_SOCKET_TIMEOUT,
+)
+from server.core import _make_timeout_policy
+
+
+def test_seeded_timeouts_before_enough_samples():
+    policy = _make_timeout_policy()
+    command, seeded = next(iter(UNREAL_COMMAND_TIMEOUTS.items()))
+
+    assert policy.timeout_for(command) == seeded
+    assert policy.timeout_for("never_seen") == UNREAL_SOCKET_TIMEOUT
+
+    for _ in range(9):
+        policy.observe(command, 0.5)
+    assert policy.timeout_for(command) == seeded
+
+
+def test_learned_timeout_after_ten_samples():
+    policy = _make_timeout_policy()
+    for _ in range(9):
+        policy.observe("ping", 0.5)
+    policy.observe("ping", 2.0)
+
+    # p99 of the window is the slow sample, above the EWMA
+    assert policy.timeout_for("ping") == pytest.approx(2.0 * 3)
+
+
+def test_learned_timeout_is_clamped():
+    policy = _make_timeout_policy()
+    for _ in range(10):
+        policy.observe("fast", 0.001)
+        policy.observe("slow", 100.0)
+
+    assert policy.timeout_for("fast") == UNREAL_MIN_TIMEOUT
+    assert policy.timeout_for("slow") == UNREAL_MAX_TIMEOUT
+
+
+def test_expired_command_raises_its_timeout():
+    policy = _make_timeout_policy()
+    for _ in range(10):
+        policy.observe("compile_blueprint", 1.0)
+    before = policy.timeout_for("compile_blueprint")
+
+    policy.expired("compile_blueprint", before)
+
+    assert policy.timeout_for("compile_blueprint") == pytest.approx(before * 3)
+
+
+def test_batch_timeout_is_the_sum_clamped():
+    policy = _make_timeout_policy()
+
+    assert policy.timeout_for_batch(["ping", "ping"]) == policy.timeout_for("ping") * 2
+    assert policy.timeout_for_batch(["ping"] * 1000) == UNREAL_MAX_TIMEOUT